@@ -1,26 +1,33 @@
 import sys
 import os
 import json
+import copy
+import marshal
+import hashlib
 import shutil
-import subprocess
+import contextlib
 import traceback
+import logging
+import logging.handlers
+import queue
+import atexit
+import bisect
 import ctypes
 import time
-import urllib.request
 import urllib.parse
-import ssl
 import threading
-from functools import partial
+import weakref
+import socket
+import secrets
+import gc
+import heapq
+import types
+from collections import deque
+from functools import partial, wraps
 
-from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, 
-                               QVBoxLayout, QHBoxLayout, QLabel, QFrame, QScrollArea, QMessageBox, 
-                               QScroller, QScrollerProperties, QMenu, QDialog, 
-                               QLineEdit, QFileDialog, QDialogButtonBox, 
-                               QFormLayout, QPushButton, QSizePolicy, QLayout,
-                               QInputDialog, QFileIconProvider, QGraphicsDropShadowEffect,
-                               QStackedWidget, QTabBar) 
-from PySide6.QtCore import Qt, QSize, Signal, QMimeData, QPoint, QRect, QFileInfo, QKeyCombination
-from PySide6.QtGui import QPixmap, QPainter, QPainterPath, QColor, QFont, QDrag, QIcon, QLinearGradient, QBrush, QKeySequence, QFontMetrics
+# 스크립트로 실행하면 이 모듈은 __main__이므로, 지연 로딩되는 bifrost_* 모듈의
+# `from Bifrost import ...`가 같은 모듈(싱글턴/캐시)을 보도록 등록
+sys.modules.setdefault('Bifrost', sys.modules[__name__])
 
 # --- [설정] ---
 VERSION = "v0.4.5"
@@ -34,6 +41,10 @@ LAYOUT_MARGIN = 2
 LAYOUT_H_SPACING = 4
 LAYOUT_V_SPACING = 2
 
+# 아이콘 로딩 우선순위 (QThreadPool priority)
+ICON_PRIORITY_VISIBLE = 10
+ICON_PRIORITY_BACKGROUND = 0
+
 # 스타일 상수
 COLOR_BG = "#1A1A1A"
 COLOR_TAB_BG = "#252525"
@@ -44,10 +55,20 @@ COLOR_TEXT_PRIMARY = "#E0E0E0"
 COLOR_TEXT_SECONDARY = "#777777"
 
 # --- [경로 및 마이그레이션 로직] ---
-APPDATA_DIR = os.path.join(os.getenv('LOCALAPPDATA'), 'Bifrost')
+# Windows는 %LOCALAPPDATA%, 그 밖(Linux 등)에서는 XDG 데이터 디렉터리 ($XDG_DATA_HOME, 없으면 ~/.local/share)
+APPDATA_DIR = os.path.join(os.getenv('LOCALAPPDATA') or os.getenv('XDG_DATA_HOME')
+                           or os.path.join(os.path.expanduser('~'), '.local', 'share'), 'Bifrost')
 CONFIG_FILE = os.path.join(APPDATA_DIR, 'config.json')
 ICON_DIR = os.path.join(APPDATA_DIR, 'icons')
 ERROR_LOG_FILE = os.path.join(APPDATA_DIR, 'error_log.txt')
+JOURNAL_FILE = os.path.join(APPDATA_DIR, 'config.journal')
+JOURNAL_COMPACT_BYTES = 64 * 1024  # 저널이 이 크기를 넘으면 스냅샷으로 압축
+JOURNAL_COMPACT_RETRY_S = 5        # 압축 실패 후 남은 봉인 저널을 다시 압축하기까지의 첫 대기 (이후 두 배씩)
+JOURNAL_COMPACT_RETRY_MAX_S = 300
+CONFIG_CACHE_FILE = os.path.join(APPDATA_DIR, 'config.cache') # 기본값과 병합된 설정의 marshal 스냅샷
+CONFIG_CACHE_FORMAT = 2 # 2: apps를 AppRecord 튜플로 저장
+SHARED_DIR = os.path.join(APPDATA_DIR, 'shared') # 공유 카탈로그의 로컬 사본 (계층마다 <키>.json, 아이콘은 icons/<키>/)
+SHARED_CACHE_FORMAT = 1
 
 if getattr(sys, 'frozen', False):
     EXE_DIR = os.path.dirname(sys.executable)
@@ -59,11 +80,291 @@ DEFAULT_CONFIG = {
         "always_on_top": True,
         "group_order": ["홈"],
         "window_geometry": {},
-        "group_shortcuts": {}
+        "group_shortcuts": {},
+        "journal_mode": True,
+        "theme": "dark",
+        "log_level": "WARNING",
+        "tray_resident": False,
+        "folder_groups": {},    # 그룹 이름 -> 폴더 경로 (폴더 내용을 그대로 보여주는 그룹)
+        "catalog_providers": [], # 켜진 카탈로그 제공자 id (bifrost_catalog.CATALOG_PROVIDERS)
+        "autostart_concurrency": 2,  # 시작 시 실행 항목을 동시에 띄우는 최대 개수
+        "autostart_stagger_ms": 500, # 시작 시 실행 항목 사이 간격
+        "shared_catalogs": [],   # 공유 카탈로그 파일 경로 (앞쪽이 우선, 개인 설정 아래에 읽기 전용으로 합쳐짐)
+        "hidden_shared_apps": [] # 숨긴 공유 항목 [그룹, 이름]
     },
     "apps": []
 }
+# 기본값이 바뀌면(버전 업데이트 등) 바이너리 스냅샷을 무효화하기 위한 지문
+DEFAULT_CONFIG_FINGERPRINT = hashlib.blake2b(
+    json.dumps(DEFAULT_CONFIG, sort_keys=True).encode('utf-8'), digest_size=16).hexdigest()
+
+# --- [로깅] ---
+# 모든 스레드의 로그는 큐에 넣기만 하고(논블로킹), 백그라운드 리스너 스레드가 파일에 기록합니다.
+# 파일은 LOG_MAX_BYTES마다 회전하며 LOG_BACKUP_COUNT개까지만 보관합니다.
+LOG_MAX_BYTES = 1024 * 1024
+LOG_BACKUP_COUNT = 3
+LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR")
+
+class _JsonLineFormatter(logging.Formatter):
+    """한 줄에 하나의 JSON 레코드 (timestamp, level, thread, subsystem, msg, duration_ms)"""
+    def format(self, record):
+        entry = {
+            "ts": self.formatTime(record, "%Y-%m-%dT%H:%M:%S") + f".{int(record.msecs):03d}",
+            "level": record.levelname,
+            "thread": record.threadName,
+            "subsystem": record.name.partition('.')[2] or record.name,
+            "msg": record.getMessage(),
+        }
+        duration_ms = getattr(record, 'duration_ms', None)
+        if duration_ms is not None: entry["duration_ms"] = round(duration_ms, 2)
+        return json.dumps(entry, ensure_ascii=False)
+
+_log_listener = None
+
+def setup_logging():
+    global _log_listener
+    if _log_listener is not None: return
+    try: os.makedirs(APPDATA_DIR, exist_ok=True)
+    except: pass
+    file_handler = logging.handlers.RotatingFileHandler(
+        ERROR_LOG_FILE, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT, encoding='utf-8', delay=True)
+    file_handler.setFormatter(_JsonLineFormatter())
+    log_queue = queue.SimpleQueue()
+    root = logging.getLogger("bifrost")
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.propagate = False
+    set_log_level(os.getenv("BIFROST_LOG_LEVEL", "WARNING"))
+    _log_listener = logging.handlers.QueueListener(log_queue, file_handler)
+    _log_listener.start()
+    atexit.register(_log_listener.stop) # 종료 시 큐에 남은 로그 기록
+
+def set_log_level(level_name):
+    level_name = str(level_name).upper()
+    if level_name not in LOG_LEVELS: level_name = "WARNING"
+    logging.getLogger("bifrost").setLevel(level_name)
+
+def get_logger(subsystem):
+    return logging.getLogger(f"bifrost.{subsystem}")
+
+def log_error(msg, subsystem="app"):
+    get_logger(subsystem).error(msg)
+
+@contextlib.contextmanager
+def log_duration(subsystem, what, level=logging.DEBUG, metric=None):
+    """블록 실행 시간을 duration_ms 필드와 함께 기록합니다. metric을 주면 해당 히스토그램에도 기록합니다."""
+    logger = get_logger(subsystem)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        duration_ms = (time.perf_counter() - start) * 1000
+        if metric: Metrics.observe(metric, duration_ms)
+        if logger.isEnabledFor(level):
+            logger.log(level, what, extra={'duration_ms': duration_ms})
+
+setup_logging()
+
+# --- [성능 지표] ---
+# 카운터/게이지/지연 히스토그램을 한곳에 모아 진단 창과 JSON 내보내기에 사용합니다. (스레드 안전)
+HISTOGRAM_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+
+class _Histogram:
+    __slots__ = ('counts', 'count', 'total', 'min', 'max')
+
+    def __init__(self):
+        self.counts = [0] * (len(HISTOGRAM_BUCKETS_MS) + 1) # 마지막 칸은 5000ms 초과
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+    def observe(self, ms):
+        self.counts[bisect.bisect_left(HISTOGRAM_BUCKETS_MS, ms)] += 1
+        self.count += 1
+        self.total += ms
+        self.min = ms if self.min is None else min(self.min, ms)
+        self.max = ms if self.max is None else max(self.max, ms)
+
+    def percentile(self, q):
+        """버킷 상한값 기준의 근사 백분위수"""
+        if not self.count: return None
+        target = q * self.count
+        seen = 0
+        for i, c in enumerate(self.counts):
+            seen += c
+            if seen >= target:
+                return HISTOGRAM_BUCKETS_MS[i] if i < len(HISTOGRAM_BUCKETS_MS) else self.max
+        return self.max
+
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "avg_ms": round(self.total / self.count, 3) if self.count else None,
+            "min_ms": round(self.min, 3) if self.min is not None else None,
+            "max_ms": round(self.max, 3) if self.max is not None else None,
+            "p50_ms": self.percentile(0.5),
+            "p95_ms": self.percentile(0.95),
+            "buckets": {(f"<={b}" if i < len(HISTOGRAM_BUCKETS_MS) else f">{HISTOGRAM_BUCKETS_MS[-1]}"): c
+                        for i, (b, c) in enumerate(zip(HISTOGRAM_BUCKETS_MS + (HISTOGRAM_BUCKETS_MS[-1],), self.counts))},
+        }
+
+class Metrics:
+    _lock = threading.Lock()
+    _counters = {}
+    _gauges = {}
+    _histograms = {}
+
+    @staticmethod
+    def incr(name, value=1):
+        with Metrics._lock:
+            Metrics._counters[name] = Metrics._counters.get(name, 0) + value
+
+    @staticmethod
+    def set_gauge(name, value):
+        with Metrics._lock:
+            Metrics._gauges[name] = value
+
+    @staticmethod
+    def discard_labeled(name, keep):
+        """name[라벨] 형태의 게이지 중 라벨이 keep에 없는 것을 지움 (이름이 바뀌거나 지워진 대상)"""
+        keep = {f"{name}[{label}]" for label in keep}
+        with Metrics._lock:
+            for key in [k for k in Metrics._gauges if k.startswith(name + "[") and k not in keep]:
+                del Metrics._gauges[key]
+
+    @staticmethod
+    def observe(name, ms):
+        with Metrics._lock:
+            hist = Metrics._histograms.get(name)
+            if hist is None: hist = Metrics._histograms[name] = _Histogram()
+            hist.observe(ms)
+
+    @staticmethod
+    @contextlib.contextmanager
+    def timed(name):
+        """with 블록 또는 데코레이터로 사용 (실행 시간을 name 히스토그램에 기록)"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            Metrics.observe(name, (time.perf_counter() - start) * 1000)
+
+    @staticmethod
+    def snapshot():
+        with Metrics._lock:
+            return {
+                "counters": dict(Metrics._counters),
+                "gauges": dict(Metrics._gauges),
+                "histograms": {k: h.to_dict() for k, h in Metrics._histograms.items()},
+            }
+
+    @staticmethod
+    def reset():
+        with Metrics._lock:
+            Metrics._counters.clear()
+            Metrics._gauges.clear()
+            Metrics._histograms.clear()
+
+# --- [프로파일링] ---
+# BIFROST_PROFILE=1 (또는 --profile) 이면 시작 경로와 reload_ui를 cProfile로,
+# BIFROST_TRACEMALLOC=1 (또는 --profile-memory) 이면 tracemalloc 스냅샷도 함께 기록합니다.
+# 결과는 PROFILE_DIR에 타임스탬프 파일(.pstats / .tracemalloc / .txt 요약)로 저장됩니다.
+PROFILE_ENABLED = bool(os.getenv("BIFROST_PROFILE")) or "--profile" in sys.argv
+PROFILE_MEMORY = bool(os.getenv("BIFROST_TRACEMALLOC")) or "--profile-memory" in sys.argv
+PROFILE_DIR = os.path.join(APPDATA_DIR, 'profiles')
+PROFILE_TOP_N = 25
+
+_profile_depth = 0
+_session_profiles = []
+
+def profiled(name):
+    """프로파일링이 꺼져 있으면 원래 함수를 그대로 반환합니다 (오버헤드 0)."""
+    def decorator(func):
+        if not (PROFILE_ENABLED or PROFILE_MEMORY): return func
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            global _profile_depth
+            # 중첩 호출(예: __init__ → initialize → reload_ui)은 바깥 프로파일에 포함
+            if _profile_depth or threading.current_thread() is not threading.main_thread():
+                return func(*args, **kwargs)
+            _profile_depth += 1
+            try:
+                return _run_profiled(name, func, args, kwargs)
+            finally:
+                _profile_depth -= 1
+        return wrapper
+    return decorator
+
+def _run_profiled(name, func, args, kwargs):
+    import cProfile
+    import tracemalloc
+    profiler = cProfile.Profile() if PROFILE_ENABLED else None
+    mem_before = None
+    if PROFILE_MEMORY:
+        if not tracemalloc.is_tracing(): tracemalloc.start(10)
+        mem_before = tracemalloc.take_snapshot()
+    start = time.perf_counter()
+    if profiler: profiler.enable()
+    try:
+        return func(*args, **kwargs)
+    finally:
+        if profiler: profiler.disable()
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        mem_after = tracemalloc.take_snapshot() if PROFILE_MEMORY else None
+        try:
+            _save_profile(name, elapsed_ms, profiler, mem_before, mem_after)
+        except Exception as e:
+            log_error(f"Profile save failed ({name}): {e}", "profile")
+
+def _save_profile(name, elapsed_ms, profiler, mem_before, mem_after):
+    import io
+    import pstats
+    os.makedirs(PROFILE_DIR, exist_ok=True)
+    now = time.time()
+    base = os.path.join(PROFILE_DIR, f"{time.strftime('%Y%m%d_%H%M%S', time.localtime(now))}_{int(now * 1000) % 1000:03d}_{name}")
+    summary = io.StringIO()
+    summary.write(f"{name}: {elapsed_ms:.1f} ms\n\n")
+    if profiler:
+        profiler.dump_stats(base + ".pstats")
+        _session_profiles.append(base + ".pstats")
+        stats = pstats.Stats(profiler, stream=summary)
+        stats.sort_stats("cumulative").print_stats(PROFILE_TOP_N)
+    if mem_after is not None:
+        mem_after.dump(base + ".tracemalloc")
+        summary.write(f"\nTop {PROFILE_TOP_N} allocation growth:\n")
+        for stat in mem_after.compare_to(mem_before, "lineno")[:PROFILE_TOP_N]:
+            summary.write(f"  {stat}\n")
+    with open(base + ".txt", 'w', encoding='utf-8') as f:
+        f.write(summary.getvalue())
+    get_logger("profile").info(f"{name} profiled -> {base}.txt", extra={'duration_ms': elapsed_ms})
+
+def _write_session_summary():
+    """종료 시 이번 세션의 모든 .pstats를 합쳐 자체 시간(tottime) 기준 상위 핫스팟을 요약합니다."""
+    if not _session_profiles: return
+    try:
+        import pstats
+        path = os.path.join(PROFILE_DIR, f"{time.strftime('%Y%m%d_%H%M%S')}_session_hotspots.txt")
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(f"{len(_session_profiles)} profiles\n\n")
+            stats = pstats.Stats(*_session_profiles, stream=f)
+            stats.sort_stats("tottime").print_stats(PROFILE_TOP_N)
+    except Exception as e:
+        log_error(f"Profile session summary failed: {e}", "profile")
+
+if PROFILE_ENABLED:
+    atexit.register(_write_session_summary)
+
+def _write_file_atomic(path, data):
+    """임시 파일에 쓰고 디스크에 내린(fsync) 뒤 교체 (도중에 종료되어도 잘린 파일이 자리를 차지하지 않도록)"""
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
 
+@profiled("migrate_data")
 def migrate_data():
     """
     마이그레이션 로직:
@@ -92,7 +393,7 @@ def migrate_data():
             try:
                 shutil.copy2(local_config, CONFIG_FILE)
             except Exception as e:
-                log_error(f"Config migration failed: {e}")
+                log_error(f"Config migration failed: {e}", "migrate")
         
         # 2. 아이콘 마이그레이션
         if os.path.exists(local_icons):
@@ -103,7 +404,7 @@ def migrate_data():
                     if os.path.isfile(s):
                         shutil.copy2(s, d)
             except Exception as e:
-                log_error(f"Icon migration failed: {e}")
+                log_error(f"Icon migration failed: {e}", "migrate")
 
     # 기본 앱 아이콘 강제 업데이트
     # 배포판의 최신 아이콘을 로컬 데이터 폴더로 복사하여 구버전 아이콘 문제 해결
@@ -135,130 +436,119 @@ def migrate_data():
                 if os.path.exists(src):
                     shutil.copy2(src, dst)
     except Exception as e:
-        log_error(f"Force icon update failed: {e}")
+        log_error(f"Force icon update failed: {e}", "migrate")
 
 # 마이그레이션 실행
 migrate_data()
 
 # --- [자동 업데이트 로직] ---
-def check_version_parse(version_str):
-    try:
-        return [int(x) for x in version_str.replace("v", "").split(".")]
-    except:
-        return [0, 0, 0]
-
-class AutoUpdater:
-    def __init__(self, current_version):
-        self.current_version = current_version
-        self.api_url = "https://api.github.com/repos/HoneyMocchi/Bifrost/releases/latest"
-
-    def check_for_updates(self):
-        try:
-            req = urllib.request.Request(self.api_url, headers={'User-Agent': 'Bifrost-Launcher'})
-            
-            # 인증서 검증 무시 (일부 환경 호환성)
-            ctx = ssl.create_default_context()
-            ctx.check_hostname = False
-            ctx.verify_mode = ssl.CERT_NONE
-            
-            with urllib.request.urlopen(req, context=ctx, timeout=5) as res:
-                data = json.loads(res.read().decode())
-                latest_tag = data.get('tag_name', '').strip()
-                if not latest_tag: return None, None
-                
-                curr_parts = check_version_parse(self.current_version)
-                latest_parts = check_version_parse(latest_tag)
-                
-                # 단순 비교 (Major.Minor.Patch)
-                is_newer = False
-                for i in range(len(latest_parts)):
-                    if i >= len(curr_parts):
-                        is_newer = True; break
-                    if latest_parts[i] > curr_parts[i]:
-                        is_newer = True; break
-                    elif latest_parts[i] < curr_parts[i]:
-                        break
-                        
-                if is_newer:
-                    assets = data.get('assets', [])
-                    for asset in assets:
-                         if asset['name'].endswith('.exe'):
-                             return latest_tag, asset['browser_download_url']
-            return None, None
-        except Exception as e:
-            log_error(f"Update check failed: {e}")
-            return None, None
+# 구현은 bifrost_updater.py (urllib/ssl 사용, 업데이트 확인 시점에 불러옴)
+UPDATE_CHECK_DELAY_MS = 3 * 1000 # 시작 후 업데이트 확인까지 대기
 
-    def perform_update(self, download_url, parent_widget=None):
-        try:
-            # 1. 다운로드
-            new_exe_name = "Bifrost.new.exe"
-            new_exe_path = os.path.join(EXE_DIR, new_exe_name)
-            
-            ctx = ssl.create_default_context()
-            ctx.check_hostname = False
-            ctx.verify_mode = ssl.CERT_NONE
-            
-            with urllib.request.urlopen(download_url, context=ctx) as response, open(new_exe_path, 'wb') as out_file:
-                shutil.copyfileobj(response, out_file)
-            
-            # 2. 배치 파일 생성
-            bat_path = os.path.join(EXE_DIR, "update_bifrost.bat")
-            current_exe = sys.executable
-            
-            # 배치 스크립트: 
-            # 1초 대기 -> 기존 파일 삭제 -> 새 파일 이름 변경 -> 실행 -> 배치 삭제
-            bat_content = f"""
-@echo off
-timeout /t 2 /nobreak >nul
-del "{current_exe}"
-move "{new_exe_path}" "{current_exe}"
-explorer "{current_exe}"
-del "%~f0"
-"""
-            with open(bat_path, 'w') as f:
-                f.write(bat_content)
-                
-            # 3. 실행 및 종료
-            # PyInstaller 환경 변수(_MEIPASS2) 제거 후 Explorer를 통해 배치 실행 (확실한 분리)
-            env = os.environ.copy()
-            if '_MEIPASS2' in env:
-                del env['_MEIPASS2']
-                
-            subprocess.Popen(bat_path, shell=True, env=env)
-            QApplication.quit()
-        except Exception as e:
-            if parent_widget:
-                QMessageBox.critical(parent_widget, "업데이트 실패", f"업데이트 중 오류가 발생했습니다:\n{e}")
-            log_error(f"Update execution failed: {e}") 
+# --- [테마] ---
+# 색상은 여기서 한 번만 정의하고, 팔레트 + 전역 스타일시트 1개 + 공유 QColor로 적용합니다.
+THEMES = {
+    "dark": {
+        "bg": COLOR_BG,
+        "tab_bg": COLOR_TAB_BG,
+        "tab_hover": COLOR_TAB_HOVER,
+        "tab_selected": COLOR_TAB_SELECTED,
+        "accent": COLOR_ACCENT,
+        "accent_hover": "#007AFF",
+        "accent_pressed": "#005BB5",
+        "text_primary": COLOR_TEXT_PRIMARY,
+        "text_secondary": COLOR_TEXT_SECONDARY,
+        "text_strong": "#FFFFFF",
+        "text_muted": "#AAAAAA",
+        "text_on_accent": "#FFFFFF",
+        "tab_hover_text": "#BBBBBB",
+        "menu_text": "#EEEEEE",
+        "surface": "#3A3A3A",
+        "surface_hover": "#4A4A4A",
+        "surface_pressed": "#2A2A2A",
+        "input_bg": "#333333",
+        "input_border": "#444444",
+        "border": "#555555",
+        "dashed_border": "#666666",
+        "scroll_bg": "#202020",
+        "dialog_bg": "#252525",
+        "label": "#CCCCCC",
+        "label_hover": "#FFFFFF",
+        "overlay": "#1EFFFFFF",
+        "icon_bg_top": "#3D3D3D",
+        "icon_bg_bottom": "#333333",
+        "icon_letter": "#FFFFFF",
+        "add_border": "#555555",
+        "add_border_hover": "#777777",
+        "add_text": "#666666",
+        "add_text_hover": "#888888",
+        "danger": "#FF453A",
+        "running": "#30D158",
+    },
+    "light": {
+        "bg": "#F2F2F7",
+        "tab_bg": "#E5E5EA",
+        "tab_hover": "#D8D8DE",
+        "tab_selected": "#FFFFFF",
+        "accent": COLOR_ACCENT,
+        "accent_hover": "#007AFF",
+        "accent_pressed": "#005BB5",
+        "text_primary": "#1C1C1E",
+        "text_secondary": "#6E6E73",
+        "text_strong": "#000000",
+        "text_muted": "#8E8E93",
+        "text_on_accent": "#FFFFFF",
+        "tab_hover_text": "#3A3A3C",
+        "menu_text": "#1C1C1E",
+        "surface": "#FFFFFF",
+        "surface_hover": "#F0F0F5",
+        "surface_pressed": "#E0E0E6",
+        "input_bg": "#FFFFFF",
+        "input_border": "#D1D1D6",
+        "border": "#C7C7CC",
+        "dashed_border": "#AEAEB2",
+        "scroll_bg": "#E5E5EA",
+        "dialog_bg": "#F2F2F7",
+        "label": "#3A3A3C",
+        "label_hover": "#000000",
+        "overlay": "#14000000",
+        "icon_bg_top": "#D8D8DE",
+        "icon_bg_bottom": "#C7C7CC",
+        "icon_letter": "#3A3A3C",
+        "add_border": "#AEAEB2",
+        "add_border_hover": "#8E8E93",
+        "add_text": "#8E8E93",
+        "add_text_hover": "#6E6E73",
+        "danger": "#FF3B30",
+        "running": "#34C759",
+    },
+}
+THEME_NAMES = {"dark": "다크", "light": "라이트"}
 
 # --- [스타일 시트] ---
+# ThemeManager가 테마별로 한 번만 format 하여 앱 전역에 적용합니다. (위젯별 setStyleSheet 금지)
 PREMIUM_STYLE = """
-    QMainWindow { 
-        background-color: #1A1A1A; 
-    }
-    QWidget {
-        color: #E0E0E0;
-        font-family: 'Segoe UI', sans-serif;
-    }
+    QMainWindow {{ 
+        background-color: {bg}; 
+    }}
     
-    QStackedWidget {
+    QStackedWidget {{
         background: transparent;
         border: none;
         padding: 0px;
         margin: 0px;
-    }
+    }}
 
-    QTabBar {
+    QTabBar {{
         background: transparent; 
         border: none;
         padding: 0px;
         margin: 0px; 
         qproperty-drawBase: 0; 
-    }
-    QTabBar::tab {
-        background: #252525; 
-        color: #777777;
+    }}
+    QTabBar::tab {{
+        background: {tab_bg}; 
+        color: {text_secondary};
         padding: 6px 14px; 
         border-top-left-radius: 8px;
         border-top-right-radius: 8px;
@@ -268,20 +558,20 @@ PREMIUM_STYLE = """
         font-weight: 600;
         font-size: 13px;
         border: none; 
-    }
-    QTabBar::tab:selected {
-        background: #202020; 
-        color: #FFFFFF;
-        border-bottom: 2px solid #0A84FF; 
-    }
-    QTabBar::tab:hover {
-        background: #333333;
-        color: #BBBBBB;
-    }
+    }}
+    QTabBar::tab:selected {{
+        background: {tab_selected}; 
+        color: {text_strong};
+        border-bottom: 2px solid {accent}; 
+    }}
+    QTabBar::tab:hover {{
+        background: {tab_hover};
+        color: {tab_hover_text};
+    }}
     
-    QPushButton#AddGroupButton {
-        background-color: #252525;
-        color: #777777;
+    QPushButton#AddGroupButton {{
+        background-color: {tab_bg};
+        color: {text_secondary};
         border-top-left-radius: 8px;
         border-top-right-radius: 8px;
         border-bottom-left-radius: 0px;
@@ -291,131 +581,126 @@ PREMIUM_STYLE = """
         font-weight: normal;
         padding-bottom: 8px;
         margin-bottom: 1px;
-    }
-    QPushButton#AddGroupButton:hover {
-        background-color: #333333;
-        color: white;
-    }
-    QPushButton#AddGroupButton:pressed {
-        background-color: #1A1A1A;
-    }
-
-    QPushButton#PinButton { 
-        background: #252525; 
+    }}
+    QPushButton#AddGroupButton:hover {{
+        background-color: {tab_hover};
+        color: {text_strong};
+    }}
+    QPushButton#AddGroupButton:pressed {{
+        background-color: {bg};
+    }}
+
+    QPushButton#PinButton {{ 
+        background: {tab_bg}; 
         border: none; 
         border-radius: 8px; 
-        color: #777; 
+        color: {text_secondary}; 
         font-size: 14px; 
         padding: 0px; 
-    }
-    QPushButton#PinButton:checked { 
-        background: #0A84FF; 
-        color: #FFFFFF; 
-    }
-    QPushButton#PinButton:hover { 
-        background: #333; 
-        color: #EEE; 
-    }
-
-    QToolTip {
-        background-color: #333333;
-        color: #E0E0E0;
-        border: 1px solid #555;
+    }}
+    QPushButton#PinButton:checked {{ 
+        background: {accent}; 
+        color: {text_on_accent}; 
+    }}
+    QPushButton#PinButton:hover {{ 
+        background: {tab_hover}; 
+        color: {menu_text}; 
+    }}
+
+    QToolTip {{
+        background-color: {input_bg};
+        color: {text_primary};
+        border: 1px solid {border};
         border-radius: 4px;
         font-size: 12px;
-    }
+    }}
 
-    QLineEdit { 
-        background-color: #333333; 
-        color: white; 
-        border: 1px solid #444; 
+    QLineEdit {{ 
+        background-color: {input_bg}; 
+        color: {text_strong}; 
+        border: 1px solid {input_border}; 
         border-radius: 6px; 
         padding: 6px; 
-        selection-background-color: #0A84FF;
-    }
-    QLineEdit:focus {
-        border: 1px solid #0A84FF;
-        background-color: #3A3A3A;
-    }
-    QPushButton {
-        background-color: #3A3A3A;
-        color: white;
+        selection-background-color: {accent};
+    }}
+    QLineEdit:focus {{
+        border: 1px solid {accent};
+        background-color: {surface};
+    }}
+    QPushButton {{
+        background-color: {surface};
+        color: {text_strong};
         border-radius: 6px;
         padding: 6px 12px;
-        border: 1px solid #555;
-    }
-    QPushButton:hover { background-color: #4A4A4A; }
-    QPushButton:pressed { background-color: #2A2A2A; }
-    QPushButton#PrimaryButton {
-        background-color: #0A84FF;
+        border: 1px solid {border};
+    }}
+    QPushButton:hover {{ background-color: {surface_hover}; }}
+    QPushButton:pressed {{ background-color: {surface_pressed}; }}
+    QPushButton#PrimaryButton {{
+        background-color: {accent};
+        color: {text_on_accent};
         border: none;
-    }
-    QPushButton#PrimaryButton:hover { background-color: #007AFF; }
-    QPushButton#PrimaryButton:pressed { background-color: #005BB5; }
+    }}
+    QPushButton#PrimaryButton:hover {{ background-color: {accent_hover}; }}
+    QPushButton#PrimaryButton:pressed {{ background-color: {accent_pressed}; }}
     
     /* Shortcut Input Button Style */
-    QPushButton#ShortcutButton {
-        background-color: #333;
-        border: 1px dashed #666;
-        color: #AAA;
-    }
-    QPushButton#ShortcutButton:checked {
+    QPushButton#ShortcutButton {{
+        background-color: {input_bg};
+        border: 1px dashed {dashed_border};
+        color: {text_muted};
+    }}
+    QPushButton#ShortcutButton:checked {{
         background-color: transparent;
-        border: 1px solid #0A84FF;
-        color: #0A84FF;
-    }
+        border: 1px solid {accent};
+        color: {accent};
+    }}
     
-    QScrollArea { border: none; background: transparent; }
-    QScrollBar:vertical {
+    QScrollArea {{ border: none; background: transparent; }}
+    QScrollBar:vertical {{
         border: none;
-        background: #202020;
+        background: {scroll_bg};
         width: 8px;
         margin: 0px;
         border-radius: 4px;
-    }
-    QScrollBar::handle:vertical {
-        background: #444;
+    }}
+    QScrollBar::handle:vertical {{
+        background: {input_border};
         min-height: 30px;
         border-radius: 4px;
-    }
-    QScrollBar::handle:vertical:hover { background: #555; }
-    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical { height: 0px; background: none; }
-    QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical { background: none; }
-    QMenu {
-        background-color: #3A3A3A;
-        border: 1px solid #555;
+    }}
+    QScrollBar::handle:vertical:hover {{ background: {border}; }}
+    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{ height: 0px; background: none; }}
+    QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {{ background: none; }}
+    QMenu {{
+        background-color: {surface};
+        border: 1px solid {border};
         border-radius: 8px;
         padding: 4px;
-    }
-    QMenu::item {
+    }}
+    QMenu::item {{
         padding: 6px 24px;
         border-radius: 4px;
-        color: #EEE;
+        color: {menu_text};
         background-color: transparent; /* 투명 배경 명시 */
-    }
-    QMenu::item:selected {
-        background-color: #0A84FF;
-        color: white;
-    }
-    QMenu::separator {
+    }}
+    QMenu::item:selected {{
+        background-color: {accent};
+        color: {text_on_accent};
+    }}
+    QMenu::separator {{
         height: 1px;
-        background: #444;
+        background: {input_border};
         margin: 4px 0;
-    }
-    QDialog, QMessageBox, QInputDialog {
-        background-color: #252525;
-    }
-    QMessageBox QLabel, QInputDialog QLabel {
-        color: #E0E0E0;
-    }
+    }}
+    QDialog, QMessageBox, QInputDialog {{
+        background-color: {dialog_bg};
+    }}
+    QMessageBox QLabel, QInputDialog QLabel {{
+        color: {text_primary};
+    }}
 """
 
-def log_error(msg):
-    try:
-        with open(ERROR_LOG_FILE, 'a', encoding='utf-8') as f:
-            f.write(msg + "\n")
-    except: pass
-
 def apply_dark_title_bar(window_handle):
     try:
         DWMWA_USE_IMMERSIVE_DARK_MODE = 20
@@ -426,28 +711,200 @@ def apply_dark_title_bar(window_handle):
             set_window_attribute(hwnd, DWMWA_USE_IMMERSIVE_DARK_MODE, ctypes.byref(value), ctypes.sizeof(value))
     except: pass
 
+# --- [앱 레코드] ---
+class AppRecord:
+    """
+    앱 항목 하나. JSON의 dict 대신 __slots__ 객체로 보관해 항목당 메모리와 속성 접근 비용을 줄입니다.
+    group/type은 항목마다 반복되므로 intern하고, 알 수 없는 키는 extra에 그대로 보관해 to_dict()로 되돌립니다.
+    선택 필드(group/type/icon/shortcut)는 키가 없으면 None이며 to_dict()에서도 생략됩니다. (null은 생략과 같게 취급)
+    항목은 이름 비교가 아닌 객체 자체로 구분합니다. (복사한 앱이 원본과 내용이 같아도 다른 항목)
+    """
+    __slots__ = ('name', 'group', 'type', 'action', 'icon', 'shortcut', 'extra')
+    FIELDS = ('name', 'group', 'type', 'action', 'icon', 'shortcut') # to_dict 키 순서 (AppEditDialog.get_data와 동일)
+    REQUIRED = ('name', 'action')
+
+    def __init__(self, name, group=None, type=None, action="", icon=None, shortcut=None, extra=None):
+        self.name = name
+        self.group = sys.intern(group) if group else group
+        self.type = sys.intern(type) if type else type
+        self.action = action
+        self.icon = icon
+        self.shortcut = shortcut
+        self.extra = extra or None
+
+    @classmethod
+    def from_dict(cls, d):
+        """JSON dict -> AppRecord. 형식이 맞지 않으면 ValueError"""
+        if not isinstance(d, dict): raise ValueError(f"app entry must be an object, got {type(d).__name__}")
+        values = {}
+        for key in cls.FIELDS:
+            value = d.get(key)
+            if value is None:
+                if key in cls.REQUIRED: raise ValueError(f"app entry missing '{key}'")
+            elif not isinstance(value, str):
+                raise ValueError(f"app entry field '{key}' must be a string, got {type(value).__name__}")
+            values[key] = value
+        extra = {k: v for k, v in d.items() if k not in cls.FIELDS}
+        return cls(extra=extra, **values)
+
+    @classmethod
+    def coerce(cls, app):
+        return app if isinstance(app, cls) else cls.from_dict(app)
+
+    @classmethod
+    def load_list(cls, items):
+        """(레코드 목록, 거부된 원본 항목 목록). 잘못된 항목은 여기서 한 번만 걸러냅니다."""
+        records, rejected = [], []
+        for i, item in enumerate(items or []):
+            try:
+                records.append(cls.coerce(item))
+            except ValueError as e:
+                rejected.append(item)
+                log_error(f"Rejected app entry #{i}: {e}: {json.dumps(item, ensure_ascii=False)[:200]}", "config")
+        if rejected: Metrics.incr("config.rejected_apps", len(rejected))
+        return records, rejected
+
+    def to_dict(self):
+        d = {key: getattr(self, key) for key in self.FIELDS if getattr(self, key) is not None}
+        if self.extra: d.update(self.extra)
+        return d
+
+    def to_tuple(self):
+        """바이너리 스냅샷(marshal)용"""
+        return (self.name, self.group, self.type, self.action, self.icon, self.shortcut, self.extra)
+
+    @classmethod
+    def from_tuple(cls, t):
+        return cls(*t)
+
+    def option(self, key, default=None):
+        """extra에 보관되는 선택 옵션 (예: autostart)"""
+        return self.extra.get(key, default) if self.extra else default
+
+    def copy(self, **changes):
+        values = {key: getattr(self, key) for key in self.FIELDS}
+        values.update(changes)
+        return AppRecord(extra=dict(self.extra) if self.extra else None, **values)
+
+    def __repr__(self):
+        return f"AppRecord({self.name!r}, group={self.group!r}, action={self.action!r})"
+
+def _json_default(obj):
+    if isinstance(obj, AppRecord): return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
 class ConfigManager:
+    """
+    설정 저장소 (싱글턴).
+    journal_mode가 켜져 있으면 변경마다 config.json 전체를 다시 쓰지 않고
+    작은 변경 기록을 JOURNAL_FILE에 append + fsync 합니다.
+    저널이 JOURNAL_COMPACT_BYTES를 넘으면 백그라운드에서 스냅샷(config.json)으로 압축하고,
+    시작 시에는 마지막 스냅샷 위에 저널을 다시 적용(replay)합니다.
+    config.json이 기준이며, 기본값과 병합된 결과는 CONFIG_CACHE_FILE(marshal)에 보관해
+    다음 시작 때 JSON 파싱/병합 없이 읽습니다. (mtime, 크기, 해시가 모두 같을 때만 사용)
+    공유 카탈로그(shared_catalogs)는 개인 설정 아래의 읽기 전용 계층이며, 원본이 아닌 로컬 사본(SHARED_DIR)만 읽습니다.
+    get_apps()와 인덱스 기반 변경은 개인 계층만 다루고, 합쳐진 결과는 shared_apps()/all_apps()로 얻습니다.
+    read_only(명령줄)이면 저널을 메모리에만 적용하고 아무 파일도 쓰지 않습니다. (상주 중인 인스턴스가 파일을 쓰는 중일 수 있음)
+    """
     _instance = None
+    read_only = False # 첫 ConfigManager() 전에 설정
     
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super(ConfigManager, cls).__new__(cls)
-            cls._instance.data = DEFAULT_CONFIG.copy()
+            cls._instance.data = copy.deepcopy(DEFAULT_CONFIG)
+            cls._instance._lock = threading.RLock()
+            cls._instance._seq = 0           # 마지막으로 기록된 저널 번호
+            cls._instance._generation = 0    # 전체 저장 시마다 증가 (진행 중인 압축 무효화용)
+            cls._instance._journal_fp = None
+            cls._instance._batch = None
+            cls._instance._compacting = False
+            cls._instance._compact_backoff = 0     # 압축이 실패하면 늘어나는 재시도 대기 (초)
+            cls._instance._compact_retry_at = 0.0  # 이 시각(monotonic) 전에는 남은 봉인 저널을 다시 압축하지 않음
+            cls._instance.revision = 0         # 변경마다 증가 (백업이 바뀐 것이 없으면 건너뛰는 데 사용)
+            cls._instance._shared = {}         # 공유 카탈로그 경로 -> {'stamp': [mtime_ns, 크기, 해시], 'apps': [AppRecord]}
+            cls._instance._shared_version = 0  # 공유 계층이 바뀔 때마다 증가
+            cls._instance._overlay = None      # ((revision, _shared_version), 보이는 공유 항목)
             cls._instance.load_config()
         return cls._instance
 
     def load_config(self):
         if not os.path.exists(CONFIG_FILE):
-            self.save_config() 
+            self.save_config() # read_only면 기본값 그대로
         else:
             try:
-                with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
-                    loaded_data = json.load(f)
+                start = time.perf_counter()
+                st = os.stat(CONFIG_FILE)
+                with open(CONFIG_FILE, 'rb') as f: raw = f.read()
+                digest = hashlib.blake2b(raw, digest_size=16).hexdigest()
+                cached = self._read_binary_snapshot(st, digest)
+                if cached is not None:
+                    source = "binary"
+                    self._seq = cached.pop('_journal_seq', 0)
+                    # 스냅샷을 만들 때 이미 검증된 항목
+                    cached['apps'] = [AppRecord.from_tuple(t) for t in cached.get('apps', [])]
+                    self.data = cached
+                else:
+                    source = "json"
+                    loaded_data = json.loads(raw.decode('utf-8'))
+                    self._seq = loaded_data.pop('_journal_seq', 0)
                     # Smart Merge
                     self._merge_config(self.data, loaded_data)
+                    self._load_apps()
+                    if not self.read_only: self._write_binary_snapshot(dict(self.data, _journal_seq=self._seq), digest)
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                Metrics.set_gauge("config.cold_load_ms", round(elapsed_ms, 2))
+                Metrics.set_gauge("config.load_source", source)
+                get_logger("config").info("Config loaded from %s in %.2f ms", source, elapsed_ms)
             except Exception as e:
-                log_error(f"Config load error: {e}")
+                log_error(f"Config load error: {e}", "config")
                 self.save_config()
+        self._replay_journal()
+
+    @staticmethod
+    def _read_binary_snapshot(st, digest):
+        """config.json과 일치하는 바이너리 스냅샷이 있으면 병합된 설정(dict)을, 없으면 None을 반환합니다."""
+        try:
+            # 한 번에 읽고 메모리에서 디코딩 (marshal.load(파일)은 작은 read를 반복해 느림)
+            with open(CONFIG_CACHE_FILE, 'rb') as f: blob = memoryview(f.read())
+            # [헤더 길이 4바이트][헤더][본문] - 헤더가 맞지 않으면 본문은 디코딩하지 않음
+            header_len = int.from_bytes(blob[:4], 'little')
+            header = marshal.loads(blob[4:4 + header_len])
+            expected = (CONFIG_CACHE_FORMAT, DEFAULT_CONFIG_FINGERPRINT, st.st_mtime_ns, st.st_size, digest)
+            if header != expected: return None
+            data = marshal.loads(blob[4 + header_len:])
+            return data if isinstance(data, dict) and isinstance(data.get('apps', []), list) else None
+        except FileNotFoundError:
+            return None
+        except Exception as e: # 손상/다른 파이썬 버전 -> JSON으로 다시 만듦
+            get_logger("config").warning("Config cache ignored: %s", e)
+            return None
+
+    def _load_apps(self):
+        """apps를 AppRecord로 바꿉니다. 잘못된 항목은 UI에 넘기지 않고 rejected_apps에 원본 그대로 보관 (수동 복구용)"""
+        records, rejected = AppRecord.load_list(self.data.get('apps'))
+        self.data['apps'] = records
+        if rejected: self.data.setdefault('rejected_apps', []).extend(rejected)
+
+    @classmethod
+    def _write_binary_snapshot(cls, merged, digest):
+        """방금 기록/확인한 config.json에 대응하는 바이너리 스냅샷을 만듭니다. (실패해도 JSON이 기준이므로 무시)"""
+        try:
+            apps = []
+            for app in merged.get('apps', []):
+                try: apps.append(AppRecord.coerce(app).to_tuple())
+                except ValueError: return # 검증되지 않은 항목이 있으면 다음 JSON 로드 때 다시 만듦
+            body = marshal.dumps(dict(merged, apps=apps))
+            st = os.stat(CONFIG_FILE)
+            header = marshal.dumps((CONFIG_CACHE_FORMAT, DEFAULT_CONFIG_FINGERPRINT, st.st_mtime_ns, st.st_size, digest))
+            tmp_path = CONFIG_CACHE_FILE + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(len(header).to_bytes(4, 'little'))
+                f.write(header)
+                f.write(body)
+            os.replace(tmp_path, CONFIG_CACHE_FILE)
+        except (OSError, ValueError) as e:
+            get_logger("config").warning("Config cache write failed: %s", e)
     
     def _merge_config(self, default, loaded):
         for key, value in loaded.items():
@@ -457,51 +914,1194 @@ class ConfigManager:
                 default[key] = value
 
     def save_config(self):
+        """전체 스냅샷을 원자적으로 다시 쓰고 저널을 비웁니다."""
+        if self.read_only: return
+        with self._lock:
+            try:
+                self._generation += 1
+                snapshot = dict(self.data)
+                snapshot['_journal_seq'] = self._seq
+                tmp_path = CONFIG_FILE + '.tmp'
+                digest = self._write_snapshot(tmp_path, snapshot)
+                os.replace(tmp_path, CONFIG_FILE)
+                self._write_binary_snapshot(snapshot, digest)
+                self._clear_journal()
+            except Exception as e:
+                log_error(f"Config save error: {e}", "config")
+
+    @staticmethod
+    def _write_snapshot(path, snapshot):
+        """스냅샷을 기록하고 내용 해시를 반환합니다. (바이너리 스냅샷 검증용)"""
+        raw = json.dumps(snapshot, ensure_ascii=False, indent=4, default=_json_default).encode('utf-8')
+        with open(path, 'wb') as f:
+            f.write(raw)
+            f.flush()
+            os.fsync(f.fileno())
+        Metrics.incr("config.snapshot_writes")
+        Metrics.incr("config.bytes_written", len(raw))
+        return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+    # --- 저널 (append-only 변경 기록) ---
+    @staticmethod
+    def _apply(data, rec):
+        """변경 기록 하나를 data에 적용합니다. 실시간 변경과 replay가 같은 경로를 사용합니다."""
+        op = rec['op']
+        if op == 'set':
+            data.setdefault('settings', {})[rec['key']] = rec['value']
+            return
+        apps = data.setdefault('apps', [])
+        if op == 'apps.insert': apps.insert(rec['index'], rec['value'])
+        elif op == 'apps.update': apps[rec['index']] = rec['value']
+        elif op == 'apps.remove': del apps[rec['index']]
+        elif op == 'apps.swap':
+            i, j = rec['index'], rec['other']
+            apps[i], apps[j] = apps[j], apps[i]
+        elif op == 'apps.replace': data['apps'] = rec['value']
+        else: raise ValueError(f"unknown journal op: {op}")
+
+    @staticmethod
+    def _read_journal(path):
+        """(기록 목록, 정상 구간 바이트 수, 마지막 줄 손상 여부)를 반환합니다."""
+        records, good_size, torn = [], 0, False
+        if not os.path.exists(path): return records, good_size, torn
+        with open(path, 'rb') as f:
+            for line in f:
+                if not line.endswith(b'\n'):
+                    torn = True; break
+                try: records.append(json.loads(line))
+                except ValueError:
+                    torn = True; break
+                good_size += len(line)
+        return records, good_size, torn
+
+    def _replay_journal(self):
+        sealed = JOURNAL_FILE + '.1'
+        replayed = 0
+        # 압축 도중 종료되었다면 봉인된 저널(.1)이 남아 있으므로 먼저 적용
+        for path in (sealed, JOURNAL_FILE):
+            try:
+                records, good_size, torn = self._read_journal(path)
+            except Exception as e:
+                log_error(f"Config journal read error: {e}", "config")
+                continue
+            for rec in records:
+                if rec.get('seq', 0) <= self._seq: continue
+                try: self._apply(self.data, self._coerce_record(rec))
+                except Exception as e:
+                    log_error(f"Config journal replay error (seq {rec.get('seq')}): {e}", "config")
+                self._seq = rec['seq']
+                replayed += 1
+            if torn and not self.read_only: # read_only면 끊긴 줄은 읽지 않기만 함 (쓰는 중인 줄일 수 있음)
+                # 쓰는 도중 끊긴 마지막 줄은 잘라내야 이후 기록이 이어서 읽힘
+                try:
+                    with open(path, 'r+b') as f: f.truncate(good_size)
+                except Exception as e:
+                    log_error(f"Config journal truncate error: {e}", "config")
+
+        if self.read_only: return
+        if not self.get_setting('journal_mode', True):
+            if replayed or os.path.exists(sealed) or os.path.exists(JOURNAL_FILE):
+                self.save_config()
+        elif os.path.exists(sealed):
+            if 'Scheduler' in globals():
+                with self._lock: self._start_compaction(rotate=False)
+            else:
+                self.save_config() # 명령줄 --restore는 Scheduler(Qt) 없이 실행되므로 바로 전체 저장
+
+    @staticmethod
+    def _coerce_record(rec):
+        """저널 기록의 앱 값(dict)을 AppRecord로 바꿉니다. 잘못된 값이면 ValueError"""
+        op = rec['op']
+        if op in ('apps.insert', 'apps.update'):
+            rec = dict(rec, value=AppRecord.coerce(rec['value']))
+        elif op == 'apps.replace':
+            rec = dict(rec, value=[AppRecord.coerce(app) for app in rec['value']])
+        return rec
+
+    def _commit(self, rec):
+        rec = self._coerce_record(rec)
+        with self._lock:
+            self._apply(self.data, rec)
+            self.revision += 1
+            if self._batch is not None:
+                self._batch.append(rec)
+            else:
+                self._persist([rec])
+
+    @contextlib.contextmanager
+    def batch(self):
+        """여러 변경을 한 번의 저널 쓰기(fsync 1회)로 묶습니다."""
+        with self._lock:
+            outer = self._batch is None
+            if outer: self._batch = []
+            try:
+                yield
+            finally:
+                if outer:
+                    records, self._batch = self._batch, None
+                    if records: self._persist(records)
+
+    def _persist(self, records):
+        if self.read_only: return
+        if not self.get_setting('journal_mode', True):
+            self.save_config()
+            return
+        try:
+            lines = []
+            for rec in records:
+                self._seq += 1
+                lines.append(json.dumps({'seq': self._seq, **rec}, ensure_ascii=False, separators=(',', ':'),
+                                        default=_json_default))
+            if self._journal_fp is None:
+                self._journal_fp = open(JOURNAL_FILE, 'ab')
+            payload = ('\n'.join(lines) + '\n').encode('utf-8')
+            self._journal_fp.write(payload)
+            Metrics.incr("config.journal_writes")
+            Metrics.incr("config.bytes_written", len(payload))
+            self._journal_fp.flush()
+            os.fsync(self._journal_fp.fileno())
+            if self._journal_fp.tell() >= JOURNAL_COMPACT_BYTES or self._compact_backoff:
+                self._start_compaction() # 실패한 압축이 있으면 크기와 상관없이 대기 후 재시도
+        except Exception as e:
+            log_error(f"Config journal write error: {e}", "config")
+            self.save_config()
+
+    def _clear_journal(self):
+        if self._journal_fp is not None:
+            try: self._journal_fp.close()
+            except: pass
+            self._journal_fp = None
+        for path in (JOURNAL_FILE, JOURNAL_FILE + '.1'):
+            if os.path.exists(path): os.remove(path)
+
+    def _start_compaction(self, rotate=True):
+        # self._lock 보유 상태에서 호출
+        if self._compacting: return
+        sealed = JOURNAL_FILE + '.1'
+        if rotate and os.path.exists(sealed):
+            # 앞선 압축이 실패해 봉인 저널이 남음 -> 새로 봉인하지 않고 그것부터 다시 압축 (실패할수록 길게 대기)
+            if time.monotonic() < self._compact_retry_at: return
+            rotate = False
+        if rotate:
+            if self._journal_fp is not None:
+                self._journal_fp.close()
+                self._journal_fp = None
+            os.replace(JOURNAL_FILE, sealed)
+        self._compacting = True
+        Scheduler.submit_worker(self._compact, self._generation, priority=PRIORITY_IDLE, name="config_compact")
+
+    def _compact(self, generation):
+        """봉인된 저널을 디스크의 마지막 스냅샷에 적용해 새 스냅샷을 만듭니다 (백그라운드 스레드)."""
+        sealed = JOURNAL_FILE + '.1'
+        tmp_path = CONFIG_FILE + '.compact.tmp'
+        failed = False
         try:
-            with open(CONFIG_FILE, 'w', encoding='utf-8') as f:
-                json.dump(self.data, f, ensure_ascii=False, indent=4)
+            with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
+                snapshot = json.load(f)
+            seq = snapshot.pop('_journal_seq', 0)
+            # 저널의 앱 인덱스는 잘못된 항목을 뺀 메모리 목록(_load_apps) 기준이므로 디스크 스냅샷도 똑같이 걸러서 적용
+            apps, rejected = AppRecord.load_list(snapshot.get('apps'))
+            snapshot['apps'] = apps
+            if rejected: snapshot.setdefault('rejected_apps', []).extend(rejected)
+            records, _, _ = self._read_journal(sealed)
+            for rec in records:
+                if rec.get('seq', 0) <= seq: continue
+                self._apply(snapshot, rec)
+                seq = rec['seq']
+            snapshot['_journal_seq'] = seq
+            digest = self._write_snapshot(tmp_path, snapshot)
+            merged = copy.deepcopy(DEFAULT_CONFIG)
+            self._merge_config(merged, snapshot)
+            with self._lock:
+                if generation != self._generation:
+                    # 그 사이 전체 저장이 일어났으므로 이 결과는 이미 낡음
+                    os.remove(tmp_path)
+                    return
+                os.replace(tmp_path, CONFIG_FILE)
+                self._write_binary_snapshot(merged, digest)
+                os.remove(sealed)
         except Exception as e:
-            log_error(f"Config save error: {e}")
+            failed = True
+            log_error(f"Config compaction error: {e}", "config")
+        finally:
+            with self._lock:
+                self._compacting = False
+                if failed:
+                    self._compact_backoff = min(self._compact_backoff * 2 or JOURNAL_COMPACT_RETRY_S, JOURNAL_COMPACT_RETRY_MAX_S)
+                    self._compact_retry_at = time.monotonic() + self._compact_backoff
+                    Metrics.incr("config.compact_failures")
+                else:
+                    self._compact_backoff = 0
 
+    # --- 공개 API ---
     def get_apps(self):
         return self.data.get('apps', [])
     
     def set_apps(self, apps):
-        self.data['apps'] = apps
-        self.save_config()
+        self._commit({'op': 'apps.replace', 'value': apps})
+
+    def add_app(self, app):
+        self.insert_app(len(self.get_apps()), app)
+
+    def insert_app(self, index, app):
+        self._commit({'op': 'apps.insert', 'index': index, 'value': app})
+
+    def update_app(self, index, app):
+        self._commit({'op': 'apps.update', 'index': index, 'value': app})
+
+    def remove_app(self, index):
+        self._commit({'op': 'apps.remove', 'index': index})
+
+    def swap_apps(self, index, other):
+        self._commit({'op': 'apps.swap', 'index': index, 'other': other})
 
     def get_setting(self, key, default=None):
         return self.data.get('settings', {}).get(key, default)
 
     def set_setting(self, key, value):
-        if 'settings' not in self.data:
-            self.data['settings'] = {}
-        self.data['settings'][key] = value
-        self.save_config()
+        self._commit({'op': 'set', 'key': key, 'value': value})
+
+    def dumps(self, exclude_settings=()):
+        """현재 설정을 config.json 형식의 JSON 바이트로. 잠금 안에서 직렬화하므로 어느 스레드에서나 호출 가능"""
+        with self._lock:
+            snapshot = dict(self.data)
+            snapshot['settings'] = {k: v for k, v in self.data.get('settings', {}).items() if k not in exclude_settings}
+            return json.dumps(snapshot, ensure_ascii=False, indent=4, default=_json_default).encode('utf-8')
+
+    def restore(self, data):
+        """설정 전체를 data(config.json 형식)로 바꾸고 스냅샷으로 저장합니다. (백업 복원)"""
+        with self._lock:
+            merged = copy.deepcopy(DEFAULT_CONFIG)
+            self._merge_config(merged, data)
+            self.data = merged
+            self._load_apps()
+            self.revision += 1
+            self.save_config()
+
+    # --- 공유 카탈로그 계층 ---
+    @staticmethod
+    def shared_layer_key(source):
+        """공유 카탈로그 경로 -> 로컬 사본 이름"""
+        return hashlib.blake2b(os.path.normcase(source).encode('utf-8'), digest_size=8).hexdigest()
+
+    @staticmethod
+    def shared_cache_path(source):
+        return os.path.join(SHARED_DIR, ConfigManager.shared_layer_key(source) + '.json')
+
+    def _shared_layer(self, source):
+        """로컬 사본에서 계층을 읽습니다 (처음 한 번). 원본(공유 폴더)에는 접근하지 않음. self._lock 보유 상태에서 호출"""
+        layer = self._shared.get(source)
+        if layer is not None: return layer
+        layer = {'stamp': None, 'apps': []}
+        try:
+            with open(self.shared_cache_path(source), 'r', encoding='utf-8') as f: cached = json.load(f)
+            if cached.get('format') == SHARED_CACHE_FORMAT and cached.get('source') == source:
+                layer = {'stamp': cached['stamp'], 'apps': self._as_shared(AppRecord.load_list(cached['apps'])[0])}
+        except FileNotFoundError:
+            pass # 아직 한 번도 동기화하지 않음
+        except Exception as e:
+            get_logger("config").warning("Shared catalog cache ignored (%s): %s", source, e)
+        self._shared[source] = layer
+        return layer
+
+    @staticmethod
+    def _as_shared(records):
+        # 단축키는 개인 설정이므로 공유 항목에서는 쓰지 않음
+        return [app.copy(type="shared", shortcut=None) for app in records]
+
+    def shared_stamp(self, source):
+        """마지막으로 동기화한 원본의 [mtime_ns, 크기, 해시]. 없으면 None"""
+        with self._lock:
+            return self._shared_layer(source)['stamp']
+
+    def set_shared_layer(self, source, stamp, apps=None):
+        """
+        동기화한 계층을 로컬 사본에 기록합니다. (동기화 스레드)
+        apps가 None이면 내용은 그대로 두고 stamp만 갱신합니다. (원본의 수정 시각만 바뀐 경우)
+        """
+        with self._lock:
+            layer = self._shared_layer(source)
+            records = layer['apps'] if apps is None else self._as_shared(apps)
+            payload = {'format': SHARED_CACHE_FORMAT, 'source': source, 'stamp': stamp,
+                       'apps': [app.copy(type=None) for app in records]}
+        os.makedirs(SHARED_DIR, exist_ok=True)
+        _write_file_atomic(self.shared_cache_path(source),
+                           json.dumps(payload, ensure_ascii=False, default=_json_default).encode('utf-8'))
+        with self._lock:
+            self._shared[source] = {'stamp': stamp, 'apps': records}
+            if apps is not None: self._shared_version += 1
+
+    def forget_shared_layer(self, source):
+        with self._lock:
+            self._shared.pop(source, None)
+            self._shared_version += 1
+        try: os.remove(self.shared_cache_path(source))
+        except OSError: pass
+
+    @staticmethod
+    def _overlay_key(group, name):
+        return (group or '홈', name.casefold())
+
+    def shared_apps(self):
+        """
+        보이는 공유 항목 (읽기 전용, type="shared"). 개인 설정에 같은 그룹/이름의 앱이 있거나,
+        앞쪽 공유 카탈로그에 이미 있거나, 숨긴 항목은 빠집니다.
+        """
+        with self._lock:
+            version = (self.revision, self._shared_version)
+            if self._overlay is not None and self._overlay[0] == version: return self._overlay[1]
+            taken = {self._overlay_key(app.group, app.name) for app in self.get_apps()}
+            taken.update(self._overlay_key(*pair) for pair in self.get_setting('hidden_shared_apps', []))
+            visible = []
+            for source in self.get_setting('shared_catalogs', []):
+                for app in self._shared_layer(source)['apps']:
+                    key = self._overlay_key(app.group, app.name)
+                    if key in taken: continue
+                    taken.add(key)
+                    visible.append(app)
+            self._overlay = (version, visible)
+            return visible
+
+    def all_apps(self):
+        """개인 항목 + 보이는 공유 항목"""
+        return self.get_apps() + self.shared_apps()
+
+    def hide_shared_app(self, app):
+        hidden = self.get_setting('hidden_shared_apps', [])
+        self.set_setting('hidden_shared_apps', hidden + [[app.group or '홈', app.name]])
+
+# --- [실행] ---
+# --- [실행 중인 앱] ---
+PROCESS_POLL_MS = 2000 # 실행 중 표시 갱신 주기
+
+class ProcessTracker:
+    """
+    Bifrost가 띄운 프로세스의 핸들을 action별로 보관하고 살아 있는지 확인합니다.
+    기본은 Popen.poll (waitpid WNOHANG, 파일 접근 없음)이고, Linux에서는 런처 스크립트처럼
+    자식이 먼저 끝나는 경우를 위해 새 세션(start_new_session)에 남은 프로세스를 /proc 한 번 훑어 찾습니다.
+    launch_action은 작업 스레드에서도 호출되므로 잠금으로 보호합니다.
+    """
+    _lock = threading.Lock()
+    _procs = {}   # action -> [Popen]
+    _running = {} # action -> pid (마지막 poll 결과)
+
+    @staticmethod
+    def register(action, proc):
+        with ProcessTracker._lock:
+            ProcessTracker._procs.setdefault(action, []).append(proc)
+            ProcessTracker._running[action] = proc.pid
+        Metrics.incr("process.tracked")
+
+    @staticmethod
+    def is_running(action):
+        return action in ProcessTracker._running
+
+    @staticmethod
+    def is_tracked(action):
+        """action으로 띄운 프로세스 핸들을 보관 중인지 (끝났는지는 running_pid/poll로 확인)"""
+        with ProcessTracker._lock:
+            return bool(ProcessTracker._procs.get(action))
+
+    @staticmethod
+    def running_pid(action):
+        """action으로 띄운 프로세스 중 살아 있는 것의 PID (없으면 None). 해당 action만 바로 확인"""
+        with ProcessTracker._lock:
+            procs = list(ProcessTracker._procs.get(action, ()))
+        for proc in procs:
+            if proc.poll() is None: return proc.pid
+        if procs and sys.platform.startswith('linux'):
+            sessions = ProcessTracker._live_sessions({proc.pid for proc in procs})
+            if sessions: return next(iter(sessions.values()))
+        return None
+
+    @staticmethod
+    def _live_sessions(session_ids):
+        """/proc를 한 번 훑어 주어진 세션에 남은 (좀비가 아닌) 프로세스를 찾습니다. {sid: pid}"""
+        found = {}
+        try: pids = [name for name in os.listdir('/proc') if name.isdigit()]
+        except OSError: return found
+        for pid in pids:
+            try:
+                with open(f'/proc/{pid}/stat', 'rb') as f: stat = f.read()
+            except OSError:
+                continue
+            # comm 필드에 공백/괄호가 있을 수 있으므로 마지막 ')' 이후를 나눔: state ppid pgrp session ...
+            fields = stat[stat.rfind(b')') + 2:].split()
+            if len(fields) < 4 or fields[0] == b'Z': continue
+            sid = int(fields[3])
+            if sid in session_ids and sid not in found: found[sid] = int(pid)
+        return found
+
+    @staticmethod
+    def poll():
+        """모든 추적 중인 프로세스를 확인해 {action: pid}를 반환하고, 끝난 핸들은 버립니다."""
+        with ProcessTracker._lock:
+            tracked = {action: list(procs) for action, procs in ProcessTracker._procs.items()}
+        if not tracked: return {}
+        with Metrics.timed("process.poll_ms"):
+            running, exited = {}, {}
+            for action, procs in tracked.items():
+                alive = [proc for proc in procs if proc.poll() is None]
+                if alive: running[action] = alive[0].pid
+                else: exited[action] = procs
+            if exited and sys.platform.startswith('linux'):
+                # 세션 리더가 끝났어도 그 세션의 자식이 남아 있으면 실행 중 (모든 action에 대해 /proc 1회)
+                sessions = ProcessTracker._live_sessions({proc.pid for procs in exited.values() for proc in procs})
+                for action, procs in list(exited.items()):
+                    pid = next((sessions[proc.pid] for proc in procs if proc.pid in sessions), None)
+                    if pid is not None:
+                        running[action] = pid
+                        del exited[action]
+        with ProcessTracker._lock:
+            for action, procs in exited.items():
+                remaining = [proc for proc in ProcessTracker._procs.get(action, []) if proc not in procs]
+                if remaining: ProcessTracker._procs[action] = remaining
+                else: ProcessTracker._procs.pop(action, None)
+            ProcessTracker._running = running
+        Metrics.set_gauge("process.running", len(running))
+        return running
+
+def focus_process_window(pid):
+    """pid의 보이는 최상위 창을 앞으로 가져옵니다 (Windows). 찾지 못하면 False"""
+    try:
+        user32 = ctypes.windll.user32
+    except AttributeError:
+        return False
+    found = []
+    WNDENUMPROC = ctypes.WINFUNCTYPE(ctypes.c_bool, ctypes.c_void_p, ctypes.c_void_p)
+    def on_window(hwnd, _):
+        owner = ctypes.c_ulong()
+        user32.GetWindowThreadProcessId(hwnd, ctypes.byref(owner))
+        if owner.value == pid and user32.IsWindowVisible(hwnd):
+            found.append(hwnd)
+            return False
+        return True
+    user32.EnumWindows(WNDENUMPROC(on_window), 0)
+    if not found: return False
+    if user32.IsIconic(found[0]): user32.ShowWindow(found[0], 9) # SW_RESTORE
+    return bool(user32.SetForegroundWindow(found[0]))
+
+def _spawn_tracked(action_cmd):
+    """실행 파일은 셸을 거치지 않고 직접 띄워 핸들을 남깁니다. 실행 파일이 아니면 None"""
+    if os.name == 'nt':
+        if not action_cmd.lower().endswith('.exe') or not os.path.isfile(action_cmd): return None
+    elif not (os.path.isfile(action_cmd) and os.access(action_cmd, os.X_OK)):
+        return None
+    import subprocess
+    kwargs = {'creationflags': subprocess.CREATE_NEW_PROCESS_GROUP} if os.name == 'nt' else {'start_new_session': True}
+    return subprocess.Popen([action_cmd], cwd=os.path.dirname(action_cmd) or None, close_fds=True, **kwargs)
+
+LAUNCH_CONFIRM_S = 0.5 # 명령줄 --launch: 셸로 띄운 명령이 이 시간 안에 0이 아닌 코드로 끝나면 실패로 봄
+_SHELL_SYNTAX = frozenset('|&;<>()$`*?~=\'"\\\n')
+
+def _missing_shell_target(action_cmd):
+    """셸 문법이 없는 단순 명령인데 첫 단어가 경로('/' 포함)이고 존재하지 않으면 True (셸을 띄우기 전 확인)"""
+    if _SHELL_SYNTAX.intersection(action_cmd): return False
+    words = action_cmd.split()
+    return bool(words) and '/' in words[0] and not os.path.exists(words[0])
+
+class _ShellProcess:
+    """ShellExecuteExW로 띄운 프로세스 핸들. ProcessTracker가 쓰는 Popen의 pid/poll()만 흉내 냄 (Windows)"""
+    def __init__(self, handle):
+        self._handle = ctypes.c_void_p(handle) # 64비트 핸들이 int로 잘리지 않도록 포인터 크기로 넘김
+        self.returncode = None
+        self.pid = ctypes.windll.kernel32.GetProcessId(self._handle)
+
+    def poll(self):
+        if self.returncode is None and self._handle is not None:
+            kernel32 = ctypes.windll.kernel32
+            if kernel32.WaitForSingleObject(self._handle, 0) == 0x102: return None # WAIT_TIMEOUT: 실행 중
+            code = ctypes.c_ulong()
+            kernel32.GetExitCodeProcess(self._handle, ctypes.byref(code))
+            kernel32.CloseHandle(self._handle)
+            self._handle = None
+            self.returncode = code.value
+        return self.returncode
+
+def _shell_execute(action_cmd):
+    """
+    .lnk/.url/문서/폴더 등을 연결된 프로그램으로 엽니다 (os.startfile과 같은 ShellExecute, Windows 전용).
+    새 프로세스가 생기면 추적용 _ShellProcess를, 이미 떠 있는 프로그램이 받아 핸들이 없으면 None을 반환하고,
+    실패하면 OSError. Windows가 아니면 AttributeError
+    """
+    from ctypes import wintypes
+    class SHELLEXECUTEINFOW(ctypes.Structure):
+        _fields_ = [('cbSize', wintypes.DWORD), ('fMask', ctypes.c_ulong), ('hwnd', wintypes.HWND),
+                    ('lpVerb', wintypes.LPCWSTR), ('lpFile', wintypes.LPCWSTR), ('lpParameters', wintypes.LPCWSTR),
+                    ('lpDirectory', wintypes.LPCWSTR), ('nShow', ctypes.c_int), ('hInstApp', wintypes.HINSTANCE),
+                    ('lpIDList', ctypes.c_void_p), ('lpClass', wintypes.LPCWSTR), ('hkeyClass', wintypes.HKEY),
+                    ('dwHotKey', wintypes.DWORD), ('hIconOrMonitor', wintypes.HANDLE), ('hProcess', wintypes.HANDLE)]
+    shell32 = ctypes.windll.shell32
+    info = SHELLEXECUTEINFOW()
+    info.cbSize = ctypes.sizeof(info)
+    info.fMask = 0x40 | 0x400 # SEE_MASK_NOCLOSEPROCESS | SEE_MASK_FLAG_NO_UI (실패 시 대화상자 대신 다음 방법으로)
+    info.lpFile = action_cmd
+    info.lpDirectory = os.path.dirname(action_cmd) if os.path.isabs(action_cmd) else None
+    info.nShow = 1 # SW_SHOWNORMAL
+    if not shell32.ShellExecuteExW(ctypes.byref(info)): raise ctypes.WinError()
+    return _ShellProcess(info.hProcess) if info.hProcess else None
+
+def launch_action(action_cmd, confirm_s=0):
+    """
+    파일/폴더/URL/명령을 실행하고 성공 여부를 반환합니다. 실패해도 UI를 막지 않고 로그만 남깁니다.
+    셸로 띄운 명령은 기본적으로 시작만 확인하며, confirm_s를 주면 그 시간 안에 실패 코드로 끝나는지도 기다려 봅니다.
+    (UI에서는 기다리지 않도록 0, 명령줄은 종료 코드를 위해 LAUNCH_CONFIRM_S)
+    """
+    if not action_cmd: return False
+    Metrics.incr("launch.count")
+    with log_duration("launch", f"spawn {action_cmd}", metric="launch.spawn_ms"):
+        try:
+            proc = _spawn_tracked(action_cmd)
+            if proc is not None:
+                ProcessTracker.register(action_cmd, proc)
+                return True
+        except OSError as e:
+            # 관리자 권한이 필요한 실행 파일 등은 셸 실행(ShellExecute)으로 재시도
+            get_logger("launch").info("Direct spawn failed (%s): %s", action_cmd, e)
+        try:
+            # 바로가기/문서/폴더도 새 프로세스가 생기면 핸들을 남겨 실행 중 표시와 single_instance에 씀
+            proc = _shell_execute(action_cmd)
+            if proc is not None: ProcessTracker.register(action_cmd, proc)
+            return True
+        except Exception as e:
+            startfile_error = e
+        try:
+            import subprocess
+            if os.name == 'nt':
+                proc = subprocess.Popen(action_cmd, shell=True)
+            else:
+                if _missing_shell_target(action_cmd): raise FileNotFoundError(f"not found: {action_cmd.split()[0]}")
+                proc = subprocess.Popen(action_cmd, shell=True, start_new_session=True)
+            if confirm_s:
+                try: code = proc.wait(confirm_s)
+                except subprocess.TimeoutExpired: code = 0 # 아직 실행 중
+                if code != 0: raise OSError(f"exit code {code}")
+            if os.name != 'nt': ProcessTracker.register(action_cmd, proc)
+            return True
+        except Exception as e:
+            Metrics.incr("launch.failures")
+            log_error(f"Launch failed ({action_cmd}): {startfile_error} / {e}", "launch")
+            return False
+
+def launch_record(record):
+    """
+    앱 항목 실행. single_instance 옵션이 있고 이미 실행 중이면 새로 띄우지 않고
+    기존 창을 앞으로 가져온 뒤 그 PID를 반환합니다. 새로 실행했으면 None
+    """
+    action = record.action or ''
+    if record.option('single_instance'):
+        pid = ProcessTracker.running_pid(action)
+        if pid is not None:
+            Metrics.incr("launch.single_instance_hits")
+            focused = focus_process_window(pid)
+            get_logger("launch").info("%s already running (pid %d, focused=%s)", record.name, pid, focused)
+            return pid
+    launch_action(action)
+    return None
+
+# --- [명령줄] ---
+# 창 없이 설정만 읽어 처리하는 명령. PySide6를 불러오기 전에 처리하므로 위젯/스타일시트/아이콘을 만들지 않습니다.
+#   Bifrost.py --list [--group 그룹]              앱 목록 (번호, 그룹, 이름, 대상을 탭으로 구분. 공유 카탈로그 항목은 개인 항목 뒤)
+#   Bifrost.py --launch 이름|번호 [--group 그룹]  앱 실행 (번호는 --list의 첫 열)
+#   Bifrost.py --export [파일] [--group 그룹]     개인 앱 목록을 JSON으로 (파일을 생략하면 표준 출력, 공유 카탈로그 형식)
+#   Bifrost.py --backup | --backups | --restore 버전   설정/아이콘 백업, 백업 목록, 복원 (bifrost_backup)
+CLI_COMMANDS = ('--list', '--launch', '--export', '--group', '--backup', '--backups', '--restore')
+
+def cli_requested(argv):
+    return any(arg.split('=', 1)[0] in CLI_COMMANDS for arg in argv[1:])
+
+def _attach_console():
+    """콘솔 없는 창 모드 exe에서 실행한 경우 부모 콘솔(cmd 등)로 출력 (Windows)"""
+    if sys.stdout is not None: return
+    try:
+        if ctypes.windll.kernel32.AttachConsole(-1): # ATTACH_PARENT_PROCESS
+            sys.stdout = sys.stderr = open('CONOUT$', 'w', encoding='utf-8')
+            return
+    except (AttributeError, OSError):
+        pass
+    sys.stdout = sys.stderr = open(os.devnull, 'w')
+
+def _cli_find(entries, query):
+    """(번호, 레코드) 목록에서 번호 또는 이름(같은 이름이 없으면 대소문자 무시)으로 찾기. (레코드, 오류 메시지)"""
+    if query.isdigit():
+        for i, app in entries:
+            if i == int(query): return app, None
+        return None, f"번호 {query}인 앱이 없습니다."
+    matches = [app for _, app in entries if app.name == query]
+    if not matches:
+        folded = query.casefold()
+        matches = [app for _, app in entries if app.name.casefold() == folded]
+    if not matches: return None, f"'{query}' 앱을 찾지 못했습니다."
+    if len(matches) > 1:
+        return None, f"'{query}' 이름의 앱이 {len(matches)}개입니다. --group이나 번호로 지정하세요."
+    return matches[0], None
+
+def run_cli(argv):
+    import argparse
+    parser = argparse.ArgumentParser(prog="Bifrost", description="Bifrost 명령줄 (창을 띄우지 않음)")
+    commands = parser.add_mutually_exclusive_group()
+    commands.add_argument('--list', action='store_true', help="앱 목록 출력 (기본)")
+    commands.add_argument('--launch', metavar='이름|번호', help="앱 실행")
+    commands.add_argument('--export', metavar='파일', nargs='?', const='-', help="앱 목록을 JSON으로 내보내기")
+    commands.add_argument('--backup', action='store_true', help="설정과 아이콘을 지금 백업")
+    commands.add_argument('--backups', action='store_true', help="백업 목록 출력")
+    commands.add_argument('--restore', metavar='버전', help="백업 복원 (실행 중인 Bifrost는 먼저 종료)")
+    parser.add_argument('--group', metavar='그룹', help="이 그룹의 앱만 대상으로")
+    args, _ = parser.parse_known_args(argv) # --profile 등 창 모드 인자는 무시
+
+    # 상주 중인 인스턴스가 설정 파일을 쓰는 중일 수 있으므로 복원 외에는 읽기만 함
+    ConfigManager.read_only = args.restore is None
+    if args.backup or args.backups or args.restore is not None:
+        return _run_backup_cli(args)
+    config = ConfigManager()
+    apps = config.all_apps() # 공유 카탈로그는 마지막으로 동기화한 로컬 사본 (공유 폴더에 접근하지 않음)
+    if args.group is not None and not any(app.group == args.group for app in apps):
+        print(f"'{args.group}' 그룹에 앱이 없습니다.", file=sys.stderr)
+        return 2
+    # 번호는 그룹으로 걸러도 바뀌지 않도록 전체 설정 순서 기준 (1부터)
+    entries = [(i, app) for i, app in enumerate(apps, 1) if args.group is None or app.group == args.group]
+
+    if args.launch is not None:
+        app, error = _cli_find(entries, args.launch)
+        if app is None:
+            print(error, file=sys.stderr)
+            return 2
+        if not app.action:
+            print(f"'{app.name}'에 실행할 대상이 없습니다.", file=sys.stderr)
+            return 1
+        # single_instance는 창 모드에서 띄운 프로세스를 추적할 때만 의미가 있으므로 여기서는 바로 실행
+        if launch_action(app.action, confirm_s=LAUNCH_CONFIRM_S): return 0
+        print(f"'{app.name}' 실행 실패: {app.action} (자세한 내용은 {ERROR_LOG_FILE})", file=sys.stderr)
+        return 1
+    if args.export is not None:
+        # 공유 항목은 빼고 개인 항목만 (내보낸 파일을 그대로 공유 카탈로그로 쓸 수 있도록)
+        personal = [app for _, app in entries if app.type != "shared"]
+        text = json.dumps({"apps": personal}, default=_json_default, ensure_ascii=False, indent=2)
+        if args.export == '-':
+            print(text)
+        else:
+            with open(args.export, 'w', encoding='utf-8') as f: f.write(text + '\n')
+        return 0
+    for i, app in entries:
+        print(f"{i}\t{app.group or ''}\t{app.name}\t{app.action or ''}")
+    return 0
+
+def _run_backup_cli(args):
+    from bifrost_backup import BackupStore
+    if args.backups:
+        for version_id, manifest in BackupStore.list_versions():
+            created = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(manifest['created']))
+            print(f"{version_id}\t{created}\t앱 {manifest['apps']}개\t아이콘 {len(manifest['icons'])}개\t{manifest['reason']}")
+        return 0
+    try:
+        if args.backup:
+            version_id = BackupStore.backup("manual")
+            print(version_id or "바뀐 내용이 없어 새 백업을 만들지 않았습니다.")
+        else:
+            changed = BackupStore.restore(args.restore)
+            print(f"{args.restore} 백업을 복원했습니다. (아이콘 {len(changed)}개)")
+    except (OSError, ValueError) as e:
+        print(f"백업 작업 실패: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+if __name__ == "__main__" and cli_requested(sys.argv):
+    _attach_console()
+    sys.exit(run_cli(sys.argv[1:]))
+
+# --- [단일 인스턴스] ---
+# 트레이에 상주 중인 인스턴스가 있으면 두 번째 실행은 창 표시만 요청하고 바로 종료합니다.
+# PySide6를 불러오기 전에 처리하므로 두 번째 실행은 인터프리터 시작 + 소켓 연결 시간만 듭니다.
+INSTANCE_FILE = os.path.join(APPDATA_DIR, "instance.json")
+INSTANCE_CONNECT_TIMEOUT = 0.3
+
+def notify_running_instance():
+    """상주 중인 인스턴스에 창 표시를 요청합니다. 성공하면 True (호출 측은 바로 종료)."""
+    try:
+        with open(INSTANCE_FILE, 'r', encoding='utf-8') as f: info = json.load(f)
+        port, token, pid = int(info['port']), info['token'], int(info.get('pid', 0))
+    except (OSError, ValueError, KeyError, TypeError):
+        return False
+    # 다른 프로세스가 창을 앞으로 가져올 수 있도록 포그라운드 권한 양보 (Windows)
+    try: ctypes.windll.user32.AllowSetForegroundWindow(pid)
+    except Exception: pass
+    try:
+        with socket.create_connection(("127.0.0.1", port), timeout=INSTANCE_CONNECT_TIMEOUT) as sock:
+            sock.sendall(f"{token} show\n".encode('ascii'))
+            return sock.recv(16).startswith(b"ok")
+    except OSError:
+        return False # 남아 있는 파일(비정상 종료) -> 새로 실행
+
+if __name__ == "__main__" and notify_running_instance():
+    sys.exit(0)
+
+# --- [Qt] ---
+# 여기부터 PySide6가 필요합니다. (위의 명령줄 모드는 PySide6를 불러오지 않고 끝남)
+# 첫 화면에 필요한 클래스만 가져옴 (PySide6는 클래스를 처음 가져올 때 열거형까지 초기화하므로
+# 대화상자 전용 클래스는 bifrost_dialogs / bifrost_diagnostics에서 가져옴)
+from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, 
+                               QVBoxLayout, QHBoxLayout, QScrollArea, QMessageBox, 
+                               QScroller, QScrollerProperties, QMenu, QDialog, 
+                               QPushButton, QSizePolicy, QLayout,
+                               QInputDialog, QFileIconProvider,
+                               QStackedWidget, QTabBar, QSystemTrayIcon) 
+from PySide6.QtCore import (Qt, QSize, Signal, QMimeData, QPoint, QRect, QFileInfo, QKeyCombination,
+                            QRectF, QObject, QRunnable, QThreadPool, QThread, QTimer, QEvent)
+from PySide6.QtGui import (QPixmap, QImage, QImageReader, QPainter, QPainterPath, QColor, QFont, QDrag, QIcon, QLinearGradient, QBrush,
+                           QKeySequence, QFontMetrics, QTextLayout, QTextOption, QPalette, QPen)
+import shiboken6
+
+# --- [작업 스케줄러] ---
+# 나중에 해도 되는 일을 한곳에서 우선순위대로 실행합니다.
+# - UI 작업: GUI 스레드에서 0ms 타이머로 실행. 제너레이터 함수면 yield마다 끊어서 틱당 SCHEDULER_SLICE_MS까지만 실행
+# - 작업자 작업: SCHEDULER_WORKERS개 스레드 풀에서 실행하고, on_done은 GUI 스레드에서 호출
+#   끊긴 드라이브에서 오래 멈출 수 있는 stat/scandir는 lane="io"로 따로 돌려, 멈춰도 일반 작업(실행, 백업, 압축 등)은 계속 진행
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 1
+PRIORITY_IDLE = 2
+SCHEDULER_SLICE_MS = 8   # 한 번의 타이머 틱에서 UI 작업에 쓰는 최대 시간 (60Hz 프레임의 절반)
+SCHEDULER_WORKERS = 2
+SCHEDULER_IO_WORKERS = 2 # lane="io" (대상 점검, 폴더 스캔이 동시에 멈춰도 이 둘만 붙잡힘)
+PAGE_BUILD_CHUNK = 24    # 다른 탭 페이지를 채울 때 한 조각에 만드는 버튼 수
+
+class Task:
+    """submit_ui/submit_worker가 반환하는 핸들. cancel()은 아직 끝나지 않은 작업을 건너뛰게 합니다."""
+    __slots__ = ('name', 'priority', 'seq', 'fn', 'args', 'on_done', 'queued_at', 'run_ms', 'cancelled', 'done', '_gen')
+
+    def __init__(self, name, priority, seq, fn, args=(), on_done=None):
+        self.name = name
+        self.priority = priority
+        self.seq = seq
+        self.fn = fn
+        self.args = args
+        self.on_done = on_done
+        self.queued_at = time.perf_counter()
+        self.run_ms = 0.0
+        self.cancelled = False
+        self.done = False
+        self._gen = None
+
+    def cancel(self):
+        self.cancelled = True
+
+    def __lt__(self, other):
+        return (self.priority, self.seq) < (other.priority, other.seq)
+
+class _SchedulerBridge(QObject):
+    finished = Signal(object, object) # Task, result — 작업자 스레드 -> GUI 스레드
+
+class Scheduler:
+    _lock = threading.Lock()
+    _seq = 0
+    _ui_queue = []        # heap of Task (GUI 스레드 전용)
+    _ui_timer = None
+    _worker_queues = {}   # lane -> queue.PriorityQueue, 그 lane의 첫 submit_worker 때 생성
+    _bridge = None
+
+    @staticmethod
+    def _next_seq():
+        with Scheduler._lock:
+            Scheduler._seq += 1
+            return Scheduler._seq
+
+    @staticmethod
+    def _publish():
+        Metrics.set_gauge("scheduler.ui_queue_depth", len(Scheduler._ui_queue))
+        for lane, lane_queue in list(Scheduler._worker_queues.items()):
+            Metrics.set_gauge(f"scheduler.{lane}_queue_depth", lane_queue.qsize())
+
+    @staticmethod
+    def _finish(task, result=None):
+        task.done = True
+        Metrics.observe(f"task.{task.name}_ms", task.run_ms)
+        Metrics.observe("scheduler.wait_ms", (time.perf_counter() - task.queued_at) * 1000 - task.run_ms)
+        if task.on_done is not None and not task.cancelled: task.on_done(result)
+
+    # --- UI 작업 (GUI 스레드에서만 호출) ---
+    @staticmethod
+    def submit_ui(fn, *args, priority=PRIORITY_NORMAL, name=None):
+        task = Task(name or fn.__name__, priority, Scheduler._next_seq(), fn, args)
+        heapq.heappush(Scheduler._ui_queue, task)
+        if Scheduler._ui_timer is None:
+            Scheduler._ui_timer = QTimer()
+            Scheduler._ui_timer.setSingleShot(True)
+            Scheduler._ui_timer.setInterval(0)
+            Scheduler._ui_timer.timeout.connect(Scheduler._run_ui_slice)
+        if not Scheduler._ui_timer.isActive(): Scheduler._ui_timer.start()
+        Scheduler._publish()
+        return task
+
+    @staticmethod
+    def _step(task):
+        """작업을 한 조각 실행. 끝났으면 True"""
+        start = time.perf_counter()
+        try:
+            if task._gen is None:
+                result = task.fn(*task.args)
+                if not isinstance(result, types.GeneratorType):
+                    task.run_ms += (time.perf_counter() - start) * 1000
+                    Scheduler._finish(task, result)
+                    return True
+                task._gen = result
+            try:
+                next(task._gen)
+            except StopIteration:
+                task.run_ms += (time.perf_counter() - start) * 1000
+                Scheduler._finish(task)
+                return True
+            task.run_ms += (time.perf_counter() - start) * 1000
+            return False
+        except Exception as e:
+            task.done = True
+            log_error(f"UI task '{task.name}' failed: {e}\n{traceback.format_exc()}", "scheduler")
+            return True
+
+    @staticmethod
+    def _run_ui_slice():
+        deadline = time.perf_counter() + SCHEDULER_SLICE_MS / 1000
+        queue_ = Scheduler._ui_queue
+        while queue_ and time.perf_counter() < deadline:
+            task = queue_[0]
+            if task.cancelled or Scheduler._step(task):
+                if task.cancelled and task._gen is not None: task._gen.close()
+                heapq.heappop(queue_)
+        Scheduler._publish()
+        if queue_: Scheduler._ui_timer.start()
+
+    @staticmethod
+    def finish(task):
+        """대기 중인 UI 작업을 지금 끝까지 실행 (예: 사용자가 아직 채워지지 않은 탭을 열었을 때)"""
+        if task.done or task.cancelled: return
+        while not Scheduler._step(task): pass
+        if task in Scheduler._ui_queue:
+            Scheduler._ui_queue.remove(task)
+            heapq.heapify(Scheduler._ui_queue)
+        Scheduler._publish()
+
+    @staticmethod
+    def drain_ui():
+        """대기 중인 UI 작업을 모두 실행 (종료 직전, 점검 스크립트용)"""
+        while Scheduler._ui_queue:
+            task = heapq.heappop(Scheduler._ui_queue)
+            if not task.cancelled: Scheduler.finish(task)
+        Scheduler._publish()
+
+    # --- 작업자 작업 (어느 스레드에서나 호출 가능) ---
+    @staticmethod
+    def submit_worker(fn, *args, priority=PRIORITY_NORMAL, name=None, on_done=None, lane="worker"):
+        """lane: "worker" (일반) 또는 "io" (끊긴 드라이브에서 멈출 수 있는 파일 시스템 작업)"""
+        task = Task(name or fn.__name__, priority, Scheduler._next_seq(), fn, args, on_done)
+        with Scheduler._lock:
+            lane_queue = Scheduler._worker_queues.get(lane)
+            if lane_queue is None:
+                lane_queue = Scheduler._worker_queues[lane] = queue.PriorityQueue()
+                count = SCHEDULER_IO_WORKERS if lane == "io" else SCHEDULER_WORKERS
+                for i in range(count):
+                    threading.Thread(target=Scheduler._worker, args=(lane_queue,), daemon=True,
+                                     name=f"Scheduler-{lane}-{i}").start()
+            if on_done is not None and Scheduler._bridge is None:
+                # GUI 스레드로 결과를 넘길 다리 (on_done을 쓰는 작업은 GUI 스레드에서 제출)
+                Scheduler._bridge = _SchedulerBridge()
+                Scheduler._bridge.finished.connect(Scheduler._finish)
+        lane_queue.put(task)
+        Scheduler._publish()
+        return task
+
+    @staticmethod
+    def _worker(lane_queue):
+        while True:
+            task = lane_queue.get()
+            Scheduler._publish()
+            if task.cancelled: continue
+            start = time.perf_counter()
+            try:
+                result = task.fn(*task.args)
+            except Exception as e:
+                log_error(f"Worker task '{task.name}' failed: {e}\n{traceback.format_exc()}", "scheduler")
+                task.done = True
+                continue
+            task.run_ms = (time.perf_counter() - start) * 1000
+            if task.on_done is not None: Scheduler._bridge.finished.emit(task, result)
+            else: Scheduler._finish(task)
+
+class ThemeManager:
+    """
+    현재 테마의 색상을 팔레트 + 전역 스타일시트 1개로 적용합니다.
+    커스텀 페인팅 위젯은 color()로 공유 QColor를 읽으므로, 테마를 바꿔도 위젯을 다시 만들 필요가 없습니다.
+    """
+    _name = "dark"
+    _colors = {}    # key -> QColor (현재 테마)
+    _compiled = {}  # theme name -> 스타일시트 문자열
+    last_apply_ms = 0.0
+
+    @staticmethod
+    def name(): return ThemeManager._name
+
+    @staticmethod
+    def value(key):
+        """색상 문자열 (작업 스레드에서도 읽기 가능)"""
+        return THEMES[ThemeManager._name][key]
+
+    @staticmethod
+    def color(key):
+        c = ThemeManager._colors.get(key)
+        if c is None:
+            c = ThemeManager._colors[key] = QColor(THEMES[ThemeManager._name][key])
+        return c
+
+    @staticmethod
+    def stylesheet(name):
+        if name not in ThemeManager._compiled:
+            ThemeManager._compiled[name] = PREMIUM_STYLE.format(**THEMES[name])
+        return ThemeManager._compiled[name]
+
+    @staticmethod
+    def palette(name):
+        t = THEMES[name]
+        pal = QPalette()
+        for role, key in ((QPalette.Window, 'bg'), (QPalette.WindowText, 'text_primary'),
+                          (QPalette.Base, 'input_bg'), (QPalette.AlternateBase, 'surface'),
+                          (QPalette.Text, 'text_primary'), (QPalette.Button, 'surface'),
+                          (QPalette.ButtonText, 'text_strong'), (QPalette.BrightText, 'text_strong'),
+                          (QPalette.Highlight, 'accent'), (QPalette.HighlightedText, 'text_on_accent'),
+                          (QPalette.ToolTipBase, 'input_bg'), (QPalette.ToolTipText, 'text_primary'),
+                          (QPalette.PlaceholderText, 'text_secondary'), (QPalette.Link, 'accent')):
+            pal.setColor(role, QColor(t[key]))
+        return pal
+
+    @staticmethod
+    def apply(name):
+        if name not in THEMES: name = "dark"
+        start = time.perf_counter()
+        ThemeManager._name = name
+        ThemeManager._colors = {}
+        app = QApplication.instance()
+        app.setPalette(ThemeManager.palette(name))
+        app.setStyleSheet(ThemeManager.stylesheet(name))
+        ThemeManager.last_apply_ms = (time.perf_counter() - start) * 1000
+        Metrics.observe("ui.theme_apply_ms", ThemeManager.last_apply_ms)
+        return name
+
+class _IconSignals(QObject):
+    finished = Signal(object, QImage) # _IconJob, image
+
+class _IconJob(QRunnable):
+    """아이콘 하나를 작업 스레드에서 디코딩/스타일링합니다."""
+    def __init__(self, cache_key, filename, app_name, dpr):
+        super().__init__()
+        self.setAutoDelete(False) # IconManager._pending이 수명을 관리 (우선순위 재조정 시 재사용)
+        self.cache_key = cache_key
+        self.filename = filename
+        self.app_name = app_name
+        self.dpr = dpr
+
+    def run(self):
+        with Metrics.timed("icons.render_ms"):
+            image = IconManager._render_image(self.filename, self.app_name, self.dpr)
+        IconManager._signals.finished.emit(self, image)
 
 class IconManager:
-    _cache = {}
+    """
+    아이콘은 ICON_SIZE x 화면 배율(DPR) 픽셀로 미리 렌더링해 배율별로 캐시합니다.
+    픽스맵에 devicePixelRatio가 지정되어 있으므로 그릴 때는 크기 변환 없이 그대로 복사됩니다.
+    """
+    _cache = {}     # 현재 배율의 캐시: cache_key -> QPixmap
+    _caches = {1.0: _cache} # 배율 -> 캐시 (다른 배율 화면으로 돌아갈 때 재사용)
+    _dpr = 1.0
+    _pending = {}   # (cache_key, dpr) -> _IconJob (대기/실행 중)
+    _waiters = {}   # (cache_key, dpr) -> [weakref(AppButton)]
+    _stale = set()  # 무효화 전에 시작되어 결과를 버릴 실행 중 작업 (끝날 때까지 참조 유지)
+    _signals = None
+    _pool = None
+    _placeholder = None
+
+    @staticmethod
+    def cache_key(filename, app_name="?"):
+        return filename if filename else f"__text_{app_name}__"
+
+    @staticmethod
+    def device_pixel_ratio():
+        return IconManager._dpr
+
+    @staticmethod
+    def set_device_pixel_ratio(dpr):
+        """렌더링 배율을 바꿉니다. 바뀌었으면 True (호출 측에서 아이콘을 다시 요청)"""
+        dpr = round(float(dpr or 1.0), 2)
+        if dpr == IconManager._dpr: return False
+        IconManager._dpr = dpr
+        IconManager._cache = IconManager._caches.setdefault(dpr, {})
+        IconManager._placeholder = None
+        Metrics.set_gauge("icons.device_pixel_ratio", dpr)
+        return True
+
     @staticmethod
     def get_icon(filename, app_name="?"):
-        cache_key = filename if filename else f"__text_{app_name}__"
-        if cache_key in IconManager._cache: return IconManager._cache[cache_key]
+        """동기 버전: 캐시에 없으면 현재 스레드(GUI)에서 바로 렌더링합니다."""
+        cache_key = IconManager.cache_key(filename, app_name)
+        if cache_key in IconManager._cache:
+            Metrics.incr("icons.cache_hits")
+            return IconManager._cache[cache_key]
+        Metrics.incr("icons.cache_misses")
+        final_icon = QPixmap.fromImage(IconManager._render_image(filename, app_name, IconManager._dpr))
+        IconManager._cache[cache_key] = final_icon
+        return final_icon
+
+    @staticmethod
+    def request_icon(receiver, filename, app_name="?", visible=False):
+        """
+        비동기 버전: 캐시에 있으면 바로 반환하고, 없으면 작업 스레드 풀에 렌더링을 맡긴 뒤
+        플레이스홀더를 반환합니다. 완료되면 GUI 스레드에서 receiver.set_icon_pixmap(pixmap)이 호출됩니다.
+        """
+        cache_key = IconManager.cache_key(filename, app_name)
+        if cache_key in IconManager._cache:
+            Metrics.incr("icons.cache_hits")
+            return IconManager._cache[cache_key]
+        Metrics.incr("icons.cache_misses")
+
+        if IconManager._signals is None:
+            IconManager._signals = _IconSignals()
+            IconManager._signals.finished.connect(IconManager._on_finished)
+            IconManager._pool = QThreadPool()
+            IconManager._pool.setMaxThreadCount(max(2, QThread.idealThreadCount() - 1))
+
+        job_key = (cache_key, IconManager._dpr)
+        IconManager._waiters.setdefault(job_key, []).append(weakref.ref(receiver))
+        if job_key not in IconManager._pending:
+            job = _IconJob(cache_key, filename, app_name, IconManager._dpr)
+            IconManager._pending[job_key] = job
+            IconManager._pool.start(job, ICON_PRIORITY_VISIBLE if visible else ICON_PRIORITY_BACKGROUND)
+        elif visible:
+            IconManager.promote(cache_key)
+        return IconManager.placeholder()
+
+    @staticmethod
+    def promote(cache_key):
+        """아직 시작되지 않은 작업을 화면에 보이는 우선순위로 올립니다."""
+        job = IconManager._pending.get((cache_key, IconManager._dpr))
+        if job is not None and IconManager._pool.tryTake(job):
+            IconManager._pool.start(job, ICON_PRIORITY_VISIBLE)
+
+    @staticmethod
+    def _on_finished(job, image):
+        job_key = (job.cache_key, job.dpr)
+        if IconManager._pending.get(job_key) is not job:
+            # 무효화 전 상태(이전 테마/파일)로 그렸을 수 있음 -> 캐시하지 않고, 기다리는 버튼은 새 작업의 결과를 받음
+            IconManager._stale.discard(job)
+            Metrics.incr("icons.stale_results")
+            return
+        del IconManager._pending[job_key]
+        pixmap = QPixmap.fromImage(image)
+        IconManager._caches.setdefault(job.dpr, {})[job.cache_key] = pixmap
+        for ref in IconManager._waiters.pop(job_key, []):
+            receiver = ref()
+            # reload_ui에서 deleteLater된 버튼은 건너뜀
+            if receiver is not None and shiboken6.isValid(receiver):
+                receiver.set_icon_pixmap(pixmap)
+
+    @staticmethod
+    def cache_stats():
+        """(캐시된 픽스맵 수, 대략적인 바이트 수) - 모든 배율 합계"""
+        pixmaps = [p for cache in IconManager._caches.values() for p in cache.values()]
+        return len(pixmaps), sum(p.width() * p.height() * p.depth() // 8 for p in pixmaps)
+
+    @staticmethod
+    def invalidate(filename):
+        """파일 내용이 바뀐 아이콘의 캐시를 버립니다."""
+        cache_key = IconManager.cache_key(filename)
+        for cache in IconManager._caches.values():
+            cache.pop(cache_key, None)
+        IconManager._restart_pending(lambda key: key == cache_key)
 
+    @staticmethod
+    def invalidate_text_icons():
+        """테마가 바뀌면 테마 색으로 그린 글자 아이콘/플레이스홀더를 버립니다."""
+        for cache in IconManager._caches.values():
+            for key in [k for k in cache if k.startswith("__text_")]:
+                del cache[key]
+        IconManager._placeholder = None
+        IconManager._restart_pending(lambda key: key.startswith("__text_"))
+
+    @staticmethod
+    def _restart_pending(matches):
+        """
+        무효화된 키의 대기/실행 중 작업을 새 작업으로 바꿉니다. 기다리던 버튼은 그대로 새 작업의 결과를 받고,
+        이미 실행 중이던 작업의 결과는 _on_finished에서 버림
+        """
+        for job_key, job in list(IconManager._pending.items()):
+            if not matches(job_key[0]): continue
+            if not IconManager._pool.tryTake(job): IconManager._stale.add(job)
+            fresh = _IconJob(job.cache_key, job.filename, job.app_name, job.dpr)
+            IconManager._pending[job_key] = fresh
+            IconManager._pool.start(fresh, ICON_PRIORITY_BACKGROUND)
+
+    @staticmethod
+    def trim(keep_keys=(), other_dprs=False):
+        """
+        현재 배율 캐시에서 keep_keys에 없는 것을 버립니다. (reload_ui 후 정리)
+        other_dprs면 다른 배율 캐시도 통째로 버림 (트레이에 오래 숨어 있을 때 메모리 반환용.
+        평소에는 모니터를 오갈 때 다시 디코딩하지 않도록 보관)
+        """
+        keep = set(keep_keys)
+        dropped = [k for k in IconManager._cache if k not in keep]
+        for key in dropped: del IconManager._cache[key]
+        if other_dprs:
+            for dpr in [d for d in IconManager._caches if d != IconManager._dpr]:
+                dropped.extend(IconManager._caches.pop(dpr))
+        IconManager._placeholder = None
+        return len(dropped)
+
+    @staticmethod
+    def placeholder():
+        if IconManager._placeholder is None:
+            IconManager._placeholder = QPixmap.fromImage(IconManager._create_text_icon_flat("", with_letter=False, dpr=IconManager._dpr))
+        return IconManager._placeholder
+
+    @staticmethod
+    def _render_image(filename, app_name, dpr=1.0):
+        """
+        아이콘 파일을 읽어 ICON_SIZE * dpr 픽셀의 둥근 모서리 QImage로 만듭니다.
+        QPixmap을 쓰지 않으므로 작업 스레드에서 호출 가능합니다.
+        """
+        size = round(ICON_SIZE * dpr)
         file_path = os.path.join(ICON_DIR, filename) if filename else ""
-        pixmap = QPixmap(64, 64)
         try:
             if file_path and os.path.exists(file_path):
-                loaded = QPixmap(file_path)
+                loaded = IconManager._decode_icon(file_path, size)
                 if not loaded.isNull():
-                    pixmap = loaded
-                    if pixmap.width() > 128: pixmap = pixmap.scaled(128, 128, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                    pixmap = pixmap.scaled(56, 56, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
-                    final_icon = IconManager._style_icon_flat(pixmap)
-                else: final_icon = IconManager._create_text_icon_flat(app_name)
-            else: final_icon = IconManager._create_text_icon_flat(app_name)
-        except: final_icon = IconManager._create_text_icon_flat(app_name)
+                    return IconManager._style_icon_flat(loaded, dpr)
+        except Exception as e:
+            log_error(f"Icon render error ({filename}): {e}", "icons")
+        return IconManager._create_text_icon_flat(app_name, dpr=dpr)
 
-        IconManager._cache[cache_key] = final_icon
-        return final_icon
+    @staticmethod
+    def _decode_icon(file_path, size):
+        """
+        헤더(크기/프레임 수)만 먼저 읽고, size x size를 채우는 크기로 한 번에 디코딩합니다. 실패하면 null QImage
+        - ICO처럼 프레임이 여러 개면 size 이상인 가장 작은 프레임(없으면 가장 큰 프레임)을 고름
+        - JPEG/SVG처럼 디코더가 축소 디코딩을 지원하면 원본 해상도로 풀지 않고, 나머지는 디코딩 후 한 번만 크기 조정
+        """
+        reader = QImageReader(file_path)
+        count = reader.imageCount()
+        if count > 1:
+            frames = []
+            for i in range(count):
+                if not reader.jumpToImage(i): continue
+                frame = reader.size()
+                if frame.isValid(): frames.append((min(frame.width(), frame.height()), i))
+            if frames:
+                large = [f for f in frames if f[0] >= size]
+                reader.jumpToImage(min(large)[1] if large else max(frames)[1])
+        source = reader.size()
+        if source.isValid() and not source.isEmpty():
+            # KeepAspectRatioByExpanding과 같은 크기 (짧은 변을 size에 맞춤)
+            scale = size / min(source.width(), source.height())
+            target = QSize(max(1, round(source.width() * scale)), max(1, round(source.height() * scale)))
+            if target != source: reader.setScaledSize(target)
+            return reader.read()
+        # 헤더로 크기를 알 수 없는 형식
+        image = reader.read()
+        if image.isNull(): return image
+        return image.scaled(size, size, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
 
     @staticmethod
     def import_icon(source_path):
@@ -515,61 +2115,69 @@ class IconManager:
             shutil.copy2(source_path, dest_path)
             return safe_name
         except Exception as e:
-            log_error(f"Icon import error: {e}")
+            log_error(f"Icon import error: {e}", "icons")
             return None
 
     @staticmethod
-    def _create_text_icon_flat(text):
-        size = 56
-        pix = QPixmap(size, size)
-        pix.fill(Qt.transparent)
-        painter = QPainter(pix)
+    def _create_text_icon_flat(text, with_letter=True, dpr=1.0):
+        size = round(ICON_SIZE * dpr)
+        radius = ICON_RADIUS * dpr
+        img = QImage(size, size, QImage.Format_ARGB32_Premultiplied)
+        img.fill(Qt.transparent)
+        painter = QPainter(img)
         painter.setRenderHint(QPainter.Antialiasing)
         gradient = QLinearGradient(0, 0, size, size)
-        gradient.setColorAt(0, QColor("#3D3D3D")) 
-        gradient.setColorAt(1, QColor("#333333"))
+        gradient.setColorAt(0, QColor(ThemeManager.value('icon_bg_top'))) 
+        gradient.setColorAt(1, QColor(ThemeManager.value('icon_bg_bottom')))
         painter.setBrush(QBrush(gradient))
         painter.setPen(Qt.NoPen)
         path = QPainterPath()
-        path.addRoundedRect(0, 0, size, size, 14, 14) 
+        path.addRoundedRect(0, 0, size, size, radius, radius) 
         painter.drawPath(path)
 
-        first = text[0].upper() if text else "?"
-        painter.setPen(QColor("#FFFFFF"))
-        font = QFont("Segoe UI", 24, QFont.Bold)
-        painter.setFont(font)
-        painter.drawText(QRect(0, -2, size, size), Qt.AlignCenter, first)
+        if with_letter: # 플레이스홀더는 배경만 그림
+            first = text[0].upper() if text else "?"
+            painter.setPen(QColor(ThemeManager.value('icon_letter')))
+            font = QFont("Segoe UI")
+            font.setBold(True)
+            font.setPixelSize(round(27 * dpr))
+            painter.setFont(font)
+            painter.drawText(QRect(0, round(-2 * dpr), size, size), Qt.AlignCenter, first)
         painter.end()
-        return pix
+        img.setDevicePixelRatio(dpr)
+        return img
 
     @staticmethod
-    def _style_icon_flat(source_pixmap):
-        size = 56
-        target = QPixmap(size, size)
+    def _style_icon_flat(source_image, dpr=1.0):
+        size = round(ICON_SIZE * dpr)
+        radius = ICON_RADIUS * dpr
+        target = QImage(size, size, QImage.Format_ARGB32_Premultiplied)
         target.fill(Qt.transparent)
         p = QPainter(target)
         p.setRenderHint(QPainter.Antialiasing)
         p.setRenderHint(QPainter.SmoothPixmapTransform)
         path = QPainterPath()
-        path.addRoundedRect(0, 0, size, size, 14, 14)
+        path.addRoundedRect(0, 0, size, size, radius, radius)
         p.setClipPath(path)
-        x = (size - source_pixmap.width()) // 2
-        y = (size - source_pixmap.height()) // 2
-        p.drawPixmap(x, y, source_pixmap)
+        x = (size - source_image.width()) // 2
+        y = (size - source_image.height()) // 2
+        p.drawImage(x, y, source_image)
         p.end()
+        target.setDevicePixelRatio(dpr)
         return target
 
     @staticmethod
-    def extract_and_save_icon(file_path):
+    def extract_and_save_icon(file_path, savename=None):
         try:
             file_info = QFileInfo(file_path)
             provider = QFileIconProvider()
             icon = provider.icon(file_info)
             if not icon.isNull():
                 pix = icon.pixmap(128, 128)
-                base = os.path.basename(file_path)
-                safe_name = "".join(c for c in base if c.isalnum() or c in (' ', '.', '_')).strip() or "icon"
-                savename = f"auto_{safe_name}.png"
+                if savename is None:
+                    base = os.path.basename(file_path)
+                    safe_name = "".join(c for c in base if c.isalnum() or c in (' ', '.', '_')).strip() or "icon"
+                    savename = f"auto_{safe_name}.png"
                 pix.save(os.path.join(ICON_DIR, savename), "PNG")
                 return savename
         except: pass
@@ -585,7 +2193,7 @@ class IconManager:
         
         # 다른 앱에서 사용 중인지 확인
         for app in all_apps:
-            if app.get('icon') == icon_name:
+            if app.icon == icon_name:
                 return # 사용 중이므로 삭제 안 함
         
         # 사용되지 않음 -> 삭제
@@ -597,81 +2205,651 @@ class IconManager:
 
     @staticmethod
     def fetch_favicon(url):
+        """사이트 파비콘을 받아 저장하고 파일 이름을 반환합니다. 네트워크 요청을 여러 번 하므로 작업자 스레드에서 호출"""
         try:
             parsed = urllib.parse.urlparse(url)
             domain = parsed.netloc
             if not domain: return None
             
-            # Google Favicon API (sz=64 -> 64px)
-            favicon_url = f"https://www.google.com/s2/favicons?domain={domain}&sz=64"
-            
-            # Download
-            ctx = ssl.create_default_context()
-            ctx.check_hostname = False
-            ctx.verify_mode = ssl.CERT_NONE
-            
-            with urllib.request.urlopen(favicon_url, context=ctx, timeout=3) as response:
-                data = response.read()
+            from bifrost_net import FaviconResolver, FaviconCache
+            Metrics.incr("net.favicon_fetches")
+            with log_duration("net", f"favicon {domain}", metric="net.favicon_ms"):
+                result = FaviconResolver().fetch(url)
                 
-            if data:
+            if result:
                 # Save to icons dir
                 safe_name = "".join(c for c in domain if c.isalnum() or c in (' ', '.', '_')).strip()
-                save_name = f"auto_{safe_name}.png"
-                full_path = os.path.join(ICON_DIR, save_name)
-                with open(full_path, 'wb') as f:
-                    f.write(data)
+                save_name = f"auto_{safe_name}{result['ext']}"
+                _write_file_atomic(os.path.join(ICON_DIR, save_name), result['data'])
+                FaviconCache.record(save_name, url, result)
                 return save_name
         except Exception as e:
-            log_error(f"Favicon fetch error: {e}")
+            log_error(f"Favicon fetch error: {e}", "net")
         return None
 
 
+# --- [파비콘] ---
+# 네트워크(urllib/ssl/html.parser)를 쓰는 부분은 bifrost_net.py에 있으며 처음 필요할 때 불러옵니다.
+FAVICON_REVALIDATE_DELAY_MS = 30 * 1000           # 시작 후 첫 재검증까지 대기
+FAVICON_REVALIDATE_PERIOD_MS = 6 * 3600 * 1000
+class FaviconRevalidator(QObject):
+    """
+    오래된 파비콘을 낮은 우선순위(PRIORITY_IDLE) Scheduler 작업으로 하나씩 재검증/갱신합니다.
+    요청 사이 간격(FAVICON_REQUEST_GAP)은 작업자를 재우지 않고 GUI 스레드 타이머로 둡니다.
+    """
+    icon_updated = Signal(str) # icon filename
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._pending = None # 진행 중이면 남은 (icon 파일명, 원본 페이지 URL) deque
+
+    def start(self, entries):
+        """entries: [(icon 파일명, 원본 페이지 URL)] — GUI 스레드에서 만들어 넘김"""
+        if self._pending is not None or not entries: return
+        self._pending = deque(entries)
+        self._next()
+
+    def _next(self):
+        if not self._pending:
+            self._pending = None
+            return
+        icon_name, page_url = self._pending.popleft()
+        Scheduler.submit_worker(self._revalidate, icon_name, page_url, priority=PRIORITY_IDLE,
+                                name="favicon_revalidate", on_done=self._on_done)
+
+    def _on_done(self, outcome):
+        requested, updated = outcome
+        if updated: self.icon_updated.emit(updated)
+        if requested:
+            from bifrost_net import FAVICON_REQUEST_GAP
+            QTimer.singleShot(int(FAVICON_REQUEST_GAP * 1000), self._next)
+        else:
+            self._next()
+
+    @staticmethod
+    def _revalidate(icon_name, page_url):
+        """작업자에서 실행. (요청을 보냈는지, 갱신된 icon 파일명 또는 None) — 예외도 여기서 처리해야 다음 항목으로 넘어감"""
+        from bifrost_net import FaviconResolver, FaviconCache, FAVICON_MAX_AGE
+        try:
+            meta = FaviconCache.get(icon_name)
+            if meta and time.time() - meta.get('checked_at', 0) < FAVICON_MAX_AGE: return False, None
+            Metrics.incr("net.favicon_revalidations")
+            with log_duration("net", f"favicon revalidate {page_url}", metric="net.favicon_ms"):
+                # 메타가 없는 구버전(64px 외부 API) 아이콘은 사이트 자체 아이콘으로 새로 받음
+                result = FaviconResolver().revalidate(page_url, meta)
+            if result == 'not_modified':
+                meta['checked_at'] = time.time()
+                FaviconCache.put(icon_name, meta)
+            elif result:
+                # 파일명은 그대로 유지 (설정이 참조), 형식은 Qt가 내용으로 판별
+                _write_file_atomic(os.path.join(ICON_DIR, icon_name), result['data'])
+                FaviconCache.record(icon_name, page_url, result)
+                Metrics.incr("net.favicon_updates")
+                return True, icon_name
+        except Exception as e:
+            log_error(f"Favicon revalidate failed ({icon_name}): {e}", "net")
+        return True, None
+
+FLOW_LAYOUT_CACHE_WIDTHS = 16  # 폭별 배치 결과를 이 개수까지 보관
+FLOW_RESIZE_COALESCE_MS = 16   # 연속 리사이즈 중 배치 적용 간격 (약 1프레임)
+
 class FlowLayout(QLayout):
+    """
+    아이템 크기 힌트와 폭별 배치 결과(상대 좌표, 전체 높이)를 캐시합니다.
+    캐시는 아이템 추가/제거(addItem/takeAt)와 Qt의 invalidate 때만 버립니다.
+    연속 리사이즈 중의 setGeometry는 FLOW_RESIZE_COALESCE_MS 간격으로 모아 한 번만 적용하고,
+    위치가 바뀐 아이템만 옮깁니다.
+    """
     def __init__(self, parent=None, margin=0, h_spacing=LAYOUT_H_SPACING, v_spacing=LAYOUT_V_SPACING):
         super(FlowLayout, self).__init__(parent)
         self.h_spacing = h_spacing
         self.v_spacing = v_spacing
-        self.setContentsMargins(margin, margin, margin, margin)
         self._item_list = []
+        self._hints = None      # [(w, h)] 아이템별 sizeHint
+        self._min_size = QSize()
+        self._layouts = {}      # width -> ([(x, y)], height)
+        self._applied = None    # 마지막으로 적용한 절대 좌표 [(x, y)]
+        self._pending_rect = None
+        self.setContentsMargins(margin, margin, margin, margin) # invalidate 호출 -> 캐시 필드 이후에
+        self._apply_timer = QTimer(self)
+        self._apply_timer.setSingleShot(True)
+        self._apply_timer.setInterval(FLOW_RESIZE_COALESCE_MS)
+        self._apply_timer.timeout.connect(self._apply_pending)
+
+    def __del__(self):
+        item = self.takeAt(0)
+        while item: item = self.takeAt(0)
+
+    def _reset_cache(self):
+        self._hints = None
+        self._layouts.clear()
+        self._applied = None
+
+    def invalidate(self):
+        self._reset_cache()
+        super(FlowLayout, self).invalidate()
+
+    def addItem(self, item):
+        self._item_list.append(item)
+        self._reset_cache()
+    def count(self): return len(self._item_list)
+    def itemAt(self, index): return self._item_list[index] if 0 <= index < len(self._item_list) else None
+    def takeAt(self, index):
+        if not 0 <= index < len(self._item_list): return None
+        self._reset_cache()
+        return self._item_list.pop(index)
+    def insertWidget(self, index, widget):
+        # QLayout.addWidget 경로(addChildWidget + QWidgetItem 생성)를 그대로 쓰고 위치만 옮김
+        self.addWidget(widget)
+        self._item_list.insert(index, self._item_list.pop())
+        self.invalidate()
+    def expandingDirections(self): return Qt.Orientations(0)
+    def hasHeightForWidth(self): return True
+    def heightForWidth(self, width): return self._layout_for_width(width)[1]
+    def setGeometry(self, rect):
+        super(FlowLayout, self).setGeometry(rect)
+        if self._applied is None:
+            self._pending_rect = None
+            self._apply(rect) # 처음 배치/구조 변경 직후는 즉시
+        else:
+            self._pending_rect = QRect(rect)
+            if not self._apply_timer.isActive(): self._apply_timer.start()
+    def sizeHint(self): return self.minimumSize()
+    def minimumSize(self):
+        self._item_hints()
+        m = self.contentsMargins()
+        return self._min_size + QSize(m.left() + m.right(), m.top() + m.bottom())
+
+    def _item_hints(self):
+        if self._hints is None:
+            hints, size = [], QSize()
+            for item in self._item_list:
+                hint = item.sizeHint()
+                hints.append((hint.width(), hint.height()))
+                size = size.expandedTo(item.minimumSize())
+            self._hints, self._min_size = hints, size
+        return self._hints
+
+    def _layout_for_width(self, width):
+        """폭에 대한 아이템별 상대 좌표와 전체 높이 (캐시)"""
+        cached = self._layouts.get(width)
+        if cached is not None: return cached
+        positions = []
+        x = y = line_height = 0
+        right = width - 1 # QRect.right()
+        for w, h in self._item_hints():
+            next_x = x + w + self.h_spacing
+            if next_x - self.h_spacing > right and line_height > 0:
+                x = 0
+                y = y + line_height + self.v_spacing
+                next_x = x + w + self.h_spacing
+                line_height = 0
+            positions.append((x, y))
+            x = next_x
+            line_height = max(line_height, h)
+        if len(self._layouts) >= FLOW_LAYOUT_CACHE_WIDTHS: self._layouts.clear()
+        cached = self._layouts[width] = (positions, y + line_height)
+        return cached
+
+    def _apply_pending(self):
+        rect, self._pending_rect = self._pending_rect, None
+        if rect is not None: self._apply(rect)
+
+    def _apply(self, rect):
+        positions, _ = self._layout_for_width(rect.width())
+        ox, oy = rect.x(), rect.y()
+        previous = self._applied or ()
+        applied = []
+        for i, (item, (x, y), (w, h)) in enumerate(zip(self._item_list, positions, self._hints)):
+            pos = (ox + x, oy + y)
+            applied.append(pos)
+            if i < len(previous) and previous[i] == pos: continue
+            item.setGeometry(QRect(pos[0], pos[1], w, h))
+        self._applied = applied
+
+# --- [대상 경로 점검] ---
+HEALTH_TTL_SECONDS = 60   # stat 결과 재사용 시간
+HEALTH_BATCH_SIZE = 32
+
+class TargetHealthChecker(QObject):
+    """
+    파일/폴더 대상이 존재하는지 작업 스레드(Scheduler)에서 배치로 stat 하고 결과를 TTL 동안 캐시합니다.
+    GUI 스레드는 stat 하지 않으므로, 느리거나 끊긴 드라이브의 항목이 UI를 멈추게 하지 않습니다.
+    배치는 한 번에 하나만, 일반 작업과 분리된 lane="io"에 제출하므로 끊긴 드라이브에서 멈춰도 실행/백업 등은 계속 진행됩니다.
+    """
+    results_ready = Signal(dict) # path -> 존재 여부
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._cache = {}     # path -> (ok, checked_at)
+        self._queued = {}    # 점검 대기 중인 path (순서 유지)
+        self._running = False
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def is_checkable(action):
+        # URL이나 "notepad" 같은 명령은 제외하고 절대 경로만 점검 (문자열 검사만, stat 없음)
+        return bool(action) and "://" not in action and os.path.isabs(action)
+
+    def cached(self, path):
+        with self._lock:
+            entry = self._cache.get(path)
+        return entry[0] if entry else None
+
+    def check(self, paths, force=False):
+        """TTL 안의 결과는 바로 반환하고, 나머지는 작업 스레드 큐에 넣습니다."""
+        now = time.monotonic()
+        fresh = {}
+        with self._lock:
+            for path in paths:
+                entry = self._cache.get(path)
+                if entry and not force and now - entry[1] < HEALTH_TTL_SECONDS:
+                    fresh[path] = entry[0]
+                elif path not in self._queued:
+                    self._queued[path] = None
+            Metrics.set_gauge("health.queue_depth", len(self._queued))
+            self._submit()
+        return fresh
+
+    def _submit(self):
+        # self._lock 보유 상태에서 호출
+        if self._running or not self._queued: return
+        self._running = True
+        Scheduler.submit_worker(self._run_batch, priority=PRIORITY_NORMAL, name="health_check", lane="io")
+
+    def _run_batch(self):
+        with self._lock:
+            batch = list(self._queued)[:HEALTH_BATCH_SIZE]
+        results = {}
+        try:
+            with Metrics.timed("health.batch_ms"):
+                for path in batch:
+                    try:
+                        os.stat(path)
+                        results[path] = True
+                    except OSError:
+                        results[path] = False
+        finally:
+            now = time.monotonic()
+            with self._lock:
+                for path in batch:
+                    self._queued.pop(path, None)
+                    if path in results: self._cache[path] = (results[path], now)
+                self._running = False
+                Metrics.set_gauge("health.queue_depth", len(self._queued))
+                self._submit() # 남은 대상은 다음 배치로
+        Metrics.incr("health.stats", len(batch))
+        Metrics.incr("health.broken_found", sum(1 for ok in results.values() if not ok))
+        self.results_ready.emit(results)
+
+# --- [폴더 그룹] ---
+FOLDER_LISTING_FILE = os.path.join(APPDATA_DIR, 'folder_listings.json')
+FOLDER_SCAN_CHUNK = 200          # 작업 스레드가 한 번에 넘기는 항목 수
+FOLDER_MAX_ENTRIES = 2000        # 한 폴더에서 보여줄 최대 항목 수
+FOLDER_WATCH_DEBOUNCE_MS = 300   # 연속된 변경 알림을 모아 한 번만 다시 읽음
+FOLDER_ICON_BATCH = 2            # GUI 스레드 한 틱에 추출하는 아이콘 수
+FOLDER_SAVE_DELAY_MS = 2000
+FOLDER_SKIP_NAMES = {'desktop.ini', 'thumbs.db'}
+FOLDER_HIDE_EXTENSIONS = {'.lnk', '.url', '.appref-ms'}   # 탐색기처럼 확장자를 숨기는 바로가기
+FOLDER_UNIQUE_ICON_EXTENSIONS = {'.exe', '.lnk', '.ico', '.url', '.appref-ms'}
+
+def folder_entry_label(name, is_dir):
+    stem, ext = os.path.splitext(name)
+    return stem if not is_dir and ext.lower() in FOLDER_HIDE_EXTENSIONS else name
+
+def folder_entry_sort_key(name, is_dir):
+    return (not is_dir, name.casefold())
+
+def folder_icon_name(path, is_dir):
+    """폴더와 일반 문서는 종류별로 아이콘 하나를 공유하고, 실행 파일/바로가기만 파일마다 추출합니다."""
+    ext = '' if is_dir else os.path.splitext(path)[1].lower()
+    if is_dir: return "auto_fg_dir.png"
+    if ext and ext not in FOLDER_UNIQUE_ICON_EXTENSIONS:
+        safe_ext = "".join(c for c in ext[1:] if c.isalnum()) or "file"
+        return f"auto_fg_ext_{safe_ext}.png"
+    return f"auto_fg_{hashlib.blake2b(path.casefold().encode('utf-8'), digest_size=8).hexdigest()}.png"
+
+class FolderListingStore:
+    """
+    폴더 그룹의 마지막 목록을 실행 사이에 보관합니다.
+    {path: {"mtime_ns": int, "entries": {name: [is_dir, ident, icon]}}}
+    ident는 이름 변경을 알아보는 데 쓰는 값 (POSIX는 inode, Windows는 [크기, 수정 시각])
+    """
+    _save_lock = threading.Lock() # 저장 스레드가 겹쳐도 .tmp 파일을 함께 쓰지 않도록
+
+    @staticmethod
+    def load():
+        try:
+            with open(FOLDER_LISTING_FILE, 'r', encoding='utf-8') as f:
+                raw = json.load(f)
+            listings = {}
+            for path, listing in raw.items():
+                entries = {}
+                for name, is_dir, ident, icon in listing['entries']:
+                    entries[name] = [is_dir, tuple(ident) if isinstance(ident, list) else ident, icon]
+                listings[path] = {'mtime_ns': listing['mtime_ns'], 'entries': entries}
+            return listings
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            log_error(f"Folder listing cache ignored: {e}", "folder")
+            return {}
+
+    @staticmethod
+    def snapshot(listings):
+        """GUI 스레드에서 호출: 저장용 사본 (이후 원본이 바뀌어도 안전)"""
+        return {path: {'mtime_ns': listing['mtime_ns'],
+                       'entries': [[name, *meta] for name, meta in listing['entries'].items()]}
+                for path, listing in listings.items()}
+
+    @staticmethod
+    def save(snapshot):
+        try:
+            data = json.dumps(snapshot, ensure_ascii=False).encode('utf-8')
+            with FolderListingStore._save_lock:
+                _write_file_atomic(FOLDER_LISTING_FILE, data)
+        except Exception as e:
+            log_error(f"Folder listing cache save failed: {e}", "folder")
+
+class FolderScanner(QObject):
+    """
+    폴더를 작업 스레드(Scheduler)에서 os.scandir로 읽어 FOLDER_SCAN_CHUNK개씩 넘깁니다.
+    폴더의 수정 시각이 캐시와 같으면 목록을 다시 읽지 않습니다.
+    폴더 하나가 작업 하나이며 lane="io"에 한 번에 하나씩만 제출합니다. (끊긴 드라이브에서 멈춰도 일반 작업자는 붙잡지 않음)
+    """
+    chunk_ready = Signal(str, list)               # path, [(name, is_dir, ident)]
+    scan_finished = Signal(str, object, object)   # path, mtime_ns(실패 시 None), 전체 목록(변경 없음/실패 시 None)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._queued = {}  # path -> known_mtime_ns (요청 순서 유지)
+        self._running = False
+        self._lock = threading.Lock()
+
+    def scan(self, path, known_mtime_ns=None):
+        with self._lock:
+            if path in self._queued:
+                # 이미 대기 중이면 더 강한 요청(강제 재스캔)만 반영
+                if known_mtime_ns is None: self._queued[path] = None
+                return
+            self._queued[path] = known_mtime_ns
+            Metrics.set_gauge("folder.scan_queue_depth", len(self._queued))
+            self._submit()
+
+    def _submit(self):
+        # self._lock 보유 상태에서 호출
+        if self._running or not self._queued: return
+        self._running = True
+        Scheduler.submit_worker(self._run, priority=PRIORITY_NORMAL, name="folder_scan", lane="io")
+
+    @staticmethod
+    def _entry(entry):
+        name = entry.name
+        if name.startswith('.') or name.lower() in FOLDER_SKIP_NAMES: return None
+        is_dir = entry.is_dir()
+        if os.name == 'nt':
+            # Windows는 scandir가 stat 정보를 함께 주므로 추가 시스템 호출 없음
+            st = entry.stat()
+            if getattr(st, 'st_file_attributes', 0) & 0x6: return None # 숨김/시스템
+            return (name, is_dir, (st.st_size, st.st_mtime_ns))
+        return (name, is_dir, entry.inode())
+
+    def _run(self):
+        with self._lock:
+            path = next(iter(self._queued))
+            known = self._queued.pop(path)
+            Metrics.set_gauge("folder.scan_queue_depth", len(self._queued))
+        try:
+            self._scan(path, known)
+        finally:
+            with self._lock:
+                self._running = False
+                self._submit()
+
+    def _scan(self, path, known):
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+            if known is not None and mtime_ns == known:
+                self.scan_finished.emit(path, mtime_ns, None)
+                return
+            with Metrics.timed("folder.scan_ms"):
+                entries, chunk = [], []
+                with os.scandir(path) as it:
+                    for entry in it:
+                        try: item = self._entry(entry)
+                        except OSError: continue
+                        if item is None: continue
+                        chunk.append(item)
+                        if len(chunk) >= FOLDER_SCAN_CHUNK:
+                            entries.extend(chunk)
+                            self.chunk_ready.emit(path, chunk)
+                            chunk = []
+                        if len(entries) + len(chunk) >= FOLDER_MAX_ENTRIES:
+                            get_logger("folder").warning("Folder %s has more than %d entries; truncated", path, FOLDER_MAX_ENTRIES)
+                            break
+                if chunk:
+                    entries.extend(chunk)
+                    self.chunk_ready.emit(path, chunk)
+            Metrics.incr("folder.scans")
+            self.scan_finished.emit(path, mtime_ns, entries)
+        except OSError as e:
+            log_error(f"Folder scan failed ({path}): {e}", "folder")
+            self.scan_finished.emit(path, None, None)
+
+# --- [카탈로그] ---
+CATALOG_REFRESH_DELAY_MS = 2000            # 첫 화면 이후 색인 시작
+CATALOG_REFRESH_PERIOD_MS = 10 * 60 * 1000 # 이후 주기적으로 바뀐 원본만 다시 읽음
+CATALOG_BUILD_CHUNK = 100                  # 한 조각에 만드는 버튼 수 (Scheduler UI 작업)
+
+# --- [공유 카탈로그] ---
+# 화면은 로컬 사본으로 바로 그리고, 원본(네트워크 드라이브 등)은 bifrost_shared가 전용 스레드에서 재검증합니다.
+SHARED_SYNC_DELAY_MS = 2000              # 첫 화면 이후 첫 재검증
+SHARED_SYNC_PERIOD_MS = 5 * 60 * 1000    # 이후 주기적으로 (수정 시각/크기가 같으면 원본을 읽지 않음)
+
+# --- [시작 시 실행] ---
+AUTOSTART_DELAY_MS = 1500             # 첫 화면을 그린 뒤 시작
+AUTOSTART_LOAD_PER_CPU = 1.5          # POSIX: CPU당 1분 평균 부하가 이보다 높으면 잠시 대기
+AUTOSTART_CPU_BUSY = 0.85             # Windows: 직전 확인 이후 CPU 사용률이 이보다 높으면 잠시 대기
+AUTOSTART_BACKOFF_MS = 2000           # 첫 대기 시간 (이후 두 배씩)
+AUTOSTART_BACKOFF_MAX_MS = 16000
+AUTOSTART_BACKOFF_TOTAL_MS = 60000    # 한 항목이 부하 때문에 기다리는 최대 시간 (넘으면 그대로 실행)
+AUTOSTART_SETTLE_MS = 3000            # 띄운 항목은 프로세스가 끝나거나 이만큼 지날 때까지 동시 실행 수에 포함
+AUTOSTART_SETTLE_POLL_MS = 250        # 추적 중인 프로세스가 끝났는지 확인하는 간격
+
+_cpu_times = None # Windows: 직전 GetSystemTimes (idle, kernel, user), 100ns 단위
+
+def _cpu_busy_fraction():
+    """직전 호출 이후의 전체 CPU 사용률 (0~1, GetSystemTimes). Windows가 아니거나 첫 호출/간격이 너무 짧으면 None"""
+    global _cpu_times
+    try: get_system_times = ctypes.windll.kernel32.GetSystemTimes
+    except AttributeError: return None
+    idle, kernel, user = ctypes.c_ulonglong(), ctypes.c_ulonglong(), ctypes.c_ulonglong() # FILETIME과 같은 크기
+    if not get_system_times(ctypes.byref(idle), ctypes.byref(kernel), ctypes.byref(user)): return None
+    now = (idle.value, kernel.value, user.value)
+    last = _cpu_times
+    if last is not None and now[1] + now[2] == last[1] + last[2]: return None # 타이머 해상도보다 짧은 간격
+    _cpu_times = now
+    if last is None: return None
+    total = (now[1] - last[1]) + (now[2] - last[2]) # kernel 시간에 idle이 포함됨
+    return max(0.0, min(1.0, 1 - (now[0] - last[0]) / total))
+
+def system_load():
+    """
+    (부하 값, 기준) — 값이 기준보다 크면 실행을 미룹니다. 알 수 없으면 None
+    POSIX는 CPU당 1분 평균 부하(os.getloadavg), Windows는 getloadavg가 없으므로 직전 확인 이후 CPU 사용률
+    (실행 대기열 길이가 아니므로 디스크 I/O만 몰린 경우는 잡지 못함)
+    """
+    try: return os.getloadavg()[0] / (os.cpu_count() or 1), AUTOSTART_LOAD_PER_CPU
+    except (AttributeError, OSError): pass
+    busy = _cpu_busy_fraction()
+    return None if busy is None else (busy, AUTOSTART_CPU_BUSY)
+
+class AutostartQueue(QObject):
+    """
+    "시작 시 실행" 항목을 한꺼번에 띄우지 않고 순서대로 실행합니다.
+    동시에 실행 중인 항목 수를 제한하고, 항목 사이에 stagger_ms 간격을 두며, 시스템 부하가 높으면 점점 길게 기다립니다.
+    띄운 항목은 프로세스가 끝날 때까지(ProcessTracker로 추적되는 경우) 또는 AUTOSTART_SETTLE_MS가 지날 때까지
+    실행 중으로 셉니다. 실행 자체는 Scheduler 작업자에서 하므로 UI를 막지 않습니다.
+    """
+    def __init__(self, concurrency=2, stagger_ms=500, parent=None):
+        super().__init__(parent)
+        self.concurrency = max(1, concurrency)
+        self.stagger_ms = max(0, stagger_ms)
+        self._pending = deque() # (AppRecord, 큐에 넣은 시각)
+        self._active = 0
+        self._settling = [] # [(action 또는 None(추적 안 됨), 정착 기한)]
+        self._last_start = 0.0
+        self._backoff_ms = 0
+        self._waited_ms = 0
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._tick)
+        self._settle_timer = QTimer(self)
+        self._settle_timer.setInterval(AUTOSTART_SETTLE_POLL_MS)
+        self._settle_timer.timeout.connect(self._check_settled)
+
+    def start(self, records):
+        now = time.perf_counter()
+        self._pending.extend((rec, now) for rec in records)
+        Metrics.set_gauge("autostart.queue_depth", len(self._pending))
+        if self._pending:
+            system_load() # Windows CPU 사용률의 기준 시점
+            if not self._timer.isActive(): self._timer.start(0)
+
+    def _tick(self):
+        if not self._pending or self._active >= self.concurrency: return
+        sample = system_load()
+        if sample is not None and sample[0] > sample[1] and self._waited_ms < AUTOSTART_BACKOFF_TOTAL_MS:
+            self._backoff_ms = min(self._backoff_ms * 2 or AUTOSTART_BACKOFF_MS, AUTOSTART_BACKOFF_MAX_MS)
+            self._waited_ms += self._backoff_ms
+            Metrics.incr("autostart.backoffs")
+            get_logger("autostart").info("System load %.2f (limit %.2f); waiting %d ms", sample[0], sample[1], self._backoff_ms)
+            self._timer.start(self._backoff_ms)
+            return
+        self._backoff_ms = self._waited_ms = 0
+
+        record, queued_at = self._pending.popleft()
+        self._active += 1
+        self._last_start = time.perf_counter()
+        latency_ms = (self._last_start - queued_at) * 1000
+        Metrics.observe("autostart.start_latency_ms", latency_ms)
+        Metrics.set_gauge("autostart.queue_depth", len(self._pending))
+        get_logger("autostart").info("Starting %s after %.0f ms in queue", record.name, latency_ms)
+        Scheduler.submit_worker(self._launch, record, priority=PRIORITY_HIGH, name="autostart_launch",
+                                on_done=self._on_launched)
+        if self._pending: self._timer.start(self.stagger_ms)
+
+    @staticmethod
+    def _launch(record):
+        """(프로세스를 새로 띄웠는지, ProcessTracker로 추적되는 action 또는 None)"""
+        # 예외로 끝나면 on_done이 불리지 않아 _active가 줄지 않으므로 여기서 처리
+        try:
+            if launch_record(record) is not None: return False, None # 이미 실행 중 (기존 창만 앞으로)
+            action = record.action or ''
+            return True, (action if ProcessTracker.is_tracked(action) else None)
+        except Exception as e:
+            log_error(f"Autostart launch failed ({record.name}): {e}", "autostart")
+            return False, None
+
+    def _on_launched(self, result):
+        spawned, action = result
+        if not spawned:
+            self._release()
+            return
+        self._settling.append((action, time.perf_counter() + AUTOSTART_SETTLE_MS / 1000))
+        if not self._settle_timer.isActive(): self._settle_timer.start()
+
+    def _check_settled(self):
+        now = time.perf_counter()
+        remaining = [(action, deadline) for action, deadline in self._settling
+                     if now < deadline and (action is None or ProcessTracker.running_pid(action) is not None)]
+        settled = len(self._settling) - len(remaining)
+        self._settling = remaining
+        if not remaining: self._settle_timer.stop()
+        for _ in range(settled): self._release()
+
+    def _release(self):
+        self._active -= 1
+        # 동시 실행 제한 때문에 멈춰 있었다면, 마지막 시작 후 남은 간격만큼 기다렸다가 재개
+        if self._pending and not self._timer.isActive():
+            elapsed_ms = (time.perf_counter() - self._last_start) * 1000
+            self._timer.start(max(0, int(self.stagger_ms - elapsed_ms)))
+
+# --- [백업] ---
+BACKUP_DELAY_MS = 10 * 1000           # 첫 화면 이후 첫 백업
+BACKUP_PERIOD_MS = 5 * 60 * 1000      # 이후 이 주기로 바뀐 것만 백업
+BACKUP_MENU_ITEMS = 10                # 메뉴에 보여줄 최근 백업 수
+
+# --- [AppButton 렌더링 캐시] ---
+LABEL_TOP = 58          # 아이콘(6 + 48) 아래 4px
+LABEL_MAX_LINES = 2
+SHADOW_PAD = 8          # 그림자가 아이콘 밖으로 번지는 여백
+
+_label_layout_cache = {} # name -> (font, hover_font, lines, line_height)
+_shadow_pixmaps = {} # dpr -> QPixmap
+
+def _label_layout(name):
+    """이름별 폰트 크기/줄바꿈/말줄임을 한 번만 계산해 캐시합니다."""
+    cached = _label_layout_cache.get(name)
+    if cached is not None: return cached
+
+    # [Dynamic Font Sizing] 너비가 넘치면 폰트 사이즈 줄이기 (최소 9px)
+    font = QFont("Segoe UI")
+    font.setWeight(QFont.Medium)
+    for font_size in (11, 10, 9):
+        font.setPixelSize(font_size)
+        fm = QFontMetrics(font)
+        if fm.horizontalAdvance(name) <= APP_WIDTH: break
+
+    # 2줄 제한: 단어 경계(없으면 글자 단위)로 줄바꿈하고 넘치는 마지막 줄은 말줄임
+    text_layout = QTextLayout(name, font)
+    option = QTextOption(Qt.AlignHCenter)
+    option.setWrapMode(QTextOption.WrapAtWordBoundaryOrAnywhere)
+    text_layout.setTextOption(option)
+    text_layout.beginLayout()
+    lines = []
+    while len(lines) < LABEL_MAX_LINES:
+        line = text_layout.createLine()
+        if not line.isValid(): break
+        line.setLineWidth(APP_WIDTH)
+        lines.append((line.textStart(), line.textLength()))
+    text_layout.endLayout()
+
+    texts = [name[start:start + length].strip() for start, length in lines]
+    if lines:
+        last_start = lines[-1][0]
+        if last_start + lines[-1][1] < len(name):
+            texts[-1] = fm.elidedText(name[last_start:], Qt.ElideRight, APP_WIDTH)
 
-    def __del__(self):
-        item = self.takeAt(0)
-        while item: item = self.takeAt(0)
+    hover_font = QFont(font)
+    hover_font.setWeight(QFont.DemiBold)
+    cached = (font, hover_font, texts, fm.ascent() + fm.descent())
+    _label_layout_cache[name] = cached
+    return cached
 
-    def addItem(self, item): self._item_list.append(item)
-    def count(self): return len(self._item_list)
-    def itemAt(self, index): return self._item_list[index] if 0 <= index < len(self._item_list) else None
-    def takeAt(self, index): return self._item_list.pop(index) if 0 <= index < len(self._item_list) else None
-    def expandingDirections(self): return Qt.Orientations(0)
-    def hasHeightForWidth(self): return True
-    def heightForWidth(self, width): return self._do_layout(QRect(0, 0, width, 0), True)
-    def setGeometry(self, rect):
-        super(FlowLayout, self).setGeometry(rect)
-        self._do_layout(rect, False)
-    def sizeHint(self): return self.minimumSize()
-    def minimumSize(self):
-        size = QSize()
-        for item in self._item_list: size = size.expandedTo(item.minimumSize())
-        m = self.contentsMargins()
-        return size + QSize(m.left() + m.right(), m.top() + m.bottom())
-
-    def _do_layout(self, rect, test_only):
-        x = rect.x()
-        y = rect.y()
-        line_height = 0
-        for item in self._item_list:
-            next_x = x + item.sizeHint().width() + self.h_spacing
-            if next_x - self.h_spacing > rect.right() and line_height > 0:
-                x = rect.x()
-                y = y + line_height + self.v_spacing
-                next_x = x + item.sizeHint().width() + self.h_spacing
-                line_height = 0
-            if not test_only: item.setGeometry(QRect(QPoint(x, y), item.sizeHint()))
-            x = next_x
-            line_height = max(line_height, item.sizeHint().height())
-        return y + line_height - rect.y()
+def _icon_shadow():
+    """QGraphicsDropShadowEffect 대신 한 번 그려두고 재사용하는 부드러운 그림자"""
+    dpr = IconManager.device_pixel_ratio()
+    shadow = _shadow_pixmaps.get(dpr)
+    if shadow is None:
+        size = ICON_SIZE + SHADOW_PAD * 2
+        shadow = QPixmap(round(size * dpr), round(size * dpr))
+        shadow.setDevicePixelRatio(dpr)
+        shadow.fill(Qt.transparent)
+        p = QPainter(shadow)
+        p.setRenderHint(QPainter.Antialiasing)
+        p.setPen(Qt.NoPen)
+        # 바깥쪽부터 옅은 사각형을 겹쳐 블러 효과 근사
+        for i in range(SHADOW_PAD):
+            p.setBrush(QColor(0, 0, 0, 8))
+            inset = SHADOW_PAD - i
+            p.drawRoundedRect(QRectF(i, i, size - i * 2, size - i * 2), ICON_RADIUS + inset, ICON_RADIUS + inset)
+        p.end()
+        _shadow_pixmaps[dpr] = shadow
+    return shadow
 
-class AppButton(QFrame):
+class AppButton(QWidget):
+    """아이콘, 호버 오버레이, 이름, 단축키 힌트를 paintEvent 하나에서 직접 그리는 단일 위젯 버튼"""
     edit_requested = Signal()
     delete_requested = Signal()
     copy_requested = Signal()
@@ -683,94 +2861,155 @@ class AppButton(QFrame):
         self.setCursor(Qt.PointingHandCursor)
         self.setFixedSize(APP_WIDTH, APP_HEIGHT) 
         self.setAcceptDrops(True)
-        self.setObjectName("AppButton")
-        
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(0, 6, 0, 0)
-        layout.setSpacing(4)
-        layout.setAlignment(Qt.AlignTop | Qt.AlignHCenter)
+        self._hover = False
+        self._pressed = False
+        self._broken = False
+        self._running = ProcessTracker.is_running(data.action)
+        self.drag_start_position = QPoint()
 
-        self.icon_containter = QWidget(self)
-        self.icon_containter.setFixedSize(ICON_SIZE, ICON_SIZE)
-        
-        # Icon Label
-        self.icon_label = QLabel(self.icon_containter)
-        self.icon_label.setFixedSize(ICON_SIZE, ICON_SIZE)
-        self.icon_label.setScaledContents(True)
-
-        # Hover Overlay
-        self.overlay = QWidget(self.icon_containter)
-        self.overlay.setFixedSize(ICON_SIZE, ICON_SIZE)
-        self.overlay.setStyleSheet(f"background-color: rgba(255, 255, 255, 30); border-radius: {ICON_RADIUS}px;")
-        self.overlay.hide()
-        self.overlay.setAttribute(Qt.WA_TransparentForMouseEvents)
-
-        shadow = QGraphicsDropShadowEffect(self)
-        shadow.setBlurRadius(12) 
-        shadow.setColor(QColor(0, 0, 0, 60))
-        shadow.setOffset(0, 4)
-        self.icon_containter.setGraphicsEffect(shadow)
-        self.icon_label.setPixmap(IconManager.get_icon(data.get('icon'), data.get('name')))
-
-        self.name_label = QLabel(data.get('name', 'App'))
-        self.name_label.setFixedWidth(APP_WIDTH)
-        self.name_label.setAlignment(Qt.AlignTop | Qt.AlignHCenter)
-        self.name_label.setWordWrap(True)
+        # 디코딩은 작업 스레드에서 진행되고, 완료되면 set_icon_pixmap으로 채워짐
+        self._icon_key = IconManager.cache_key(data.icon, data.name)
+        self._pixmap = IconManager.request_icon(self, data.icon, data.name)
+        self._name = data.name or ''
+        self._shortcut = data.shortcut or ''
         
-        # [Dynamic Font Sizing]
-        font_size = 11
-        text = self.name_label.text()
-        font = QFont("Segoe UI", font_size, QFont.Medium)
+        self._update_tooltip()
+
+    def _update_tooltip(self):
+        tip = f"{self.data.name}"
+        if self._shortcut: tip += f"\n단축키: {self._shortcut}"
+        if self._broken: tip += "\n⚠ 경로를 찾을 수 없습니다"
+        self.setToolTip(tip)
+
+    def set_broken(self, broken):
+        """대상 경로 점검 결과 반영 (TargetHealthChecker)"""
+        if broken == self._broken: return
+        self._broken = broken
+        self._update_tooltip()
+        self.update()
+
+    def set_data(self, data):
+        """위젯을 다시 만들지 않고 레코드만 교체 (폴더 그룹의 이름 변경/아이콘 추출)"""
+        self.data = data
+        self._icon_key = IconManager.cache_key(data.icon, data.name)
+        self._name = data.name or ''
+        self._shortcut = data.shortcut or ''
+        self._update_tooltip()
+        self.reload_icon()
+
+    def set_running(self, running):
+        """Bifrost가 띄운 프로세스가 실행 중인지 표시 (ProcessTracker)"""
+        if running == self._running: return
+        self._running = running
+        self.update()
+
+    def refresh_theme(self):
+        # 글자 아이콘은 테마 색상으로 그려지므로 다시 요청
+        if self._icon_key.startswith("__text_"):
+            self.reload_icon()
+        self.update()
+
+    def reload_icon(self):
+        self._pixmap = IconManager.request_icon(self, self.data.icon, self.data.name, visible=self.isVisible())
+        self.update()
+
+    def set_icon_pixmap(self, pixmap):
+        self._pixmap = pixmap
+        self.update(self._icon_rect().adjusted(-SHADOW_PAD, -SHADOW_PAD, SHADOW_PAD, SHADOW_PAD))
+
+    def pixmap(self):
+        return self._pixmap
+
+    def _icon_rect(self):
+        # 기본 6px, 호버 시 4px로 살짝 떠오르고, 누르면 8px로 눌림
+        y = 8 if self._pressed else (4 if self._hover else 6)
+        return QRect((APP_WIDTH - ICON_SIZE) // 2, y, ICON_SIZE, ICON_SIZE)
+
+    def paintEvent(self, event):
+        p = QPainter(self)
+        p.setRenderHint(QPainter.Antialiasing)
+        icon_rect = self._icon_rect()
+
+        # 그림자/아이콘 모두 현재 배율로 미리 렌더링된 픽스맵 -> 크기 변환 없이 복사
+        p.drawPixmap(icon_rect.x() - SHADOW_PAD, icon_rect.y() - SHADOW_PAD + 4, _icon_shadow())
+        if self._broken: p.setOpacity(0.45)
+        p.drawPixmap(icon_rect.topLeft(), self._pixmap)
+        p.setOpacity(1.0)
+        if self._hover:
+            p.setPen(Qt.NoPen)
+            p.setBrush(ThemeManager.color('overlay'))
+            p.drawRoundedRect(icon_rect, ICON_RADIUS, ICON_RADIUS)
+
+        # 호버 시에도 폰트 사이즈 유지 (색상과 굵기만 변경)
+        font, hover_font, lines, line_height = _label_layout(self._name)
+        p.setFont(hover_font if self._hover else font)
+        p.setPen(ThemeManager.color('label_hover' if self._hover else 'label'))
+        y = LABEL_TOP
+        for text in lines:
+            p.drawText(QRect(0, y, APP_WIDTH, line_height), Qt.AlignHCenter | Qt.AlignTop, text)
+            y += line_height
+
+        if self._running:
+            self._paint_running_marker(p, icon_rect)
+        if self._broken:
+            self._paint_broken_marker(p, icon_rect)
+        if self._hover and self._shortcut:
+            self._paint_shortcut_hint(p, icon_rect)
+        p.end()
+
+    def _paint_running_marker(self, p, icon_rect):
+        # 아이콘 왼쪽 아래의 작은 점 (오른쪽 아래는 경로 오류 표시 자리)
+        dot = QRect(icon_rect.left() - 2, icon_rect.bottom() - 8, 10, 10)
+        p.setPen(QPen(ThemeManager.color('bg'), 2))
+        p.setBrush(ThemeManager.color('running'))
+        p.drawEllipse(dot)
+
+    def _paint_broken_marker(self, p, icon_rect):
+        badge = QRect(icon_rect.right() - 12, icon_rect.bottom() - 12, 16, 16)
+        p.setPen(Qt.NoPen)
+        p.setBrush(ThemeManager.color('danger'))
+        p.drawEllipse(badge)
+        font = QFont("Segoe UI")
+        font.setPixelSize(11)
+        font.setWeight(QFont.Bold)
+        p.setFont(font)
+        p.setPen(ThemeManager.color('text_on_accent'))
+        p.drawText(badge, Qt.AlignCenter, "!")
+
+    def _paint_shortcut_hint(self, p, icon_rect):
+        font = QFont("Segoe UI")
+        font.setPixelSize(8)
+        font.setWeight(QFont.DemiBold)
         fm = QFontMetrics(font)
-        
-        # 너비가 넘치면 폰트 사이즈 줄이기 (최소 9px)
-        if fm.horizontalAdvance(text) > APP_WIDTH:
-            font_size = 10
-            font.setPointSize(font_size)
-            fm = QFontMetrics(font)
-            if fm.horizontalAdvance(text) > APP_WIDTH:
-                font_size = 9
-                font.setPointSize(font_size)
-        
-        # 2줄 제한 설정 (높이로 제어)
-        # 줄간격 고려하여 대략적인 높이 설정 (1줄당 약 1.2~1.4em)
-        # 9px -> ~24px, 11px -> ~28px
-        max_height = 28 if font_size < 11 else 32
-        self.name_label.setMaximumHeight(max_height)
-        
-        self.name_label.setStyleSheet(f"color: #CCCCCC; font-size: {font_size}px; font-weight: 500; background: transparent; line-height: 1.2;")
-        
-        layout.addWidget(self.icon_containter, 0, Qt.AlignHCenter)
-        layout.addWidget(self.name_label, 0, Qt.AlignHCenter)
-        layout.addStretch() # 아래로 밀어내기 (상단 정렬 유지)
-        
-        shortcut_txt = data.get('shortcut', '')
-        if shortcut_txt:
-            self.setToolTip(f"{data.get('name')}\n단축키: {shortcut_txt}")
-        else:
-            self.setToolTip(f"{data.get('name')}")
+        text = fm.elidedText(self._shortcut, Qt.ElideRight, APP_WIDTH - 4)
+        w = fm.horizontalAdvance(text) + 6
+        rect = QRect(min(icon_rect.right() + 4, APP_WIDTH) - w, icon_rect.y() - 2, w, fm.height() + 2)
+        p.setPen(Qt.NoPen)
+        p.setBrush(ThemeManager.color('accent'))
+        p.drawRoundedRect(rect, 4, 4)
+        p.setFont(font)
+        p.setPen(ThemeManager.color('text_on_accent'))
+        p.drawText(rect, Qt.AlignCenter, text)
+
+    def showEvent(self, event):
+        # 화면에 나타난 탭의 아이콘부터 먼저 렌더링
+        IconManager.promote(self._icon_key)
+        super().showEvent(event)
 
     def enterEvent(self, event):
-        self.icon_containter.move(self.icon_containter.x(), 4)
-        self.overlay.show()
-        # 호버 시에도 폰트 사이즈/스타일 유지 (색상과 굵기만 변경)
-        current_style = self.name_label.styleSheet()
-        new_style = current_style.replace("#CCCCCC", "#FFFFFF").replace("font-weight: 500", "font-weight: 600")
-        self.name_label.setStyleSheet(new_style)
+        self._hover = True
+        self.update()
         super().enterEvent(event)
     def leaveEvent(self, event):
-        self.icon_containter.move(self.icon_containter.x(), 6)
-        self.overlay.hide()
-        current_style = self.name_label.styleSheet()
-        new_style = current_style.replace("#FFFFFF", "#CCCCCC").replace("font-weight: 600", "font-weight: 500")
-        self.name_label.setStyleSheet(new_style)
+        self._hover = False
+        self.update()
         super().leaveEvent(event)
     def mousePressEvent(self, e):
         if e.button() == Qt.LeftButton:
             try: self.drag_start_position = e.position().toPoint()
             except: self.drag_start_position = e.globalPos() 
-            self.icon_label.setGraphicsEffect(None)
-            self.icon_containter.move(self.icon_containter.x(), 8)
+            self._pressed = True
+            self.update()
         super().mousePressEvent(e)
     def mouseMoveEvent(self, e):
         if not (e.buttons() & Qt.LeftButton): return
@@ -780,20 +3019,17 @@ class AppButton(QFrame):
         
         drag = QDrag(self)
         mime = QMimeData()
-        mime.setText(self.data['name'])
+        mime.setText(self.data.name)
         drag.setMimeData(mime)
-        pixmap = self.icon_label.pixmap()
+        pixmap = self._pixmap
         drag.setPixmap(pixmap)
         drag.setHotSpot(QPoint(pixmap.width()/2, pixmap.height()/2))
+        self._pressed = False
+        self.update()
         drag.exec(Qt.MoveAction)
-        self.icon_containter.move(self.icon_containter.x(), 6)
     def mouseReleaseEvent(self, e):
-        shadow = QGraphicsDropShadowEffect(self)
-        shadow.setBlurRadius(12)
-        shadow.setColor(QColor(0, 0, 0, 60))
-        shadow.setOffset(0, 4)
-        self.icon_containter.setGraphicsEffect(shadow)
-        self.icon_containter.move(self.icon_containter.x(), 6)
+        self._pressed = False
+        self.update()
         if e.button() == Qt.LeftButton:
             try: curr_pos = e.position().toPoint()
             except: curr_pos = e.globalPos()
@@ -807,50 +3043,66 @@ class AppButton(QFrame):
             e.acceptProposedAction()
     def contextMenuEvent(self, e):
         menu = QMenu(self.window())
+        if self.data.type == "shared":
+            # 공유 카탈로그 항목은 읽기 전용. 복사하면 개인 항목이 되어 같은 그룹/이름의 공유 항목을 대신함
+            menu.addAction("열기", self.execute_action)
+            menu.addAction("내 앱으로 복사", self.copy_requested.emit)
+            menu.addSeparator()
+            menu.addAction("숨기기", self.delete_requested.emit)
+            menu.exec(e.globalPos())
+            return
+        if self.data.type in ("folder", "catalog"):
+            # 폴더 그룹/카탈로그 항목은 원본을 그대로 보여주므로 수정/복사/삭제 대상이 아님
+            menu.addAction("열기", self.execute_action)
+            if self.data.type == "folder":
+                menu.addAction("파일 위치 열기", lambda: launch_action(os.path.dirname(self.data.action)))
+            menu.exec(e.globalPos())
+            return
         menu.addAction("수정", self.edit_requested.emit)
         menu.addAction("복사", self.copy_requested.emit)
         menu.addSeparator()
         menu.addAction("삭제", self.delete_requested.emit)
         menu.exec(e.globalPos())
     def execute_action(self):
-        action_cmd = self.data.get('action', '')
-        if not action_cmd: return
-        try: os.startfile(action_cmd)
-        except:
-            try: subprocess.Popen(action_cmd, shell=True)
-            except: pass
+        pid = launch_record(self.data)
+        if pid is not None:
+            from PySide6.QtWidgets import QToolTip
+            QToolTip.showText(self.mapToGlobal(self._icon_rect().bottomLeft()), f"이미 실행 중입니다 (PID {pid})", self)
+        self.set_running(ProcessTracker.is_running(self.data.action))
 
-class AddButton(QFrame):
+class AddButton(QWidget):
     clicked = Signal()
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setCursor(Qt.PointingHandCursor)
         self.setFixedSize(APP_WIDTH, APP_HEIGHT) 
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(0, 6, 0, 0)
-        layout.setSpacing(4)
-        layout.setAlignment(Qt.AlignTop | Qt.AlignHCenter)
-        self.box = QLabel("+")
-        self.box.setFixedSize(ICON_SIZE, ICON_SIZE)
-        self.box.setAlignment(Qt.AlignCenter)
-        self.box.setStyleSheet(f"QLabel {{ border: 2px dashed #555; border-radius: {ICON_RADIUS}px; color: #555; font-size: 24px; background: transparent; padding-bottom: 4px; }}")
-        self.lbl = QLabel("추가")
-        self.lbl.setAlignment(Qt.AlignHCenter)
-        self.lbl.setStyleSheet("color: #666; font-size: 11px;")
-        layout.addWidget(self.box)
-        layout.addWidget(self.lbl)
+        self._hover = False
+    def paintEvent(self, e):
+        p = QPainter(self)
+        p.setRenderHint(QPainter.Antialiasing)
+        box = QRect((APP_WIDTH - ICON_SIZE) // 2, 6, ICON_SIZE, ICON_SIZE)
+        border = ThemeManager.color('add_border_hover' if self._hover else 'add_border')
+        p.setPen(QPen(border, 2, Qt.DashLine))
+        p.setBrush(Qt.NoBrush)
+        p.drawRoundedRect(QRectF(box).adjusted(1, 1, -1, -1), ICON_RADIUS, ICON_RADIUS)
+        font = QFont("Segoe UI")
+        font.setPixelSize(24)
+        p.setFont(font)
+        p.drawText(box.adjusted(0, 0, 0, -4), Qt.AlignCenter, "+")
+        font.setPixelSize(11)
+        p.setFont(font)
+        p.setPen(ThemeManager.color('add_text_hover' if self._hover else 'add_text'))
+        p.drawText(QRect(0, LABEL_TOP, APP_WIDTH, APP_HEIGHT - LABEL_TOP), Qt.AlignHCenter | Qt.AlignTop, "추가")
+        p.end()
     def mousePressEvent(self, e):
         if e.button() == Qt.LeftButton:
-            self.box.setStyleSheet(self.box.styleSheet().replace("border-color: #555", "border-color: #777"))
             self.clicked.emit()
-    def mouseReleaseEvent(self, e):
-        self.box.setStyleSheet(self.box.styleSheet().replace("border-color: #777", "border-color: #555"))
     def enterEvent(self, e):
-        self.box.setStyleSheet(self.box.styleSheet().replace("#555", "#777").replace("#555", "#777"))
-        self.lbl.setStyleSheet("color: #888; font-size: 11px;")
+        self._hover = True
+        self.update()
     def leaveEvent(self, e):
-        self.box.setStyleSheet(self.box.styleSheet().replace("#777", "#555").replace("#777", "#555"))
-        self.lbl.setStyleSheet("color: #666; font-size: 11px;")
+        self._hover = False
+        self.update()
 
 class CustomTabBar(QTabBar):
     app_now_moved = Signal(object, int) # source_btn, target_tab_index
@@ -892,266 +3144,79 @@ class CustomTabBar(QTabBar):
             super().dropEvent(event)
 
 
-class ShortcutInputButton(QPushButton):
-    def __init__(self, text="없음", parent=None):
-        super().__init__(text, parent)
-        self.setObjectName("ShortcutButton")
-        self.setCheckable(True)
-        self.current_key = None
-        self.toggled.connect(self.update_text)
-
-    def update_text(self, checked):
-        if checked:
-            self.setText("키 입력 중...")
-            self.setStyleSheet("border: 1px solid #0A84FF; color: #0A84FF;")
-        else:
-            self.setText(self.current_key if self.current_key else "없음")
-            self.setStyleSheet("") # 스타일 초기화
+# --- [상주 모드] ---
+# 트레이 상주 중에는 로컬 소켓(127.0.0.1)으로 "show" 요청을 받습니다. (QtNetwork는 빌드에서 제외되어 socket 사용)
+# 포트/토큰/PID는 INSTANCE_FILE에 기록합니다. 두 번째 실행의 처리(notify_running_instance)는 [단일 인스턴스] 참고
+TRAY_TRIM_AFTER_MS = 30 * 60 * 1000 # 이 시간 이상 숨어 있으면 캐시 정리
 
-    def keyPressEvent(self, event):
-        if not self.isChecked():
-            super().keyPressEvent(event)
-            return
+class InstanceServer(QObject):
+    show_requested = Signal()
 
-        key = event.key()
-        modifiers = event.modifiers()
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._sock = None
+        self._token = None
 
-        # 무시할 키 (Modifiers 키 자체만 눌렸을 때)
-        if key in (Qt.Key_Control, Qt.Key_Shift, Qt.Key_Alt, Qt.Key_Meta):
-            return
+    def is_running(self):
+        return self._sock is not None
 
-        # 차단할 키 조합 (Win키, Alt+F4 등)
-        if modifiers & Qt.MetaModifier:
-            self.setText("사용 불가")
-            self.setChecked(False)
-            return
-        if key == Qt.Key_F4 and (modifiers & Qt.AltModifier):
-            self.setText("사용 불가")
-            self.setChecked(False)
-            return
+    def start(self):
+        if self._sock is not None: return True
+        try:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            sock.bind(("127.0.0.1", 0))
+            sock.listen(4)
+            self._token = secrets.token_hex(16)
+            _write_file_atomic(INSTANCE_FILE, json.dumps(
+                {'port': sock.getsockname()[1], 'token': self._token, 'pid': os.getpid()}).encode('utf-8'))
+        except OSError as e:
+            log_error(f"Instance server start failed: {e}", "tray")
+            return False
+        self._sock = sock
+        # accept()는 앱이 살아 있는 동안 계속 막혀 있으므로 Scheduler 작업자를 영구히 차지하지 않도록 전용 스레드를 씁니다.
+        threading.Thread(target=self._serve, args=(sock, self._token), daemon=True, name="InstanceServer").start()
+        return True
 
-        # 키 조합 문자열 생성
-        combo = QKeyCombination(modifiers, Qt.Key(key))
-        sequence = QKeySequence(combo).toString(QKeySequence.NativeText)
-        self.current_key = sequence
-        self.setText(sequence)
-        self.setChecked(False) # 입력 완료 후 해제
-
-    def focusOutEvent(self, event):
-        if self.isChecked():
-            self.setChecked(False)
-            if not self.current_key: self.setText("없음")
-        super().focusOutEvent(event)
-
-class AppEditDialog(QDialog):
-    def __init__(self, parent=None, app_data=None, current_group="", occupied_shortcuts=None):
-        super().__init__(parent)
-        self.setWindowTitle("앱 설정")
-        self.setFixedWidth(400)
-        self.occupied_shortcuts = occupied_shortcuts or {}
-        self.app_data = app_data
-        
-        layout = QFormLayout(self)
-        layout.setVerticalSpacing(15)
-        layout.setContentsMargins(20, 20, 20, 20)
-        
-        self.name_input = QLineEdit()
-        self.name_input.setPlaceholderText("예: Chrome")
-        if app_data: self.name_input.setText(app_data.get('name', ''))
-        layout.addRow("이름", self.name_input)
-
-        self.group_input = QLineEdit()
-        self.group_input.setPlaceholderText("예: 업무")
-        initial_group = app_data.get('group', '') if app_data else current_group
-        if not initial_group: initial_group = "홈"
-        self.group_input.setText(initial_group)
-        layout.addRow("그룹", self.group_input)
-
-        path_layout = QHBoxLayout()
-        self.action_input = QLineEdit()
-        self.action_input.setPlaceholderText("파일 경로 또는 URL")
-        if app_data: self.action_input.setText(app_data.get('action', ''))
-        self.action_input.editingFinished.connect(self.try_auto_fetch_favicon) # URL 입력 시 파비콘 자동 가져오기
-        btn_file = QPushButton("파일")
-        btn_file.clicked.connect(self.find_file)
-        btn_folder = QPushButton("폴더")
-        btn_folder.clicked.connect(self.find_folder)
-        path_layout.addWidget(self.action_input)
-        path_layout.addWidget(btn_file)
-        path_layout.addWidget(btn_folder)
-        layout.addRow("경로", path_layout)
-
-        icon_layout = QHBoxLayout()
-        self.icon_display = QLineEdit()
-        self.icon_display.setPlaceholderText("아이콘 경로")
-        self.icon_display.setReadOnly(True)
-        if app_data: self.icon_display.setText(app_data.get('icon', ''))
-        btn_icon = QPushButton("찾기")
-        btn_icon.clicked.connect(self.find_icon)
-        btn_reset = QPushButton("삭제")
-        btn_reset.setFixedWidth(50)
-        btn_reset.clicked.connect(self.reset_icon)
-        icon_layout.addWidget(self.icon_display)
-        icon_layout.addWidget(btn_icon)
-        icon_layout.addWidget(btn_reset)
-        layout.addRow("아이콘", icon_layout)
-
-        # 단축키 설정
-        shortcut_layout = QHBoxLayout()
-        self.shortcut_btn = ShortcutInputButton()
-        self.shortcut_btn.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-        
-        current_shortcut = app_data.get('shortcut', '') if app_data else ''
-        if current_shortcut:
-            self.shortcut_btn.setText(current_shortcut)
-            self.shortcut_btn.current_key = current_shortcut
-            
-        btn_del_shortcut = QPushButton("삭제")
-        btn_del_shortcut.setFixedWidth(50)
-        btn_del_shortcut.clicked.connect(self.clear_shortcut)
-        
-        shortcut_layout.addWidget(self.shortcut_btn)
-        shortcut_layout.addWidget(btn_del_shortcut)
-        
-        layout.addRow("단축키", shortcut_layout)
-
-        btn_box = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
-        btn_box.button(QDialogButtonBox.Ok).setObjectName("PrimaryButton")
-        btn_box.accepted.connect(self.validate_and_accept)
-        btn_box.rejected.connect(self.reject)
-        layout.addRow(btn_box)
-
-    def clear_shortcut(self):
-        self.shortcut_btn.current_key = ""
-        self.shortcut_btn.setText("없음")
-        self.shortcut_btn.setChecked(False)
-
-    def validate_and_accept(self):
-        new_shortcut = self.shortcut_btn.current_key
-        # 단축키 충돌 검사
-        if new_shortcut:
-             # 내 자신(수정 중인 앱)의 기존 키는 제외하고 검사
-            my_id = id(self.app_data) if self.app_data else None
-            
-            # 다른 앱이 사용 중인지 확인
-            for shortcut, owner_name in self.occupied_shortcuts.items():
-                if shortcut == new_shortcut:
-                    # 충돌! owner가 나 자신이 아니면 경고
-                    # (여기서 owner 식별을 위해 owner_name만 썼지만, 실제로는 좀 더 정교해야 함.
-                    #  다만 occupied_shortcuts를 만들 때 나 자신을 제외하고 넘겨주면 됨.)
-                    reply = QMessageBox.question(
-                        self, "단축키 중복", 
-                        f"단축키 '{new_shortcut}'은(는) 이미 '{owner_name}'에서 사용 중입니다.\n해당 앱의 단축키를 해제하고 현재 앱에 적용하시겠습니까?",
-                        QMessageBox.Yes | QMessageBox.No
-                    )
-                    if reply == QMessageBox.No:
-                        return
-                    # Yes 선택 시: 호출자(MainWindow)에서 처리하도록 플래그 설정 가능하지만,
-                    # 여기서는 그냥 진행하고 MainWindow에서 최종 저장 시에 덮어쓰기 로직 수행
-                    break
-        self.accept()
-
-    def find_file(self):
-        f, _ = QFileDialog.getOpenFileName(self, "파일 선택", "", "All Files (*)")
-        if f:
-            self.action_input.setText(f)
-            extracted = IconManager.extract_and_save_icon(f)
-            if extracted: self.icon_display.setText(extracted)
-            if not self.name_input.text(): self.name_input.setText(os.path.splitext(os.path.basename(f))[0])
-            
-    def try_auto_fetch_favicon(self):
-        """사용자가 URL을 직접 입력했을 때 파비콘을 가져옵니다."""
-        url = self.action_input.text()
-        if (url.startswith("http://") or url.startswith("https://")) and not self.icon_display.text():
-            icon_name = IconManager.fetch_favicon(url)
-            if icon_name:
-                self.icon_display.setText(icon_name)
-                # 이름이 비어있으면 도메인으로 채움
-                if not self.name_input.text():
-                    domain = urllib.parse.urlparse(url).netloc
-                    self.name_input.setText(domain)
-    def find_folder(self):
-        path = QFileDialog.getExistingDirectory(self, "폴더 선택")
-        if path: self.action_input.setText(path)
-    def find_icon(self):
-        path, _ = QFileDialog.getOpenFileName(self, "아이콘 선택", "", "Images (*.png *.jpg *.jpeg *.ico *.bmp)")
-        if path:
-            # 외부 아이콘을 AppData/icons로 임포트
-            imported_name = IconManager.import_icon(path)
-            if imported_name:
-                self.icon_display.setText(imported_name)
-            else:
-                # 실패 시 그냥 경로라도 넣음 (거의 발생 안 함)
-                self.icon_display.setText(path)
-    def reset_icon(self): self.icon_display.clear()
-    def clear_shortcut(self):
-        self.shortcut_btn.current_key = ""
-        self.shortcut_btn.setText("없음")
-        self.shortcut_btn.setChecked(False)
-
-    def get_data(self):
-        return {
-            "name": self.name_input.text(),
-            "group": self.group_input.text().strip() or "홈",
-            "type": "auto",
-            "action": self.action_input.text(),
-            "icon": self.icon_display.text(),
-            "shortcut": self.shortcut_btn.current_key if self.shortcut_btn.current_key else ""
-        }
+    def stop(self):
+        sock, self._sock = self._sock, None
+        if sock is None: return
+        try: sock.close()
+        except OSError: pass
+        try:
+            # 다른 인스턴스가 덮어쓴 파일은 건드리지 않음
+            with open(INSTANCE_FILE, 'r', encoding='utf-8') as f:
+                if json.load(f).get('token') == self._token: os.remove(INSTANCE_FILE)
+        except (OSError, ValueError): pass
 
-class ShortcutDialog(QDialog):
-    def __init__(self, group_name, current_shortcut="", occupied_shortcuts=None, parent=None):
-        super().__init__(parent)
-        self.setWindowTitle("그룹 단축키 설정")
-        self.occupied_shortcuts = occupied_shortcuts or {}
-        layout = QVBoxLayout(self)
-        layout.addWidget(QLabel(f"'{group_name}' 탭으로 이동할 단축키:"))
-        
-        self.btn = ShortcutInputButton(current_shortcut or "없음")
-        self.btn.current_key = current_shortcut
-        
-        shortcut_layout = QHBoxLayout()
-        shortcut_layout.addWidget(self.btn)
-        
-        btn_del = QPushButton("삭제")
-        btn_del.setFixedWidth(50)
-        btn_del.clicked.connect(self.clear_shortcut)
-        shortcut_layout.addWidget(btn_del)
-        
-        layout.addLayout(shortcut_layout)
-        
-        box = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
-        box.accepted.connect(self.validate)
-        box.rejected.connect(self.reject)
-        layout.addWidget(box)
-    
-    def clear_shortcut(self):
-        self.btn.current_key = ""
-        self.btn.setText("없음")
-        self.btn.setChecked(False)
-    
-    def validate(self):
-        new_key = self.btn.current_key
-        if new_key:
-            for s, owner in self.occupied_shortcuts.items():
-                if s == new_key:
-                    reply = QMessageBox.question(self, "중복", f"'{new_key}'는 '{owner}'가 사용 중입니다. 가져오시겠습니까?", QMessageBox.Yes|QMessageBox.No)
-                    if reply == QMessageBox.No: return
-        self.accept()
-    def get_shortcut(self): return self.btn.current_key
+    def _serve(self, sock, token):
+        while True:
+            try: conn, _ = sock.accept()
+            except OSError: return # stop()에서 소켓을 닫음
+            try:
+                with conn:
+                    conn.settimeout(1.0)
+                    line = conn.recv(128).decode('ascii', 'replace').strip()
+                    if line == f"{token} show":
+                        self.show_requested.emit()
+                        conn.sendall(b"ok\n")
+            except OSError:
+                pass
 
 class BifrostWindow(QMainWindow):
     update_available = Signal(str, str) # version, url
 
+    @profiled("window_init")
     def __init__(self):
         super().__init__()
         self.config = ConfigManager()
+        # 환경 변수(BIFROST_LOG_LEVEL)가 있으면 설정보다 우선
+        set_log_level(os.getenv("BIFROST_LOG_LEVEL") or self.config.get_setting('log_level', 'WARNING'))
 
         # 업데이트 시그널 연결
         self.update_available.connect(self.prompt_update)
         self.setWindowTitle(f"Bifrost {VERSION} HoneyMo") 
         self.resize(400, 650)
-        QApplication.instance().setStyleSheet(PREMIUM_STYLE)
+        ThemeManager.apply(self.config.get_setting('theme', 'dark'))
         
         # 메인 윈도우 컨텍스트 메뉴 설정
         self.setContextMenuPolicy(Qt.CustomContextMenu)
@@ -1186,6 +3251,29 @@ class BifrostWindow(QMainWindow):
         header_layout.setContentsMargins(10, 0, 10, 0)
         header_layout.setSpacing(0)
         
+        # 대상 경로 점검 (작업 스레드)
+        self.health = TargetHealthChecker(self)
+        self.health.results_ready.connect(self.on_health_results)
+        self._buttons_by_action = {} # action 경로 -> [AppButton]
+
+        # 폴더 그룹 (스캐너/감시자/목록 캐시는 폴더 그룹이 처음 보일 때 준비)
+        self._folder_scanner = None
+        self._folder_listings = {}   # path -> FolderListingStore 항목
+        self._folder_pages = {}      # path -> [page]
+        self._folder_dirty = set()
+        self._folder_icon_queue = deque() # (path, name)
+        self._folder_icons_done = set()   # 이미 추출한 아이콘 파일 이름
+
+        self._trim_task = None
+
+        # 카탈로그 제공자 (켜져 있을 때만 bifrost_catalog를 불러옴)
+        self._catalog = None
+        self._catalog_entries = {} # provider id -> [(name, action, icon)]
+        self._catalog_pages = {}   # provider id -> page
+
+        # 공유 카탈로그 (설정되어 있을 때만 bifrost_shared를 불러옴)
+        self._shared_sync = None
+
         self.tab_bar = CustomTabBar()
         self.tab_bar.currentChanged.connect(self.on_tab_changed)
         self.tab_bar.tabMoved.connect(self.on_tab_moved)
@@ -1224,14 +3312,132 @@ class BifrostWindow(QMainWindow):
             try: self.setGeometry(geo['x'], geo['y'], geo['w'], geo['h'])
             except: self.center_window()
 
+        # 첫 렌더링부터 창이 놓일 화면의 배율로 아이콘 생성
+        IconManager.set_device_pixel_ratio(self.screen().devicePixelRatio())
+        self._screen_hooked = False
+        self._autostart_armed = False
         self.initialize()
         try: apply_dark_title_bar(int(self.winId()))
         except: pass
 
-        # 업데이트 확인 (비동기)
-        threading.Thread(target=self.run_update_check, daemon=True).start()
+        # 업데이트 확인 (비동기, 첫 화면 표시 후 - urllib/ssl 로딩이 시작 경로와 겹치지 않도록)
+        QTimer.singleShot(UPDATE_CHECK_DELAY_MS, lambda: Scheduler.submit_worker(self.run_update_check, priority=PRIORITY_IDLE))
+
+        # 파비콘 재검증 (시작 직후를 피해 지연 실행 후 주기적으로)
+        self.favicon_revalidator = FaviconRevalidator(self)
+        self.favicon_revalidator.icon_updated.connect(self.on_favicon_updated)
+        QTimer.singleShot(FAVICON_REVALIDATE_DELAY_MS, self.start_favicon_revalidation)
+        self.favicon_timer = QTimer(self)
+        self.favicon_timer.timeout.connect(self.start_favicon_revalidation)
+        self.favicon_timer.start(FAVICON_REVALIDATE_PERIOD_MS)
+
+        # 트레이 상주 모드
+        self.tray_icon = None
+        self._quitting = False
+        self.instance_server = InstanceServer(self)
+        self.instance_server.show_requested.connect(self.show_from_tray)
+        self.trim_timer = QTimer(self)
+        self.trim_timer.setSingleShot(True)
+        self.trim_timer.timeout.connect(self.trim_caches)
+        if self.config.get_setting('tray_resident', False): self.set_tray_resident(True, save=False)
+
+        # 실행 중 표시 (Bifrost가 띄운 프로세스만)
+        self._running_actions = {}
+        self.process_timer = QTimer(self)
+        self.process_timer.timeout.connect(self.update_running_indicators)
+        self.process_timer.start(PROCESS_POLL_MS)
+
+        # 시작 시 실행 항목 (첫 showEvent에서 예약해 첫 화면 이후 큐로 순차 실행)
+        self.autostart_queue = None
+
+        # 설정/아이콘 백업: 첫 화면 이후 한 번(이번 세션에서 고치기 전 상태), 이후 주기적으로 바뀐 것만
+        self.backup_timer = QTimer(self)
+        self.backup_timer.timeout.connect(self.run_backup)
+        self.backup_timer.start(BACKUP_PERIOD_MS)
+        QTimer.singleShot(BACKUP_DELAY_MS, self.run_backup)
+
+        # 공유 카탈로그 재검증: 시작 경로에서는 로컬 사본만 읽고, 원본은 첫 화면 이후 백그라운드에서
+        self.shared_timer = QTimer(self)
+        self.shared_timer.timeout.connect(self.refresh_shared_catalogs)
+        self.shared_timer.start(SHARED_SYNC_PERIOD_MS)
+        QTimer.singleShot(SHARED_SYNC_DELAY_MS, self.refresh_shared_catalogs)
+
+    def update_running_indicators(self):
+        running = ProcessTracker.poll()
+        if running.keys() == self._running_actions.keys(): return
+        self._running_actions = running
+        for btn in self.stacked_widget.findChildren(AppButton):
+            btn.set_running(btn.data.action in running)
+
+    def run_autostart(self):
+        records = [app for app in self.config.get_apps() if app.option('autostart') and app.action]
+        if not records: return
+        self.autostart_queue = AutostartQueue(self.config.get_setting('autostart_concurrency', 2),
+                                              self.config.get_setting('autostart_stagger_ms', 500), self)
+        self.autostart_queue.start(records)
+
+    def run_backup(self, reason="auto"):
+        from bifrost_backup import BackupStore
+        on_done = self.on_manual_backup_done if reason == "manual" else None
+        Scheduler.submit_worker(BackupStore.backup, reason, priority=PRIORITY_IDLE, name="backup", on_done=on_done)
+
+    def on_manual_backup_done(self, version_id):
+        if version_id: QMessageBox.information(self, "백업", f"백업을 만들었습니다.\n({version_id})")
+        else: QMessageBox.information(self, "백업", "마지막 백업 이후 바뀐 내용이 없습니다.")
+
+    def _fill_backup_menu(self, backup_menu):
+        from bifrost_backup import BackupStore
+        backup_menu.clear()
+        backup_menu.addAction("지금 백업", partial(self.run_backup, "manual"))
+        backup_menu.addSeparator()
+        versions = BackupStore.list_versions(BACKUP_MENU_ITEMS)
+        for version_id, manifest in versions:
+            label = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(manifest['created'])) + f"  (앱 {manifest['apps']}개)"
+            backup_menu.addAction(label, partial(self.restore_backup, version_id, label))
+        if not versions: backup_menu.addAction("백업 없음").setEnabled(False)
+
+    def restore_backup(self, version_id, label):
+        reply = QMessageBox.question(
+            self, "백업 복원",
+            f"{label} 백업으로 설정과 아이콘을 되돌리시겠습니까?\n(지금 상태는 복원하기 전에 따로 백업됩니다)",
+            QMessageBox.Yes | QMessageBox.No)
+        if reply != QMessageBox.Yes: return
+        Scheduler.submit_worker(self._restore_backup, version_id, priority=PRIORITY_HIGH, name="backup_restore",
+                                on_done=self.on_backup_restored)
+
+    @staticmethod
+    def _restore_backup(version_id):
+        from bifrost_backup import BackupStore
+        try:
+            return BackupStore.restore(version_id)
+        except (OSError, ValueError) as e:
+            log_error(f"Backup restore failed ({version_id}): {e}", "backup")
+            return None
+
+    def on_backup_restored(self, changed_icons):
+        if changed_icons is None:
+            QMessageBox.warning(self, "백업 복원", "백업을 복원하지 못했습니다. 오류 로그를 확인하세요.")
+            return
+        for icon_name in changed_icons: IconManager.invalidate(icon_name)
+        theme = self.config.get_setting('theme', 'dark')
+        if theme != ThemeManager.name(): self.set_theme(theme)
+        self.reload_ui()
+
+    def start_favicon_revalidation(self):
+        entries = {}
+        for app in self.config.get_apps():
+            icon, action = app.icon or '', app.action or ''
+            if icon.startswith('auto_') and action.startswith(('http://', 'https://')):
+                entries.setdefault(icon, action)
+        self.favicon_revalidator.start(list(entries.items()))
+
+    def on_favicon_updated(self, icon_name):
+        IconManager.invalidate(icon_name)
+        for btn in self.stacked_widget.findChildren(AppButton):
+            if btn.data.icon == icon_name: btn.reload_icon()
 
     def run_update_check(self):
+        from bifrost_updater import AutoUpdater
         updater = AutoUpdater(VERSION)
         ver, url = updater.check_for_updates()
         if ver and url:
@@ -1244,6 +3450,7 @@ class BifrostWindow(QMainWindow):
             QMessageBox.Yes | QMessageBox.No
         )
         if reply == QMessageBox.Yes:
+            from bifrost_updater import AutoUpdater
             updater = AutoUpdater(VERSION)
             updater.perform_update(url, self)
 
@@ -1251,6 +3458,25 @@ class BifrostWindow(QMainWindow):
         super().showEvent(event)
         try: apply_dark_title_bar(int(self.winId()))
         except: pass
+        if not self._screen_hooked and self.windowHandle() is not None:
+            self.windowHandle().screenChanged.connect(self.on_screen_changed)
+            self._screen_hooked = True
+        if not self._autostart_armed:
+            # 생성자에서 예약하면 시작이 느릴 때 첫 화면보다 먼저 실행될 수 있으므로 처음 보일 때부터 셈
+            self._autostart_armed = True
+            QTimer.singleShot(AUTOSTART_DELAY_MS, self.run_autostart)
+
+    def event(self, event):
+        # 같은 화면에서 배율 설정만 바뀐 경우 (Qt 6.6+)
+        if event.type() == getattr(QEvent, 'DevicePixelRatioChange', None):
+            self.on_screen_changed()
+        return super().event(event)
+
+    def on_screen_changed(self, screen=None):
+        # 배율이 다른 화면으로 옮겨지면 해당 배율로 다시 렌더링 (이전 배율 캐시는 보관)
+        if not IconManager.set_device_pixel_ratio(self.devicePixelRatioF()): return
+        for btn in self.stacked_widget.findChildren(AppButton): btn.reload_icon()
+        for btn in self.stacked_widget.findChildren(AddButton): btn.update()
 
     # Key Event Handling for Shortcuts
     def keyPressEvent(self, event):
@@ -1264,13 +3490,9 @@ class BifrostWindow(QMainWindow):
         # 1. 앱 단축키 확인
         apps = self.config.get_apps()
         for app in apps:
-            if app.get('shortcut') == sequence:
-                cmd = app.get('action')
-                if cmd:
-                    try: os.startfile(cmd)
-                    except:
-                        try: subprocess.Popen(cmd, shell=True)
-                        except: pass
+            if app.shortcut == sequence:
+                if app.action:
+                    launch_record(app)
                     return # 실행 후 종료
 
         # 2. 그룹 단축키 확인
@@ -1324,9 +3546,14 @@ class BifrostWindow(QMainWindow):
         else:
             super().dropEvent(event)
 
+    def personal_group(self, group_name):
+        """탭 이름 -> 새 개인 앱을 넣을 그룹. 폴더/카탈로그 탭은 그 내용만 보여주므로 '홈'"""
+        if group_name in self.folder_groups() or group_name in self.catalog_groups(): return '홈'
+        return group_name
+
     def add_app_from_path(self, path):
         # 파일/폴더 추가 다이얼로그 띄우기 (자동 채움)
-        current_group = self.tab_bar.tabText(self.tab_bar.currentIndex())
+        current_group = self.personal_group(self.tab_bar.tabText(self.tab_bar.currentIndex()))
         
         # 임시 데이터 구조 생성
         temp_data = {
@@ -1344,35 +3571,52 @@ class BifrostWindow(QMainWindow):
         self.open_add_dialog_with_data(current_group, temp_data)
 
     def add_app_from_url(self, url):
-        current_group = self.tab_bar.tabText(self.tab_bar.currentIndex())
-        
-        # 파비콘 가져오기 시도 (UI 멈춤 방지를 위해 스레드 쓰면 좋지만 간단하게 처리)
-        # 사용자 경험을 위해 다이얼로그 띄우기 전에 가져오거나, 다이얼로그에서 가져오게 할 수 있음.
-        # 여기서는 미리 가져와서 다이얼로그에 채워줌.
-        favicon = IconManager.fetch_favicon(url)
-        
+        current_group = self.personal_group(self.tab_bar.tabText(self.tab_bar.currentIndex()))
         domain = urllib.parse.urlparse(url).netloc
-        name = domain if domain else "New Link"
-        
         temp_data = {
-            "name": name,
+            "name": domain if domain else "New Link",
             "group": current_group,
             "action": url,
-            "icon": favicon if favicon else ""
+            "icon": ""
         }
-        
-        self.open_add_dialog_with_data(current_group, temp_data)
+        # 대화상자는 바로 띄우고 파비콘은 작업자 스레드에서 가져옴 (느린 사이트가 창을 멈추지 않도록)
+        self.open_add_dialog_with_data(current_group, temp_data, fetch_favicon=True)
+
+    def fetch_favicon_async(self, url, dialog=None):
+        """
+        파비콘을 작업자 스레드에서 가져옵니다. 끝났을 때 대화상자가 아직 열려 있으면 아이콘 칸을 채우고,
+        그 사이 아이콘 없이(글자 아이콘으로) 추가된 같은 주소의 앱에도 적용합니다.
+        """
+        Scheduler.submit_worker(IconManager.fetch_favicon, url, priority=PRIORITY_HIGH, name="favicon_fetch",
+                                on_done=partial(self.on_favicon_fetched, url, dialog))
 
-    def open_add_dialog_with_data(self, group, data):
+    def on_favicon_fetched(self, url, dialog, icon_name):
+        if not icon_name: return
+        IconManager.invalidate(icon_name)
+        if dialog is not None and shiboken6.isValid(dialog) and not dialog.icon_display.text():
+            dialog.icon_display.setText(icon_name)
+        changed = False
+        with self.config.batch():
+            for i, app in enumerate(self.config.get_apps()):
+                if app.action == url and not app.icon:
+                    self.config.update_app(i, app.copy(icon=icon_name))
+                    changed = True
+        if changed: self.reload_ui()
+
+    def open_add_dialog_with_data(self, group, data, fetch_favicon=False):
+        from bifrost_dialogs import AppEditDialog
         occupied = self.get_all_shortcuts()
         dialog = AppEditDialog(self, app_data=data, current_group=group, occupied_shortcuts=occupied)
-        if dialog.exec() == QDialog.Accepted:
-            new_data = dialog.get_data()
-            if new_data.get('shortcut'):
-                self.claim_shortcut(new_data['shortcut'])
-            apps = self.config.get_apps()
-            apps.append(new_data)
-            self.config.set_apps(apps)
+        if fetch_favicon: dialog.try_auto_fetch_favicon()
+        accepted = dialog.exec() == QDialog.Accepted
+        new_data = dialog.get_data()
+        new_data['group'] = self.personal_group(new_data['group']) # 폴더/카탈로그 탭 이름이면 '홈'
+        dialog.deleteLater() # 창의 자식으로 계속 남지 않도록
+        if accepted:
+            with self.config.batch():
+                if new_data.get('shortcut'):
+                    self.claim_shortcut(new_data['shortcut'])
+                self.config.add_app(new_data)
             self.reload_ui()
 
     def center_window(self):
@@ -1401,6 +3645,7 @@ class BifrostWindow(QMainWindow):
         try: pix.save(path, "PNG")
         except: pass
 
+    @profiled("initialize")
     def initialize(self):
         is_pinned = self.config.get_setting('always_on_top', False)
         self.pin_btn.setChecked(is_pinned)
@@ -1424,22 +3669,95 @@ class BifrostWindow(QMainWindow):
     def closeEvent(self, event):
         geo = {'x': self.x(), 'y': self.y(), 'w': self.width(), 'h': self.height()}
         self.config.set_setting('window_geometry', geo)
+        if self.tray_icon is not None and not self._quitting:
+            # 종료하지 않고 숨김 -> 캐시/위젯이 그대로 남아 다시 열 때 즉시 표시
+            event.ignore()
+            self.hide()
+            self.trim_timer.start(TRAY_TRIM_AFTER_MS)
+            return
+        self.instance_server.stop()
         event.accept()
 
+    def set_tray_resident(self, enabled, save=True):
+        if enabled and self.tray_icon is None:
+            if not QSystemTrayIcon.isSystemTrayAvailable():
+                QMessageBox.warning(self, "트레이 상주", "시스템 트레이를 사용할 수 없습니다.")
+                return
+            self.tray_icon = QSystemTrayIcon(self.windowIcon(), self)
+            self.tray_icon.setToolTip(f"Bifrost {VERSION}")
+            tray_menu = QMenu(self)
+            tray_menu.addAction("열기", self.show_from_tray)
+            tray_menu.addSeparator()
+            tray_menu.addAction("종료", self.quit_app)
+            self.tray_icon.setContextMenu(tray_menu)
+            self.tray_icon.activated.connect(self.on_tray_activated)
+            self.tray_icon.show()
+            self.instance_server.start()
+            # 창이 숨어 있는 동안 대화상자를 닫아도 앱이 종료되지 않도록
+            QApplication.instance().setQuitOnLastWindowClosed(False)
+        elif not enabled and self.tray_icon is not None:
+            self.tray_icon.hide()
+            self.tray_icon.deleteLater()
+            self.tray_icon = None
+            self.instance_server.stop()
+            QApplication.instance().setQuitOnLastWindowClosed(True)
+        if save: self.config.set_setting('tray_resident', bool(enabled))
+
+    def on_tray_activated(self, reason):
+        if reason in (QSystemTrayIcon.Trigger, QSystemTrayIcon.DoubleClick):
+            if self.isVisible() and not self.isMinimized(): self.hide()
+            else: self.show_from_tray()
+
+    def show_from_tray(self):
+        self.trim_timer.stop()
+        if self.isMinimized(): self.showNormal()
+        else: self.show()
+        self.raise_()
+        self.activateWindow()
+
+    def quit_app(self):
+        self._quitting = True
+        self.close()
+        QApplication.instance().quit()
+
+    def trim_caches(self):
+        # 오래 숨어 있으면 화면에 쓰이지 않는 캐시만 정리 (보이는 버튼의 아이콘은 유지)
+        if self.isVisible(): return
+        keep = [btn._icon_key for btn in self.stacked_widget.findChildren(AppButton)]
+        dropped = IconManager.trim(keep, other_dprs=True)
+        _label_layout_cache.clear()
+        gc.collect()
+        # 작업 집합 반환 (Windows)
+        try: ctypes.windll.psapi.EmptyWorkingSet(ctypes.windll.kernel32.GetCurrentProcess())
+        except Exception: pass
+        get_logger("tray").info("Trimmed caches while hidden (%d icons dropped)", dropped)
+
+    @profiled("reload_ui")
+    @Metrics.timed("ui.reload_ms")
     def reload_ui(self):
         current_idx = self.tab_bar.currentIndex()
         while self.tab_bar.count() > 0: self.tab_bar.removeTab(0)
         while self.stacked_widget.count() > 0:
             w = self.stacked_widget.widget(0)
+            if w.fill_task is not None: w.fill_task.cancel()
             self.stacked_widget.removeWidget(w)
             w.deleteLater()
+        self._buttons_by_action = {}
+        self._folder_pages = {}
+        self._folder_icon_queue.clear()
+        self._catalog_pages = {}
 
-        apps = self.config.get_apps()
+        apps = self.config.all_apps()
         groups = {}
         for app in apps:
-            g = app.get('group', '홈') or '홈'
+            g = app.group or '홈'
             if g not in groups: groups[g] = []
             groups[g].append(app)
+        folder_groups = self.folder_groups()
+        if folder_groups: self._ensure_folder_services()
+        for g_name in folder_groups: groups.setdefault(g_name, [])
+        catalog_groups = self.catalog_groups()
+        for g_name in catalog_groups: groups.setdefault(g_name, [])
         
         saved_order = self.config.get_setting('group_order', [])
         current_keys = list(groups.keys())
@@ -1457,9 +3775,17 @@ class BifrostWindow(QMainWindow):
         for g_name in remaining: ordered_groups.append(g_name)
         if not ordered_groups: ordered_groups = ["홈"]
         
-        for g_name in ordered_groups:
+        # 곧 보일 탭만 바로 채우고, 나머지 탭의 버튼은 유휴 시간에 채움
+        visible_idx = current_idx if 0 <= current_idx < len(ordered_groups) else 0
+        for i, g_name in enumerate(ordered_groups):
             self.tab_bar.addTab(g_name)
-            self.add_page_content(g_name, groups.get(g_name, []))
+            if g_name in folder_groups: self.add_folder_page_content(g_name, folder_groups[g_name])
+            elif g_name in catalog_groups: self.add_catalog_page_content(g_name, catalog_groups[g_name])
+            else: self.add_page_content(g_name, groups.get(g_name, []), deferred=i != visible_idx)
+
+        # 이름이 바뀌거나 지워진 그룹/꺼진 제공자의 게이지가 세션 내내 쌓이지 않도록 정리
+        Metrics.discard_labeled("ui.page_build_ms", ordered_groups)
+        Metrics.discard_labeled("catalog.entries", self.config.get_setting('catalog_providers', []))
 
         # 그룹 단축키 툴팁 설정
         group_shortcuts = self.config.get_setting('group_shortcuts', {})
@@ -1475,7 +3801,39 @@ class BifrostWindow(QMainWindow):
             self.tab_bar.setCurrentIndex(0)
             self.stacked_widget.setCurrentIndex(0)
 
-    def add_page_content(self, group_name, app_list):
+        # 스타일 해석(polish) 시간 측정: 곧 보여질 현재 페이지만 미리 polish
+        style_start = time.perf_counter()
+        page = self.stacked_widget.currentWidget()
+        if page is not None: page.ensurePolished()
+        self.last_style_ms = (time.perf_counter() - style_start) * 1000
+        Metrics.observe("ui.style_polish_ms", self.last_style_ms)
+
+        # 폴더 그룹: 캐시된 목록으로 먼저 그린 뒤, 작업 스레드에서 바뀐 폴더만 다시 읽음
+        self.sync_folder_groups(folder_groups)
+        if page is not None and hasattr(page, 'folder_path'): self._queue_folder_icons(page, front=True)
+        if page is not None and hasattr(page, 'catalog_id'): self._fill_catalog_page(page)
+
+        # 현재 페이지부터, 이어서 나머지 모든 파일/폴더 대상을 작업 스레드에서 점검
+        self.check_page_health(page)
+        # (유휴 시간에 채워질 페이지의 버튼은 아직 없으므로 설정에서 대상을 모음)
+        actions = {app.action for apps in groups.values() for app in apps if TargetHealthChecker.is_checkable(app.action)}
+        fresh = self.health.check(list(actions))
+        if fresh: self.on_health_results(fresh)
+
+        # 편집/복사로 이름이 바뀐 앱의 글자 아이콘/라벨 캐시가 계속 쌓이지 않도록 지금 페이지에서 쓰는 것만 유지
+        # (모든 페이지가 채워진 뒤에 실행되도록 가장 낮은 우선순위로 예약)
+        if self._trim_task is not None: self._trim_task.cancel()
+        self._trim_task = Scheduler.submit_ui(self._trim_render_caches, priority=PRIORITY_IDLE)
+
+    def _trim_render_caches(self):
+        buttons = [btn for i in range(self.stacked_widget.count())
+                   for btn in self.stacked_widget.widget(i).findChildren(AppButton)]
+        IconManager.trim(btn._icon_key for btn in buttons)
+        names = {btn._name for btn in buttons}
+        for name in [n for n in _label_layout_cache if n not in names]: del _label_layout_cache[name]
+
+    def _create_page(self):
+        """관성 스크롤 QScrollArea와 FlowLayout 컨테이너 (그룹/폴더 그룹 페이지 공용)"""
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
         QScroller.grabGesture(scroll.viewport(), QScroller.LeftMouseButtonGesture)
@@ -1489,30 +3847,428 @@ class BifrostWindow(QMainWindow):
         props.setScrollMetric(QScrollerProperties.DecelerationFactor, 0.7)
         scroller.setScrollerProperties(props)
         
-        container = QWidget()
-        container.setStyleSheet("background: transparent;")
+        container = QWidget() # autoFillBackground가 꺼져 있어 배경은 투명
         
         layout = FlowLayout(container, margin=LAYOUT_MARGIN, h_spacing=LAYOUT_H_SPACING, v_spacing=LAYOUT_V_SPACING)
         layout.setContentsMargins(10, 5, 10, 10)
-        
-        for app in app_list:
+        scroll.app_buttons = []
+        scroll.fill_task = None # 아직 채우는 중인 페이지의 Scheduler 작업
+        return scroll, container, layout
+
+    def add_page_content(self, group_name, app_list, deferred=False):
+        """deferred면 빈 페이지만 만들고 버튼은 유휴 시간에 조금씩 채움 (탭을 열면 그 자리에서 마저 채움)"""
+        scroll, container, layout = self._create_page()
+        scroll.setWidget(container)
+        self.stacked_widget.addWidget(scroll)
+        if deferred:
+            scroll.fill_task = Scheduler.submit_ui(self._fill_page, scroll, layout, group_name, app_list,
+                                                   priority=PRIORITY_IDLE, name="page_build")
+        else:
+            for _ in self._fill_page(scroll, layout, group_name, app_list): pass
+
+    def _fill_page(self, scroll, layout, group_name, app_list):
+        build_ms, start = 0.0, time.perf_counter()
+        for i, app in enumerate(app_list, 1):
             btn = AppButton(app)
-            btn.edit_requested.connect(partial(self.edit_app, app))
-            btn.delete_requested.connect(partial(self.delete_app, app))
-            btn.copy_requested.connect(partial(self.copy_app, app))
-            btn.reorder_requested.connect(partial(self.swap_apps, app))
+            scroll.app_buttons.append(btn)
+            action = app.action
+            if TargetHealthChecker.is_checkable(action):
+                self._buttons_by_action.setdefault(action, []).append(btn)
+                if self.health.cached(action) is False: btn.set_broken(True)
+            if app.type == "shared":
+                btn.copy_requested.connect(partial(self.copy_shared_app, app))
+                btn.delete_requested.connect(partial(self.hide_shared_app, app))
+            else:
+                btn.edit_requested.connect(partial(self.edit_app, app))
+                btn.delete_requested.connect(partial(self.delete_app, app))
+                btn.copy_requested.connect(partial(self.copy_app, app))
+                btn.reorder_requested.connect(partial(self.swap_apps, app))
             layout.addWidget(btn)
+            if i % PAGE_BUILD_CHUNK == 0:
+                build_ms += (time.perf_counter() - start) * 1000
+                yield
+                start = time.perf_counter()
         
         add_btn = AddButton()
         add_btn.clicked.connect(partial(self.add_new_app_dialog, group_name))
         layout.addWidget(add_btn)
-        
+        scroll.fill_task = None
+        build_ms += (time.perf_counter() - start) * 1000
+        Metrics.observe("ui.page_build_ms", build_ms)
+        Metrics.set_gauge(f"ui.page_build_ms[{group_name}]", round(build_ms, 3))
+
+    # --- 폴더 그룹 ---
+    def folder_groups(self):
+        return self.config.get_setting('folder_groups', {})
+
+    def _ensure_folder_services(self):
+        if self._folder_scanner is not None: return
+        from PySide6.QtCore import QFileSystemWatcher
+        self._folder_listings = FolderListingStore.load()
+        self._folder_icons_done = {meta[2] for listing in self._folder_listings.values()
+                                   for meta in listing['entries'].values() if meta[2]}
+        self._folder_scanner = FolderScanner(self)
+        self._folder_scanner.chunk_ready.connect(self.on_folder_chunk)
+        self._folder_scanner.scan_finished.connect(self.on_folder_scanned)
+        self._folder_watcher = QFileSystemWatcher(self)
+        self._folder_watcher.directoryChanged.connect(self.on_folder_changed)
+        self._folder_rescan_timer = QTimer(self)
+        self._folder_rescan_timer.setSingleShot(True)
+        self._folder_rescan_timer.setInterval(FOLDER_WATCH_DEBOUNCE_MS)
+        self._folder_rescan_timer.timeout.connect(self._rescan_dirty_folders)
+        # QFileIconProvider는 GUI 스레드 전용이라, 이벤트 루프가 빌 때마다 조금씩 추출
+        self._folder_icon_timer = QTimer(self)
+        self._folder_icon_timer.setInterval(0)
+        self._folder_icon_timer.timeout.connect(self._extract_folder_icons)
+        self._folder_save_timer = QTimer(self)
+        self._folder_save_timer.setSingleShot(True)
+        self._folder_save_timer.setInterval(FOLDER_SAVE_DELAY_MS)
+        self._folder_save_timer.timeout.connect(self._save_folder_listings)
+
+    def sync_folder_groups(self, folder_groups):
+        """감시 대상을 설정과 맞추고, 캐시보다 새로워졌을 수 있는 폴더를 작업 스레드에서 확인"""
+        if self._folder_scanner is None: return
+        paths = set(folder_groups.values())
+        stale = [p for p in self._folder_watcher.directories() if p not in paths]
+        if stale: self._folder_watcher.removePaths(stale)
+        for path in paths:
+            listing = self._folder_listings.get(path)
+            self._folder_scanner.scan(path, listing['mtime_ns'] if listing else None)
+
+    def add_folder_page_content(self, group_name, path):
+        build_start = time.perf_counter()
+        scroll, container, layout = self._create_page()
+        scroll.folder_group = group_name
+        scroll.folder_path = path
+        scroll.folder_layout = layout
+        scroll.folder_buttons = {} # 파일 이름 -> AppButton
+        scroll.folder_keys = []    # 레이아웃 순서와 같은 정렬 키 (bisect로 삽입 위치 계산)
+
+        listing = self._folder_listings.get(path)
+        if listing:
+            entries = sorted(listing['entries'].items(), key=lambda kv: folder_entry_sort_key(kv[0], kv[1][0]))
+            for name, (is_dir, _, icon) in entries:
+                self._folder_add_button(scroll, name, is_dir, icon, append=True)
+
+        scroll.setWidget(container)
+        self.stacked_widget.addWidget(scroll)
+        self._folder_pages.setdefault(path, []).append(scroll)
+        build_ms = (time.perf_counter() - build_start) * 1000
+        Metrics.observe("ui.page_build_ms", build_ms)
+        Metrics.set_gauge(f"ui.page_build_ms[{group_name}]", round(build_ms, 3))
+
+    def _folder_add_button(self, page, name, is_dir, icon, append=False):
+        if name in page.folder_buttons: return
+        record = AppRecord(name=folder_entry_label(name, is_dir), group=page.folder_group, type="folder",
+                           action=os.path.join(page.folder_path, name), icon=icon)
+        btn = AppButton(record)
+        key = folder_entry_sort_key(name, is_dir)
+        if append:
+            page.folder_keys.append(key)
+            page.folder_layout.addWidget(btn)
+        else:
+            idx = bisect.bisect_left(page.folder_keys, key)
+            page.folder_keys.insert(idx, key)
+            page.folder_layout.insertWidget(idx, btn)
+        page.folder_buttons[name] = btn
+        if not icon:
+            self._folder_icon_queue.append((page.folder_path, name))
+            self._folder_icon_timer.start()
+
+    def _folder_take_button(self, page, name):
+        btn = page.folder_buttons.pop(name, None)
+        if btn is None: return None
+        page.folder_keys.pop(page.folder_layout.indexOf(btn))
+        page.folder_layout.removeWidget(btn)
+        return btn
+
+    def on_folder_chunk(self, path, chunk):
+        # 처음 읽는 폴더만 읽히는 대로 채우고, 캐시가 있던 폴더는 다 읽은 뒤 차이만 반영
+        if path in self._folder_listings: return
+        for page in self._folder_pages.get(path, []):
+            for name, is_dir, _ in chunk:
+                self._folder_add_button(page, name, is_dir, None)
+
+    def on_folder_scanned(self, path, mtime_ns, entries):
+        if mtime_ns is None: return
+        if path not in self._folder_watcher.directories(): self._folder_watcher.addPath(path)
+        if entries is None: return # 캐시 이후 변경 없음
+
+        listing = self._folder_listings.get(path)
+        old = listing['entries'] if listing else {}
+        new = {name: (is_dir, ident) for name, is_dir, ident in entries}
+        removed = [n for n in old if n not in new]
+        added = [n for n in new if n not in old]
+
+        # 이름 변경: 사라진 항목과 ident가 같은 새 항목이 하나뿐이면 같은 파일로 봄
+        by_ident = {}
+        for n in removed: by_ident.setdefault((old[n][0], old[n][1]), []).append(n)
+        renamed = {}
+        for n in added:
+            candidates = by_ident.get(new[n])
+            if candidates and len(candidates) == 1: renamed[candidates.pop()] = n
+        renamed_to = set(renamed.values())
+        removed = [n for n in removed if n not in renamed]
+        added = [n for n in added if n not in renamed_to]
+
+        merged = {}
+        for name, (is_dir, ident) in new.items():
+            prev = old.get(name)
+            merged[name] = [is_dir, ident, prev[2] if prev and prev[0] == is_dir else None]
+        for old_name, new_name in renamed.items(): merged[new_name][2] = old[old_name][2]
+        self._folder_listings[path] = {'mtime_ns': mtime_ns, 'entries': merged}
+
+        for page in self._folder_pages.get(path, []):
+            for name in removed:
+                btn = self._folder_take_button(page, name)
+                if btn is not None: btn.deleteLater()
+            for old_name, new_name in renamed.items():
+                btn = self._folder_take_button(page, old_name)
+                if btn is None: continue
+                is_dir, _, icon = merged[new_name]
+                key = folder_entry_sort_key(new_name, is_dir)
+                idx = bisect.bisect_left(page.folder_keys, key)
+                page.folder_keys.insert(idx, key)
+                page.folder_layout.insertWidget(idx, btn)
+                page.folder_buttons[new_name] = btn
+                btn.set_data(btn.data.copy(name=folder_entry_label(new_name, is_dir), action=os.path.join(path, new_name)))
+            for name in added:
+                self._folder_add_button(page, name, merged[name][0], merged[name][2])
+            # 처음 읽은 폴더는 조각(chunk)마다 만든 버튼의 아이콘 작업이 목록 저장 전에 버려졌으므로 다시 넣음
+            if listing is None: self._queue_folder_icons(page)
+
+        # 파일마다 추출한 아이콘은 그 파일이 사라지면 함께 정리 (종류별 공유 아이콘은 유지)
+        for name in removed:
+            icon = old[name][2]
+            if icon and icon != "auto_fg_dir.png" and not icon.startswith("auto_fg_ext_"):
+                try: os.remove(os.path.join(ICON_DIR, icon))
+                except OSError: pass
+                self._folder_icons_done.discard(icon)
+
+        Metrics.incr("folder.added", len(added))
+        Metrics.incr("folder.removed", len(removed))
+        Metrics.incr("folder.renamed", len(renamed))
+        get_logger("folder").debug("%s: +%d -%d ~%d", path, len(added), len(removed), len(renamed))
+        self._folder_save_timer.start()
+
+    def on_folder_changed(self, path):
+        self._folder_dirty.add(path)
+        self._folder_rescan_timer.start()
+
+    def _rescan_dirty_folders(self):
+        for path in self._folder_dirty: self._folder_scanner.scan(path)
+        self._folder_dirty.clear()
+
+    def refresh_folder_group(self, group_name):
+        path = self.folder_groups().get(group_name)
+        if path and self._folder_scanner is not None: self._folder_scanner.scan(path)
+
+    def _queue_folder_icons(self, page, front=False):
+        missing = [(page.folder_path, name) for name, btn in page.folder_buttons.items() if not btn.data.icon]
+        if not missing: return
+        if front: self._folder_icon_queue.extendleft(reversed(missing))
+        else: self._folder_icon_queue.extend(missing)
+        self._folder_icon_timer.start()
+
+    def _extract_folder_icons(self):
+        extracted = 0
+        while self._folder_icon_queue and extracted < FOLDER_ICON_BATCH:
+            path, name = self._folder_icon_queue.popleft()
+            listing = self._folder_listings.get(path)
+            meta = listing['entries'].get(name) if listing else None
+            if meta is None or meta[2]: continue
+            full_path = os.path.join(path, name)
+            icon = folder_icon_name(full_path, meta[0])
+            if icon not in self._folder_icons_done:
+                extracted += 1
+                with Metrics.timed("folder.icon_extract_ms"):
+                    saved = IconManager.extract_and_save_icon(full_path, savename=icon)
+                if saved is None: continue
+                self._folder_icons_done.add(icon)
+            meta[2] = icon
+            for page in self._folder_pages.get(path, []):
+                btn = page.folder_buttons.get(name)
+                if btn is not None: btn.set_data(btn.data.copy(icon=icon))
+            self._folder_save_timer.start()
+        Metrics.set_gauge("folder.icon_queue_depth", len(self._folder_icon_queue))
+        if not self._folder_icon_queue: self._folder_icon_timer.stop()
+
+    def _save_folder_listings(self):
+        # 직렬화/쓰기는 작업자 스레드에서
+        snapshot = FolderListingStore.snapshot(self._folder_listings)
+        Scheduler.submit_worker(FolderListingStore.save, snapshot, priority=PRIORITY_IDLE, name="folder_listing_save")
+
+    def add_folder_group(self):
+        from PySide6.QtWidgets import QFileDialog
+        path = QFileDialog.getExistingDirectory(self, "폴더 그룹으로 추가할 폴더 선택")
+        if not path: return
+        path = os.path.normpath(path)
+        order = [self.tab_bar.tabText(i) for i in range(self.tab_bar.count())]
+        base = os.path.basename(path.rstrip('\\/')) or path
+        group_name, n = base, 2
+        while group_name in order:
+            group_name = f"{base} ({n})"
+            n += 1
+        folder_groups = dict(self.folder_groups())
+        folder_groups[group_name] = path
+        with self.config.batch():
+            self.config.set_setting('folder_groups', folder_groups)
+            self.config.set_setting('group_order', order + [group_name])
+        self.reload_ui()
+        self.tab_bar.setCurrentIndex(len(order))
+
+    # --- 카탈로그 ---
+    def catalog_groups(self):
+        """
+        켜진 제공자의 가상 그룹 {탭 이름: provider id}.
+        사용자 그룹(앱 그룹, 폴더 그룹)이 우선이며, 이름이 겹치면 폴더 그룹처럼 '북마크 (2)'로 피함
+        """
+        provider_ids = self.config.get_setting('catalog_providers', [])
+        if not provider_ids: return {}
+        self._ensure_catalog()
+        from bifrost_catalog import CATALOG_PROVIDERS
+        taken = {app.group or '홈' for app in self.config.all_apps()} | set(self.folder_groups())
+        groups = {}
+        for pid in provider_ids:
+            if pid not in CATALOG_PROVIDERS: continue
+            label = CATALOG_PROVIDERS[pid].label
+            name, n = label, 2
+            while name in taken or name in groups:
+                name = f"{label} ({n})"
+                n += 1
+            groups[name] = pid
+        return groups
+
+    def _ensure_catalog(self):
+        if self._catalog is not None: return
+        from bifrost_catalog import CatalogIndexer
+        self._catalog = CatalogIndexer(self)
+        self._catalog.updated.connect(self.on_catalog_updated)
+        # 색인은 첫 화면 이후에 시작하고, 이후 주기적으로 바뀐 원본만 다시 읽음
+        QTimer.singleShot(CATALOG_REFRESH_DELAY_MS, self.refresh_catalog)
+        self.catalog_timer = QTimer(self)
+        self.catalog_timer.timeout.connect(self.refresh_catalog)
+        self.catalog_timer.start(CATALOG_REFRESH_PERIOD_MS)
+
+    def refresh_catalog(self):
+        provider_ids = self.config.get_setting('catalog_providers', [])
+        if provider_ids and self._catalog is not None: self._catalog.refresh(provider_ids)
+
+    def add_catalog_page_content(self, group_name, provider_id):
+        scroll, container, layout = self._create_page()
+        scroll.catalog_id = provider_id
+        scroll.catalog_group = group_name
+        scroll.catalog_layout = layout
+        scroll.catalog_built = None # 버튼을 만든 항목 목록 (목록이 바뀌면 다시 만듦)
+        scroll.catalog_task = None
         scroll.setWidget(container)
         self.stacked_widget.addWidget(scroll)
+        self._catalog_pages[provider_id] = scroll
+
+    def on_catalog_updated(self, provider_id, entries):
+        self._catalog_entries[provider_id] = entries
+        page = self._catalog_pages.get(provider_id)
+        if page is not None and page is self.stacked_widget.currentWidget(): self._fill_catalog_page(page)
+
+    def _fill_catalog_page(self, page):
+        entries = self._catalog_entries.get(page.catalog_id)
+        if entries is None or page.catalog_built is entries: return
+        layout = page.catalog_layout
+        for w in [layout.itemAt(i).widget() for i in range(layout.count())]:
+            layout.removeWidget(w)
+            w.deleteLater()
+        page.catalog_built = entries
+        if page.catalog_task is not None: page.catalog_task.cancel()
+        page.catalog_task = Scheduler.submit_ui(self._build_catalog_page, page, entries, name="catalog_build")
+
+    def _build_catalog_page(self, page, entries):
+        # 항목이 많아도 탭이 바로 반응하도록 조각마다 이벤트 루프에 양보
+        for start in range(0, len(entries), CATALOG_BUILD_CHUNK):
+            if not shiboken6.isValid(page): return
+            for name, action, icon in entries[start:start + CATALOG_BUILD_CHUNK]:
+                record = AppRecord(name=name, group=page.catalog_group, type="catalog", action=action, icon=icon)
+                page.catalog_layout.addWidget(AppButton(record))
+            yield
+
+    def set_catalog_provider(self, provider_id, checked):
+        tab_names = [name for name, pid in self.catalog_groups().items() if pid == provider_id]
+        provider_ids = [pid for pid in self.config.get_setting('catalog_providers', []) if pid != provider_id]
+        if checked: provider_ids.append(provider_id)
+        with self.config.batch():
+            self.config.set_setting('catalog_providers', provider_ids)
+            if not checked:
+                order = [g for g in self.config.get_setting('group_order', []) if g not in tab_names]
+                self.config.set_setting('group_order', order)
+        self.reload_ui()
+        if checked: self.refresh_catalog()
+
+    # --- 공유 카탈로그 ---
+    def refresh_shared_catalogs(self):
+        sources = self.config.get_setting('shared_catalogs', [])
+        if not sources: return
+        if self._shared_sync is None:
+            from bifrost_shared import SharedCatalogSync
+            self._shared_sync = SharedCatalogSync(self)
+            self._shared_sync.updated.connect(self.on_shared_catalogs_updated)
+        self._shared_sync.refresh(sources)
+
+    def on_shared_catalogs_updated(self, changed_icons):
+        for icon_path in changed_icons: IconManager.invalidate(icon_path)
+        self.reload_ui()
+
+    def add_shared_catalog(self):
+        from PySide6.QtWidgets import QFileDialog
+        path, _ = QFileDialog.getOpenFileName(self, "공유 카탈로그 파일 선택", "", "Bifrost 앱 목록 (*.json)")
+        if not path: return
+        path = os.path.normpath(path)
+        sources = self.config.get_setting('shared_catalogs', [])
+        if path in sources: return
+        self.config.set_setting('shared_catalogs', sources + [path])
+        # 로컬 사본이 아직 없으므로 첫 동기화가 끝나면 화면에 나타남
+        self.refresh_shared_catalogs()
+
+    def remove_shared_catalog(self, source, checked=False):
+        from bifrost_shared import SharedCatalogSync
+        self.config.set_setting('shared_catalogs', [s for s in self.config.get_setting('shared_catalogs', []) if s != source])
+        SharedCatalogSync.forget(source)
+        self.reload_ui()
+
+    def copy_shared_app(self, app_data):
+        # 공유 아이콘 사본은 카탈로그를 빼면 함께 지워지므로 개인 아이콘 폴더로 복사
+        icon = app_data.icon
+        if icon and os.path.isabs(icon): icon = IconManager.import_icon(icon)
+        self.config.add_app(app_data.copy(type=None, icon=icon))
+        self.reload_ui()
+
+    def hide_shared_app(self, app_data):
+        self.config.hide_shared_app(app_data)
+        self.reload_ui()
+
+    def unhide_shared_apps(self):
+        self.config.set_setting('hidden_shared_apps', [])
+        self.reload_ui()
 
     def on_tab_changed(self, index):
         if index >= 0 and index < self.stacked_widget.count():
             self.stacked_widget.setCurrentIndex(index)
+            page = self.stacked_widget.widget(index)
+            if page.fill_task is not None: Scheduler.finish(page.fill_task)
+            self.check_page_health(page)
+            # 보이는 폴더 그룹의 아이콘부터 추출
+            if hasattr(page, 'folder_path'): self._queue_folder_icons(page, front=True)
+            # 카탈로그 탭은 처음 보일 때 버튼을 만듦
+            if hasattr(page, 'catalog_id'): self._fill_catalog_page(page)
+
+    def check_page_health(self, page):
+        """그룹이 보일 때마다 해당 페이지 대상 경로를 (TTL이 지났으면) 다시 점검"""
+        paths = {btn.data.action for btn in getattr(page, 'app_buttons', [])}
+        fresh = self.health.check([p for p in paths if TargetHealthChecker.is_checkable(p)])
+        if fresh: self.on_health_results(fresh)
+
+    def on_health_results(self, results):
+        for path, ok in results.items():
+            for btn in self._buttons_by_action.get(path, []):
+                if shiboken6.isValid(btn): btn.set_broken(not ok)
     
     def on_tab_moved(self, from_idx, to_idx):
         order = []
@@ -1527,15 +4283,15 @@ class BifrostWindow(QMainWindow):
         target_group = self.tab_bar.tabText(target_tab_index)
         app_data = source_btn.data
         
-        # 현재 그룹과 같으면 이동 안함
-        current_group = app_data.get('group', '홈') or '홈'
-        if current_group == target_group: return
+        # 현재 그룹과 같거나 폴더 그룹(폴더 내용만 표시)이면 이동 안함
+        current_group = app_data.group or '홈'
+        if current_group == target_group or target_group in self.folder_groups(): return
+        if target_group in self.catalog_groups(): return
 
         apps = self.config.get_apps()
         if app_data in apps:
             idx = apps.index(app_data)
-            apps[idx]['group'] = target_group
-            self.config.set_apps(apps)
+            self.config.update_app(idx, app_data.copy(group=target_group))
             self.reload_ui()
             # 이동한 탭으로 포커스 이동 (사용자 편의)
             self.tab_bar.setCurrentIndex(target_tab_index)
@@ -1545,10 +4301,25 @@ class BifrostWindow(QMainWindow):
         idx = self.tab_bar.tabAt(point)
         if idx < 0: return
         menu = QMenu(self)
+        group_name = self.tab_bar.tabText(idx)
+        catalog_id = self.catalog_groups().get(group_name)
+        if catalog_id:
+            # 제공자가 정한 가상 그룹이므로 이름 변경/삭제 대신 숨기기
+            menu.addAction("새로 고침", self.refresh_catalog)
+            menu.addAction("그룹 단축키 설정", lambda: self.set_group_shortcut(idx))
+            menu.addSeparator()
+            menu.addAction("숨기기", lambda: self.set_catalog_provider(catalog_id, False))
+            menu.exec(self.tab_bar.mapToGlobal(point))
+            return
+        folder_path = self.folder_groups().get(group_name)
+        if folder_path:
+            menu.addAction("폴더 열기", lambda: launch_action(folder_path))
+            menu.addAction("새로 고침", lambda: self.refresh_folder_group(group_name))
+            menu.addSeparator()
         menu.addAction("이름 변경", lambda: self.rename_group(idx))
         menu.addAction("그룹 단축키 설정", lambda: self.set_group_shortcut(idx))
         menu.addSeparator()
-        menu.addAction("그룹 삭제", lambda: self.delete_group(idx))
+        menu.addAction("폴더 연결 해제" if folder_path else "그룹 삭제", lambda: self.delete_group(idx))
         menu.exec(self.tab_bar.mapToGlobal(point))
     
     def get_all_shortcuts(self, exclude_app=None, exclude_group=None):
@@ -1556,8 +4327,8 @@ class BifrostWindow(QMainWindow):
         # Apps
         for app in self.config.get_apps():
             if app is exclude_app: continue
-            s = app.get('shortcut')
-            if s: occupied[s] = f"앱: {app.get('name')}"
+            s = app.shortcut
+            if s: occupied[s] = f"앱: {app.name}"
         # Groups
         g_shorts = self.config.get_setting('group_shortcuts', {})
         for g, s in g_shorts.items():
@@ -1570,18 +4341,18 @@ class BifrostWindow(QMainWindow):
         if not shortcut: return
         apps = self.config.get_apps()
         changed = False
-        for app in apps:
-            if app.get('shortcut') == shortcut:
-                app['shortcut'] = ""
-                changed = True
-        if changed: self.config.set_apps(apps)
-        
-        g_shorts = self.config.get_setting('group_shortcuts', {})
-        new_g = {}
-        for g, s in g_shorts.items():
-            if s == shortcut: changed = True 
-            else: new_g[g] = s
-        if changed: self.config.set_setting('group_shortcuts', new_g)
+        with self.config.batch():
+            for idx, app in enumerate(apps):
+                if app.shortcut == shortcut:
+                    self.config.update_app(idx, app.copy(shortcut=""))
+                    changed = True
+            
+            g_shorts = self.config.get_setting('group_shortcuts', {})
+            new_g = {}
+            for g, s in g_shorts.items():
+                if s == shortcut: changed = True 
+                else: new_g[g] = s
+            if changed: self.config.set_setting('group_shortcuts', new_g)
 
     def set_group_shortcut(self, idx):
         g_name = self.tab_bar.tabText(idx)
@@ -1591,16 +4362,21 @@ class BifrostWindow(QMainWindow):
         # 제외 대상(자기 자신) 지정하여 목록 생성
         occupied = self.get_all_shortcuts(exclude_group=g_name)
         
+        from bifrost_dialogs import ShortcutDialog
         dialog = ShortcutDialog(g_name, cur_short, occupied, self)
-        if dialog.exec() == QDialog.Accepted:
-            new_s = dialog.get_shortcut()
-            if new_s:
-                self.claim_shortcut(new_s) # 덮어쓰기 실행
-                g_shorts[g_name] = new_s
-            else:
-                if g_name in g_shorts: del g_shorts[g_name]
-            
-            self.config.set_setting('group_shortcuts', g_shorts)
+        accepted = dialog.exec() == QDialog.Accepted
+        new_s = dialog.get_shortcut()
+        dialog.deleteLater()
+        if accepted:
+            with self.config.batch():
+                if new_s:
+                    self.claim_shortcut(new_s) # 덮어쓰기 실행
+                    g_shorts = self.config.get_setting('group_shortcuts', {})
+                    g_shorts[g_name] = new_s
+                else:
+                    if g_name in g_shorts: del g_shorts[g_name]
+                
+                self.config.set_setting('group_shortcuts', g_shorts)
             self.reload_ui()
 
     def add_new_group(self):
@@ -1619,73 +4395,105 @@ class BifrostWindow(QMainWindow):
         old_name = self.tab_bar.tabText(idx)
         new_name, ok = QInputDialog.getText(self, "이름 변경", "새 이름:", text=old_name)
         if ok and new_name and new_name != old_name:
+            if new_name in self.folder_groups() or new_name in self.catalog_groups():
+                # 그 탭은 폴더/카탈로그 내용만 보여주므로 이 그룹의 앱이 보이지 않게 됨
+                QMessageBox.warning(self, "이름 변경", f"'{new_name}'은(는) 폴더/카탈로그 탭이 쓰는 이름입니다.")
+                return
             self.tab_bar.setTabText(idx, new_name)
             apps = self.config.get_apps()
-            for app in apps:
-                 if app.get('group') == old_name: app['group'] = new_name
-            self.config.set_apps(apps)
-            
-            # 그룹 단축키 이름 업데이트
-            g_shorts = self.config.get_setting('group_shortcuts', {})
-            if old_name in g_shorts:
-                g_shorts[new_name] = g_shorts.pop(old_name)
-            self.config.set_setting('group_shortcuts', g_shorts)
+            with self.config.batch():
+                for i, app in enumerate(apps):
+                    if app.group == old_name:
+                        self.config.update_app(i, app.copy(group=new_name))
+                
+                # 그룹 단축키 이름 업데이트
+                g_shorts = self.config.get_setting('group_shortcuts', {})
+                if old_name in g_shorts:
+                    g_shorts[new_name] = g_shorts.pop(old_name)
+                self.config.set_setting('group_shortcuts', g_shorts)
 
-            order = self.config.get_setting('group_order', [])
-            if old_name in order: order[order.index(old_name)] = new_name
-            self.config.set_setting('group_order', order)
+                order = self.config.get_setting('group_order', [])
+                if old_name in order: order[order.index(old_name)] = new_name
+                self.config.set_setting('group_order', order)
+
+                folder_groups = self.folder_groups()
+                if old_name in folder_groups:
+                    folder_groups = dict(folder_groups)
+                    folder_groups[new_name] = folder_groups.pop(old_name)
+                    self.config.set_setting('folder_groups', folder_groups)
             self.reload_ui()
             
     def delete_group(self, idx):
         group_name = self.tab_bar.tabText(idx)
-        reply = QMessageBox.question(self, "그룹 삭제", f"'{group_name}' 그룹을 삭제하시겠습니까?", QMessageBox.Yes | QMessageBox.No)
+        folder_groups = self.folder_groups()
+        if group_name in folder_groups:
+            question = f"'{group_name}' 폴더 그룹의 연결을 해제하시겠습니까?\n(폴더의 파일은 삭제되지 않습니다)"
+        else:
+            question = f"'{group_name}' 그룹을 삭제하시겠습니까?"
+        reply = QMessageBox.question(self, "그룹 삭제", question, QMessageBox.Yes | QMessageBox.No)
         if reply == QMessageBox.Yes:
             apps = self.config.get_apps()
-            new_apps = [a for a in apps if a.get('group', '홈') != group_name]
-            self.config.set_apps(new_apps)
-            
-            # 그룹 단축키 삭제
-            g_shorts = self.config.get_setting('group_shortcuts', {})
-            if group_name in g_shorts:
-                del g_shorts[group_name]
-            self.config.set_setting('group_shortcuts', g_shorts)
-            
-            order = self.config.get_setting('group_order', [])
-            if group_name in order: order.remove(group_name)
-            self.config.set_setting('group_order', order)
+            with self.config.batch():
+                # 뒤에서부터 삭제해야 앞쪽 인덱스가 유지됨
+                for i in range(len(apps) - 1, -1, -1):
+                    if (apps[i].group or '홈') == group_name:
+                        self.config.remove_app(i)
+                
+                # 그룹 단축키 삭제
+                g_shorts = self.config.get_setting('group_shortcuts', {})
+                if group_name in g_shorts:
+                    del g_shorts[group_name]
+                self.config.set_setting('group_shortcuts', g_shorts)
+                
+                order = self.config.get_setting('group_order', [])
+                if group_name in order: order.remove(group_name)
+                self.config.set_setting('group_order', order)
+
+                if group_name in folder_groups:
+                    folder_groups = dict(folder_groups)
+                    path = folder_groups.pop(group_name)
+                    self.config.set_setting('folder_groups', folder_groups)
+                    if path not in folder_groups.values() and self._folder_listings.pop(path, None) is not None:
+                        self._save_folder_listings()
             self.reload_ui()
 
     def add_new_app_dialog(self, group_name):
+        from bifrost_dialogs import AppEditDialog
         occupied = self.get_all_shortcuts()
         dialog = AppEditDialog(self, current_group=group_name, occupied_shortcuts=occupied)
-        if dialog.exec() == QDialog.Accepted:
-            new_data = dialog.get_data()
-            if new_data.get('shortcut'):
-                self.claim_shortcut(new_data['shortcut']) # 덮어쓰기
-            apps = self.config.get_apps()
-            apps.append(new_data)
-            self.config.set_apps(apps)
+        accepted = dialog.exec() == QDialog.Accepted
+        new_data = dialog.get_data()
+        new_data['group'] = self.personal_group(new_data['group']) # 폴더/카탈로그 탭 이름이면 '홈'
+        dialog.deleteLater()
+        if accepted:
+            with self.config.batch():
+                if new_data.get('shortcut'):
+                    self.claim_shortcut(new_data['shortcut']) # 덮어쓰기
+                self.config.add_app(new_data)
             self.reload_ui()
     def edit_app(self, app_data):
         apps = self.config.get_apps()
         if app_data in apps:
             idx = apps.index(app_data)
             occupied = self.get_all_shortcuts(exclude_app=app_data)
-            dialog = AppEditDialog(self, app_data, occupied_shortcuts=occupied)
-            if dialog.exec() == QDialog.Accepted:
-                new_data = dialog.get_data()
-                if new_data.get('shortcut'):
-                    self.claim_shortcut(new_data['shortcut'])
-                apps[idx] = new_data
-                self.config.set_apps(apps)
+            from bifrost_dialogs import AppEditDialog
+            dialog = AppEditDialog(self, app_data.to_dict(), occupied_shortcuts=occupied)
+            accepted = dialog.exec() == QDialog.Accepted
+            new_data = dialog.get_data()
+            new_data['group'] = self.personal_group(new_data['group']) # 폴더/카탈로그 탭 이름이면 '홈'
+            dialog.deleteLater()
+            if accepted:
+                with self.config.batch():
+                    if new_data.get('shortcut'):
+                        self.claim_shortcut(new_data['shortcut'])
+                    self.config.update_app(idx, new_data)
                 self.reload_ui()
     def delete_app(self, app_data):
         if QMessageBox.question(self, "삭제", "이 앱을 삭제하시겠습니까?", QMessageBox.Yes | QMessageBox.No) == QMessageBox.Yes:
             apps = self.config.get_apps()
             if app_data in apps:
-                del_icon = app_data.get('icon')
-                apps.remove(app_data)
-                self.config.set_apps(apps)
+                del_icon = app_data.icon
+                self.config.remove_app(apps.index(app_data))
                 
                 # 삭제된 앱의 아이콘이 더 이상 사용되지 않으면 삭제
                 if del_icon:
@@ -1696,21 +4504,18 @@ class BifrostWindow(QMainWindow):
         apps = self.config.get_apps()
         if app_data in apps:
             idx = apps.index(app_data)
-            new_app = app_data.copy()
-            new_app['name'] += " (복사)"
-            new_app['shortcut'] = "" # 복사 시 단축키는 제거 (충돌 방지)
-            apps.insert(idx + 1, new_app)
-            self.config.set_apps(apps)
+            # 복사 시 단축키는 제거 (충돌 방지)
+            new_app = app_data.copy(name=app_data.name + " (복사)", shortcut="")
+            self.config.insert_app(idx + 1, new_app)
             self.reload_ui()
     def swap_apps(self, target_app_data, source_btn):
         source_data = source_btn.data
-        if source_data == target_app_data: return
+        if source_data is target_app_data: return
         apps = self.config.get_apps()
         try:
             idx1 = apps.index(source_data)
             idx2 = apps.index(target_app_data)
-            apps[idx1], apps[idx2] = apps[idx2], apps[idx1]
-            self.config.set_apps(apps)
+            self.config.swap_apps(idx1, idx2)
             self.reload_ui()
         except: pass
 
@@ -1718,15 +4523,71 @@ class BifrostWindow(QMainWindow):
         # 탭바나 다른 위젯 위가 아닌 경우 메인메뉴
         menu = QMenu(self)
         
+        theme_menu = menu.addMenu("테마")
+        for theme_name, label in THEME_NAMES.items():
+            action = theme_menu.addAction(label)
+            action.setCheckable(True)
+            action.setChecked(theme_name == ThemeManager.name())
+            action.triggered.connect(partial(self.set_theme, theme_name))
+        menu.addSeparator()
+
+        menu.addAction("폴더 그룹 추가...", self.add_folder_group)
+        from bifrost_catalog import CATALOG_PROVIDERS
+        catalog_menu = menu.addMenu("카탈로그")
+        enabled = self.config.get_setting('catalog_providers', [])
+        for provider_id, cls in CATALOG_PROVIDERS.items():
+            action = catalog_menu.addAction(cls.label)
+            action.setCheckable(True)
+            action.setChecked(provider_id in enabled)
+            action.triggered.connect(partial(self.set_catalog_provider, provider_id))
+        shared_menu = menu.addMenu("공유 카탈로그")
+        shared_menu.addAction("추가...", self.add_shared_catalog)
+        shared_menu.addAction("지금 확인", self.refresh_shared_catalogs)
+        sources = self.config.get_setting('shared_catalogs', [])
+        if sources: shared_menu.addSeparator()
+        for source in sources:
+            action = shared_menu.addAction(source)
+            action.setCheckable(True)
+            action.setChecked(True)
+            action.triggered.connect(partial(self.remove_shared_catalog, source))
+        if self.config.get_setting('hidden_shared_apps', []):
+            shared_menu.addSeparator()
+            shared_menu.addAction("숨긴 항목 다시 보이기", self.unhide_shared_apps)
+        backup_menu = menu.addMenu("백업")
+        backup_menu.aboutToShow.connect(partial(self._fill_backup_menu, backup_menu)) # 열 때만 목록을 읽음
+        menu.addSeparator()
+        
+        action_tray = menu.addAction("트레이에 상주")
+        action_tray.setCheckable(True)
+        action_tray.setChecked(self.tray_icon is not None)
+        action_tray.triggered.connect(self.set_tray_resident)
+        menu.addSeparator()
+
+        menu.addAction("진단 정보", self.show_diagnostics)
         action_visit = menu.addAction("홈페이지 방문")
-        action_visit.triggered.connect(lambda: threading.Thread(target=self.open_homepage, daemon=True).start())
+        action_visit.triggered.connect(lambda: Scheduler.submit_worker(self.open_homepage, priority=PRIORITY_HIGH))
         
         menu.exec(self.mapToGlobal(point))
 
+    def show_diagnostics(self):
+        from bifrost_diagnostics import DiagnosticsDialog
+        dialog = DiagnosticsDialog(self)
+        dialog.show()
+
+    def set_theme(self, theme_name, checked=False):
+        # 위젯을 다시 만들지 않고 팔레트/전역 스타일시트만 교체 후 다시 그림
+        if theme_name == ThemeManager.name(): return
+        ThemeManager.apply(theme_name)
+        IconManager.invalidate_text_icons()
+        for btn in self.stacked_widget.findChildren(AppButton): btn.refresh_theme()
+        for btn in self.stacked_widget.findChildren(AddButton): btn.update()
+        self.config.set_setting('theme', theme_name)
+
     def open_homepage(self):
         try:
             os.startfile("https://github.com/HoneyMocchi/Bifrost")
         except:
+            import subprocess
             subprocess.Popen("start https://github.com/HoneyMocchi/Bifrost", shell=True)
 
 if __name__ == "__main__":
@@ -1751,7 +4612,7 @@ if __name__ == "__main__":
         window.show()
         sys.exit(app.exec())
     except Exception as e:
-        log_error(f"Critical Error in main: {traceback.format_exc()}")
+        log_error(f"Critical Error in main: {traceback.format_exc()}", "main")
         try:
             tmp_app = QApplication.instance() or QApplication(sys.argv)
             QMessageBox.critical(None, "Bifrost Error", f"실행 중 오류가 발생했습니다:\n{e}")
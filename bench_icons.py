@@ -0,0 +1,153 @@
+import argparse
+import json
+import os
+import statistics
+import struct
+import subprocess
+import sys
+import tempfile
+import time
+
+# 형식별 아이콘 디코딩 시간/최대 메모리 비교: 이전 방식(전체 디코딩 -> 128px -> 목표 크기) vs IconManager._decode_icon
+# 메모리는 경우마다 새 프로세스를 띄워, 최대 RSS 기록을 초기화한 뒤(/proc/self/clear_refs) 디코딩 중 최대 RSS 증가분으로 잽니다.
+# (Linux 전용. 다른 플랫폼에서는 n/a)
+DECODE_RUNS = 20
+
+SAMPLES = [
+    # (이름, 형식, 한 변 픽셀)
+    ("PNG 32", 'png', 32),
+    ("PNG 256", 'png', 256),
+    ("PNG 1024", 'png', 1024),
+    ("JPEG 2048", 'jpg', 2048),
+    ("BMP 512", 'bmp', 512),
+    ("ICO 16-256 (6프레임)", 'ico', 256),
+    ("SVG", 'svg', 512),
+]
+ICO_FRAMES = (16, 32, 48, 64, 128, 256)
+
+def _sample_image(n):
+    from PySide6.QtGui import QImage, QPainter, QLinearGradient, QColor
+    from PySide6.QtCore import Qt
+    image = QImage(n, n, QImage.Format_ARGB32)
+    image.fill(Qt.transparent)
+    painter = QPainter(image)
+    gradient = QLinearGradient(0, 0, n, n)
+    gradient.setColorAt(0, QColor("#0A84FF"))
+    gradient.setColorAt(1, QColor("#FF375F"))
+    painter.fillRect(image.rect(), gradient)
+    painter.end()
+    return image
+
+def _png_bytes(image):
+    from PySide6.QtCore import QBuffer, QByteArray, QIODevice
+    data = QByteArray()
+    buf = QBuffer(data)
+    buf.open(QIODevice.WriteOnly)
+    image.save(buf, 'PNG')
+    return bytes(data)
+
+def write_samples(directory):
+    """측정용 파일을 만들고 [(이름, 경로)]를 반환합니다. 이 환경의 Qt가 읽지 못하는 형식은 건너뜀"""
+    from PySide6.QtGui import QImageReader
+    supported = {bytes(f).decode() for f in QImageReader.supportedImageFormats()}
+    samples = []
+    for label, fmt, n in SAMPLES:
+        path = os.path.join(directory, f"sample_{fmt}_{n}.{fmt}")
+        if fmt not in supported: continue
+        if fmt == 'ico':
+            # PNG 프레임을 담은 ICO (Windows 실행 파일/파비콘에 흔한 형태)
+            frames = [_png_bytes(_sample_image(size)) for size in ICO_FRAMES]
+            offset = 6 + 16 * len(frames)
+            header = struct.pack('<HHH', 0, 1, len(frames))
+            for size, data in zip(ICO_FRAMES, frames):
+                header += struct.pack('<BBBBHHII', size % 256, size % 256, 0, 0, 1, 32, len(data), offset)
+                offset += len(data)
+            with open(path, 'wb') as f: f.write(header + b''.join(frames))
+        elif fmt == 'svg':
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(f'<svg xmlns="http://www.w3.org/2000/svg" width="{n}" height="{n}">'
+                        f'<rect width="{n}" height="{n}" rx="{n // 5}" fill="#0A84FF"/>'
+                        f'<circle cx="{n // 2}" cy="{n // 2}" r="{n // 3}" fill="#FF375F"/></svg>')
+        else:
+            _sample_image(n).save(path, fmt.upper(), 90 if fmt == 'jpg' else -1)
+        samples.append((label, path))
+    return samples
+
+def _decode_before(path, size):
+    """이전 IconManager._render_image의 디코딩 (비교용)"""
+    from PySide6.QtGui import QImage
+    from PySide6.QtCore import Qt
+    loaded = QImage(path)
+    if loaded.width() > 128: loaded = loaded.scaled(128, 128, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    return loaded.scaled(size, size, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
+
+def reset_peak_rss():
+    """최대 RSS(VmHWM)를 현재 RSS로 되돌리고 그 값을 반환합니다. 지원하지 않으면 None"""
+    try:
+        with open('/proc/self/clear_refs', 'w') as f: f.write('5')
+        return _proc_status_kb('VmHWM')
+    except OSError:
+        return None
+
+def _proc_status_kb(field):
+    with open('/proc/self/status') as f:
+        for line in f:
+            if line.startswith(field + ':'): return int(line.split()[1])
+    return None
+
+def worker(method, path, size, runs):
+    """새 프로세스에서 한 경우만 측정하고 JSON 한 줄을 출력합니다."""
+    import Bifrost
+    from PySide6.QtGui import QImage
+    decode = Bifrost.IconManager._decode_icon if method == 'after' else _decode_before
+    QImage(1, 1, QImage.Format_ARGB32).fill(0) # 이미지 코드 경로 예열 (기준 RSS에 포함)
+    base_rss = reset_peak_rss()
+    samples, image = [], None
+    for _ in range(runs):
+        start = time.perf_counter()
+        image = decode(path, size)
+        samples.append((time.perf_counter() - start) * 1000)
+    print(json.dumps({
+        'ms': statistics.median(samples),
+        'peak_kb': None if base_rss is None else _proc_status_kb('VmHWM') - base_rss,
+        'size': [image.width(), image.height()],
+    }))
+
+def run_case(method, path, size, runs, env):
+    result = subprocess.run([sys.executable, os.path.abspath(__file__), '--worker', method, path,
+                             '--size', str(size), '--runs', str(runs)], env=env, capture_output=True, text=True)
+    if result.returncode != 0:
+        print(result.stderr)
+        raise SystemExit(f"측정 실패: {method} {path}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+def bench(args):
+    import Bifrost
+    size = round(Bifrost.ICON_SIZE * args.dpr)
+    env = dict(os.environ)
+    with tempfile.TemporaryDirectory() as directory:
+        samples = write_samples(directory)
+        print(f"--- 아이콘 디코딩 비교 (목표 {size}px, {args.runs}회 중앙값, 최대 RSS 증가분) ---")
+        print(f"  {'형식':<20} {'이전 ms':>9} {'현재 ms':>9} {'이전 KB':>9} {'현재 KB':>9}  결과 크기")
+        for label, path in samples:
+            before = run_case('before', path, size, args.runs, env)
+            after = run_case('after', path, size, args.runs, env)
+            kb = lambda r: f"{r['peak_kb']:9d}" if r['peak_kb'] is not None else f"{'n/a':>9}"
+            print(f"  {label:<20} {before['ms']:9.2f} {after['ms']:9.2f} {kb(before)} {kb(after)}  "
+                  f"{before['size'][0]}x{before['size'][1]} -> {after['size'][0]}x{after['size'][1]}")
+    return 0
+
+if __name__ == '__main__':
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    if not os.environ.get('LOCALAPPDATA'): os.environ['LOCALAPPDATA'] = tempfile.mkdtemp(prefix='bifrost_bench_')
+    parser = argparse.ArgumentParser(description="Bifrost 아이콘 디코딩 형식별 시간/메모리 비교")
+    parser.add_argument('--runs', type=int, default=DECODE_RUNS)
+    parser.add_argument('--dpr', type=float, default=1.0, help="화면 배율 (목표 크기 = ICON_SIZE x 배율)")
+    parser.add_argument('--worker', nargs=2, metavar=('METHOD', 'PATH'), help=argparse.SUPPRESS)
+    parser.add_argument('--size', type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.worker:
+        worker(args.worker[0], args.worker[1], args.size, args.runs)
+        sys.exit(0)
+    sys.exit(bench(args))
@@ -0,0 +1,91 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+# 명령줄 모드(`--list`)의 전체 실행 시간(인터프리터 시작 포함) 상한. 측정 환경에 따라 --cli-budget-ms로 조정
+CLI_BUDGET_MS = 100
+
+# `python Bifrost.py`는 스크립트를 매번 컴파일하므로(수십 ms), 배포판(exe)처럼 컴파일된 코드를 쓰도록 -m으로 실행
+CLI_COMMAND = ['-m', 'Bifrost', '--list']
+
+# 창 모드: 창을 한 번 그린 직후 종료 (화면 없이 offscreen)
+GUI_SNIPPET = """
+import sys
+from PySide6.QtWidgets import QApplication
+import Bifrost
+app = QApplication(sys.argv[:1])
+window = Bifrost.BifrostWindow()
+window.show()
+app.processEvents()
+"""
+
+def write_config(appdata, n_apps, n_groups):
+    """측정용 설정 (실제 사용자 설정을 건드리지 않도록 임시 LOCALAPPDATA에)"""
+    groups = [f"그룹{i}" for i in range(n_groups)]
+    apps = [{"name": f"앱{i}", "group": groups[i % n_groups], "action": f"C:\\Tools\\app{i}.exe"} for i in range(n_apps)]
+    os.makedirs(os.path.join(appdata, 'Bifrost'), exist_ok=True)
+    with open(os.path.join(appdata, 'Bifrost', 'config.json'), 'w', encoding='utf-8') as f:
+        json.dump({"settings": {"group_order": groups}, "apps": apps}, f, ensure_ascii=False)
+
+def time_runs(cmd, env, cwd, runs):
+    """첫 실행(.pyc 생성, 설정 캐시 작성)은 버리고 나머지의 벽시계 시간(ms) 목록"""
+    subprocess.run(cmd, env=env, cwd=cwd, capture_output=True)
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = subprocess.run(cmd, env=env, cwd=cwd, capture_output=True, text=True)
+        samples.append((time.perf_counter() - start) * 1000)
+        if result.returncode != 0:
+            print(result.stderr)
+            raise SystemExit(f"실행 실패: {' '.join(cmd)}")
+    return samples
+
+def bench(args):
+    here = os.path.dirname(os.path.abspath(__file__))
+    with tempfile.TemporaryDirectory() as appdata:
+        write_config(appdata, args.apps, args.groups)
+        env = dict(os.environ)
+        env['LOCALAPPDATA'] = appdata
+        env.setdefault('QT_QPA_PLATFORM', 'offscreen')
+        env.pop('BIFROST_PROFILE', None)
+        env.pop('BIFROST_TRACEMALLOC', None)
+        env.pop('PYTHONDONTWRITEBYTECODE', None) # 첫 실행에서 .pyc를 만들어 두고 재사용 (배포판과 같은 조건)
+
+        print(f"--- Bifrost 시작 시간 비교 (앱 {args.apps}개, 그룹 {args.groups}개, {args.runs}회 중앙값) ---")
+        results = {
+            "인터프리터": time_runs([sys.executable, '-c', 'pass'], env, here, args.runs),
+            "명령줄 --list": time_runs([sys.executable] + CLI_COMMAND, env, here, args.runs),
+            "창 모드 첫 화면": time_runs([sys.executable, '-c', GUI_SNIPPET], env, here, args.runs),
+        }
+        for label, samples in results.items():
+            print(f"  {label:<12} {statistics.median(samples):8.1f} ms  (최소 {min(samples):.1f}, 최대 {max(samples):.1f})")
+        cli_ms = statistics.median(results["명령줄 --list"])
+        gui_ms = statistics.median(results["창 모드 첫 화면"])
+        print(f"  명령줄이 창 모드보다 {gui_ms / cli_ms:.1f}배 빠름")
+
+        # 명령줄 모드가 PySide6를 불러오면 안 됨
+        trace = subprocess.run([sys.executable, '-X', 'importtime'] + CLI_COMMAND,
+                               env=env, cwd=here, capture_output=True, text=True)
+    failed = False
+    if 'PySide6' in trace.stderr:
+        failed = True
+        print("실패: 명령줄 모드에서 PySide6를 불러왔습니다.")
+    if cli_ms > args.cli_budget_ms:
+        failed = True
+        print(f"실패: 명령줄 모드가 예산을 넘었습니다 ({cli_ms:.1f} ms > {args.cli_budget_ms} ms)")
+    if not failed: print("통과")
+    return 1 if failed else 0
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Bifrost 명령줄/창 모드 시작 시간 비교")
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--apps', type=int, default=120)
+    parser.add_argument('--groups', type=int, default=6)
+    parser.add_argument('--cli-budget-ms', type=float, default=CLI_BUDGET_MS)
+    args = parser.parse_args()
+    sys.exit(bench(args))
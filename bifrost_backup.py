@@ -0,0 +1,249 @@
+# --- [백업] ---
+# 설정과 아이콘을 내용 주소(blake2b) 저장소에 버전별로 보관합니다. (처음 백업할 때 불러옴)
+# 같은 내용은 objects/에 한 번만 저장하고, 버전(versions/*.json)은 설정 해시와 아이콘 이름 -> 해시 목록만 가집니다.
+# 아이콘은 (크기, 수정 시각)이 지난번과 같으면 해시를 다시 계산하지 않으므로 백업 시간은 바뀐 양에 비례합니다.
+# 백업/복원은 작업자 스레드(Scheduler)에서 실행합니다.
+import os
+import json
+import time
+import hashlib
+import threading
+
+from Bifrost import (APPDATA_DIR, ICON_DIR, ConfigManager, Metrics, log_error, get_logger, _write_file_atomic)
+
+BACKUP_DIR = os.path.join(APPDATA_DIR, 'backups')
+BACKUP_OBJECTS_DIR = os.path.join(BACKUP_DIR, 'objects')
+BACKUP_VERSIONS_DIR = os.path.join(BACKUP_DIR, 'versions')
+BACKUP_STATE_FILE = os.path.join(BACKUP_DIR, 'state.json') # 아이콘별 (크기, 수정 시각, 해시) 캐시
+BACKUP_FORMAT = 1
+BACKUP_KEEP_RECENT = 20           # 최근 버전은 모두 보관
+BACKUP_KEEP_DAILY_DAYS = 30       # 그보다 오래된 버전은 이 기간까지 하루에 하나씩
+BACKUP_VOLATILE_SETTINGS = ('window_geometry',) # 자주 바뀌고 되돌릴 필요가 없는 설정 (백업 제외, 복원 시 현재 값 유지)
+BACKUP_SWEEP_AFTER = 10           # 지운 버전이 이만큼 쌓이면 그때 한 번 객체 저장소를 훑어 정리
+
+def _digest(data):
+    return hashlib.blake2b(data, digest_size=20).hexdigest()
+
+class BackupStore:
+    _lock = threading.Lock()   # 백업/복원/정리는 한 번에 하나씩
+    _last_revision = None      # 마지막으로 백업한 ConfigManager.revision (이 프로세스 안에서)
+    _latest = None             # (버전 id, 매니페스트) 마지막으로 읽거나 만든 최신 버전
+
+    # --- 객체 저장소 ---
+    @staticmethod
+    def _object_path(digest):
+        return os.path.join(BACKUP_OBJECTS_DIR, digest[:2], digest)
+
+    @staticmethod
+    def _store(data, digest=None):
+        """내용을 저장하고 해시를 반환합니다. 이미 있으면 쓰지 않음"""
+        digest = digest or _digest(data)
+        path = BackupStore._object_path(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            _write_file_atomic(path, data)
+            Metrics.incr("backup.objects_written")
+            Metrics.incr("backup.bytes_written", len(data))
+        return digest
+
+    @staticmethod
+    def _load(digest):
+        with open(BackupStore._object_path(digest), 'rb') as f: data = f.read()
+        if _digest(data) != digest: raise ValueError(f"backup object {digest} is corrupted")
+        return data
+
+    # --- 버전 ---
+    @staticmethod
+    def version_ids():
+        """버전 id 목록 최신순. id는 만든 시각(YYYYmmdd-HHMMSSmmm) + 내용 해시이므로 파일 이름만으로 정렬 (매니페스트를 읽지 않음)"""
+        try: names = [n for n in os.listdir(BACKUP_VERSIONS_DIR) if n.endswith('.json')]
+        except OSError: return []
+        return sorted((name[:-5] for name in names), reverse=True)
+
+    @staticmethod
+    def _read_manifest(version_id):
+        """매니페스트 또는 None (읽을 수 없거나 다른 형식)"""
+        try:
+            with open(os.path.join(BACKUP_VERSIONS_DIR, version_id + '.json'), 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError) as e:
+            log_error(f"Unreadable backup manifest {version_id}: {e}", "backup")
+            return None
+        return manifest if manifest.get('format') == BACKUP_FORMAT else None
+
+    @staticmethod
+    def list_versions(limit=None):
+        """[(버전 id, 매니페스트)] 최신순. limit을 주면 최신 limit개의 매니페스트만 읽음"""
+        versions = []
+        for version_id in BackupStore.version_ids()[:limit]:
+            manifest = BackupStore._read_manifest(version_id)
+            if manifest is not None: versions.append((version_id, manifest))
+        return versions
+
+    @staticmethod
+    def _latest_version(ids):
+        """최신 (버전 id, 매니페스트). 이 프로세스에서 이미 읽거나 만든 버전이면 다시 읽지 않음"""
+        for version_id in ids:
+            if BackupStore._latest is not None and BackupStore._latest[0] == version_id: return BackupStore._latest
+            manifest = BackupStore._read_manifest(version_id)
+            if manifest is not None:
+                BackupStore._latest = (version_id, manifest)
+                return BackupStore._latest
+        return None
+
+    @staticmethod
+    def _load_state():
+        try:
+            with open(BACKUP_STATE_FILE, 'r', encoding='utf-8') as f: state = json.load(f)
+            if state.get('format') == BACKUP_FORMAT: return state
+        except (OSError, ValueError):
+            pass
+        return {'format': BACKUP_FORMAT, 'icons': {}}
+
+    @staticmethod
+    def _scan_icons(state):
+        """{아이콘 이름: 해시}. 크기/수정 시각이 캐시와 같은 파일은 읽지 않음"""
+        cached, icons, fresh = state['icons'], {}, {}
+        try: entries = list(os.scandir(ICON_DIR))
+        except OSError: entries = []
+        for entry in entries:
+            if not entry.is_file() or entry.name.endswith('.tmp'): continue
+            try: st = entry.stat()
+            except OSError: continue
+            hit = cached.get(entry.name)
+            if hit and hit[0] == st.st_size and hit[1] == st.st_mtime_ns:
+                digest = hit[2]
+            else:
+                try:
+                    with open(entry.path, 'rb') as f: data = f.read()
+                except OSError:
+                    continue
+                digest = BackupStore._store(data)
+                Metrics.incr("backup.icons_hashed")
+            icons[entry.name] = digest
+            fresh[entry.name] = [st.st_size, st.st_mtime_ns, digest]
+        state['icons'] = fresh
+        return icons
+
+    @staticmethod
+    def backup(reason="auto"):
+        """바뀐 것이 있으면 새 버전을 만들고 그 id를 반환합니다. 없으면 None (작업자 스레드)"""
+        with BackupStore._lock:
+            return BackupStore._backup(reason)
+
+    @staticmethod
+    def _backup(reason):
+        start = time.perf_counter()
+        config = ConfigManager()
+        revision = config.revision
+        ids = BackupStore.version_ids()
+        latest = BackupStore._latest_version(ids)
+        latest = latest[1] if latest else None
+        state = BackupStore._load_state()
+
+        if latest is not None and revision == BackupStore._last_revision:
+            config_digest = latest['config'] # 이 프로세스에서 설정이 바뀌지 않았으면 직렬화 생략
+        else:
+            config_digest = BackupStore._store(config.dumps(BACKUP_VOLATILE_SETTINGS))
+        cached = state['icons']
+        icons = BackupStore._scan_icons(state)
+        if state['icons'] != cached:
+            os.makedirs(BACKUP_DIR, exist_ok=True)
+            _write_file_atomic(BACKUP_STATE_FILE, json.dumps(state).encode('utf-8'))
+        BackupStore._last_revision = revision
+
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        Metrics.observe("backup.run_ms", elapsed_ms)
+        if latest is not None and latest['config'] == config_digest and latest['icons'] == icons:
+            return None
+
+        now = time.time()
+        content_digest = _digest(json.dumps([config_digest, icons], sort_keys=True).encode('utf-8'))
+        # 밀리초까지 넣어 같은 초에 만든 버전도 이름순 = 만든 순서 (version_ids가 매니페스트 없이 정렬)
+        version_id = time.strftime('%Y%m%d-%H%M%S', time.localtime(now)) + f"{int(now * 1000) % 1000:03d}-{content_digest[:8]}"
+        manifest = {'format': BACKUP_FORMAT, 'created': now, 'reason': reason,
+                    'apps': len(config.get_apps()), 'config': config_digest, 'icons': icons}
+        os.makedirs(BACKUP_VERSIONS_DIR, exist_ok=True)
+        _write_file_atomic(os.path.join(BACKUP_VERSIONS_DIR, version_id + '.json'),
+                           json.dumps(manifest, ensure_ascii=False).encode('utf-8'))
+        Metrics.incr("backup.versions")
+        get_logger("backup").info("Backup %s (%s, %d icons) in %.1f ms", version_id, reason, len(icons), elapsed_ms)
+        BackupStore._latest = (version_id, manifest)
+        BackupStore._prune([version_id] + ids, state)
+        return version_id
+
+    # --- 보관 정책 ---
+    @staticmethod
+    def _prune(ids, state):
+        """
+        최근 BACKUP_KEEP_RECENT개 + BACKUP_KEEP_DAILY_DAYS일 동안 하루에 하나(그날의 마지막)만 남깁니다. (ids는 최신순)
+        버전 선택은 id(만든 시각)만으로 하고, 어느 버전도 가리키지 않는 객체는 지운 버전이
+        BACKUP_SWEEP_AFTER개 쌓였을 때만 훑어서 지웁니다. (매 백업마다 저장소 전체를 훑지 않도록)
+        """
+        cutoff = time.strftime('%Y%m%d', time.localtime(time.time() - BACKUP_KEEP_DAILY_DAYS * 86400))
+        keep, days, removed_versions = [], set(), 0
+        for i, version_id in enumerate(ids):
+            day = version_id[:8]
+            if i < BACKUP_KEEP_RECENT or (day >= cutoff and day not in days):
+                keep.append(version_id)
+                days.add(day)
+                continue
+            try:
+                os.remove(os.path.join(BACKUP_VERSIONS_DIR, version_id + '.json'))
+                removed_versions += 1
+            except OSError as e: log_error(f"Backup prune failed ({version_id}): {e}", "backup")
+        if not removed_versions: return
+        state['pruned'] = state.get('pruned', 0) + removed_versions
+        if state['pruned'] >= BACKUP_SWEEP_AFTER: BackupStore._sweep(keep, state)
+        _write_file_atomic(BACKUP_STATE_FILE, json.dumps(state).encode('utf-8'))
+
+    @staticmethod
+    def _sweep(keep, state):
+        """남은 버전이 가리키지 않는 객체를 지웁니다. (표시 후 정리)"""
+        manifests = [m for m in map(BackupStore._read_manifest, keep) if m is not None]
+        live = {m['config'] for m in manifests} | {d for m in manifests for d in m['icons'].values()}
+        removed = 0
+        for root, _, files in os.walk(BACKUP_OBJECTS_DIR):
+            for name in files:
+                if name in live: continue
+                try:
+                    os.remove(os.path.join(root, name))
+                    removed += 1
+                except OSError:
+                    pass
+        state['pruned'] = 0
+        Metrics.incr("backup.objects_pruned", removed)
+        Metrics.incr("backup.sweeps")
+
+    # --- 복원 ---
+    @staticmethod
+    def restore(version_id):
+        """
+        version_id 버전으로 설정과 아이콘을 되돌리고 내용이 바뀐 아이콘 이름 목록을 반환합니다. (작업자 스레드)
+        되돌리기 전에 현재 상태를 먼저 백업하므로 복원도 다시 되돌릴 수 있습니다.
+        그 버전 이후에 새로 생긴 아이콘 파일은 지우지 않습니다.
+        """
+        with BackupStore._lock:
+            manifest = BackupStore._read_manifest(version_id) if version_id in BackupStore.version_ids() else None
+            if manifest is None: raise ValueError(f"backup version {version_id} not found")
+            BackupStore._backup("before-restore")
+            current = BackupStore._load_state()['icons']
+            # 필요한 객체를 먼저 모두 읽어 확인 (도중에 실패해서 반쯤 복원되는 일이 없도록)
+            data = json.loads(BackupStore._load(manifest['config']).decode('utf-8'))
+            changed = {name: BackupStore._load(digest) for name, digest in manifest['icons'].items()
+                       if current.get(name, (None, None, None))[2] != digest}
+
+            os.makedirs(ICON_DIR, exist_ok=True)
+            for name, content in changed.items():
+                _write_file_atomic(os.path.join(ICON_DIR, name), content)
+
+            config = ConfigManager()
+            settings = data.setdefault('settings', {})
+            for key in BACKUP_VOLATILE_SETTINGS:
+                value = config.get_setting(key)
+                if value is not None: settings[key] = value
+            config.restore(data)
+            BackupStore._last_revision = None
+            Metrics.incr("backup.restores")
+            get_logger("backup").info("Restored backup %s (%d icons changed)", version_id, len(changed))
+            return list(changed)
@@ -0,0 +1,303 @@
+# --- [카탈로그 제공자] ---
+# 설정에서 켠 제공자가 있을 때만 불러옵니다. 색인은 작업 스레드에서 만들고,
+# 원본 파일의 수정 시각이 바뀐 것만 다시 읽어 AppData/catalog/<id>.json에 보관합니다.
+import os
+import sys
+import json
+import glob
+import shutil
+import tempfile
+import threading
+
+from PySide6.QtCore import QObject, Signal
+
+from Bifrost import APPDATA_DIR, Metrics, Scheduler, PRIORITY_IDLE, log_error, get_logger, _write_file_atomic
+
+CATALOG_DIR = os.path.join(APPDATA_DIR, 'catalog')
+CATALOG_INDEX_FORMAT = 1
+
+class CatalogProvider:
+    """
+    읽기 전용 항목 공급자의 기본형. 원본 파일(sources) 단위로 색인하며,
+    stamp가 바뀐 파일만 parse로 다시 읽습니다. 항목은 (name, action, icon) 튜플입니다.
+    """
+    id = None
+    label = None
+
+    def sources(self):
+        """색인할 원본 파일 경로 목록 (앞쪽이 우선)"""
+        return []
+
+    def stamp(self, path):
+        return os.stat(path).st_mtime_ns
+
+    def parse(self, path):
+        return []
+
+    def collect(self, index):
+        """원본별 색인을 합쳐 화면에 보여줄 항목 목록을 만듭니다."""
+        entries = []
+        for path in index:
+            entries.extend(index[path]['entries'])
+        return entries
+
+# --- XDG .desktop 애플리케이션 ---
+DESKTOP_FIELD_CODES = ('%f', '%F', '%u', '%U', '%d', '%D', '%n', '%N', '%i', '%c', '%k', '%v', '%m')
+DESKTOP_ICON_SIZES = ('48x48', '64x64', '128x128', '256x256', '32x32')
+
+class DesktopEntryProvider(CatalogProvider):
+    """XDG 데이터 디렉터리의 applications/*.desktop (사용자 디렉터리가 시스템 항목을 덮어씀)"""
+    id = 'xdg_apps'
+    label = '시스템 앱'
+
+    @staticmethod
+    def data_dirs():
+        home = os.environ.get('XDG_DATA_HOME') or os.path.join(os.path.expanduser('~'), '.local', 'share')
+        dirs = [home] + (os.environ.get('XDG_DATA_DIRS') or '/usr/local/share:/usr/share').split(':')
+        dirs += [os.path.join(home, 'flatpak', 'exports', 'share'), '/var/lib/flatpak/exports/share']
+        seen, result = set(), []
+        for d in dirs:
+            if d and d not in seen:
+                seen.add(d)
+                result.append(d)
+        return result
+
+    def sources(self):
+        paths = []
+        for data_dir in self.data_dirs():
+            apps_dir = os.path.join(data_dir, 'applications')
+            for root, _, files in os.walk(apps_dir):
+                paths.extend(os.path.join(root, f) for f in sorted(files) if f.endswith('.desktop'))
+        return paths
+
+    @staticmethod
+    def desktop_id(path):
+        # 데스크톱 파일 ID: applications/ 아래 상대 경로의 '/'를 '-'로 바꾼 것
+        rel = path.split(os.sep + 'applications' + os.sep, 1)[-1]
+        return rel.replace(os.sep, '-')
+
+    @staticmethod
+    def _localized(fields, key):
+        lang = (os.environ.get('LC_ALL') or os.environ.get('LC_MESSAGES') or os.environ.get('LANG') or '').split('.')[0]
+        for candidate in (lang, lang.split('_')[0]):
+            if candidate and f"{key}[{candidate}]" in fields: return fields[f"{key}[{candidate}]"]
+        return fields.get(key)
+
+    @staticmethod
+    def _exec_command(value):
+        for code in DESKTOP_FIELD_CODES: value = value.replace(code, '')
+        return ' '.join(value.replace('%%', '%').split())
+
+    @staticmethod
+    def _resolve_icon(name):
+        """테마 아이콘 이름을 hicolor/pixmaps의 실제 파일 경로로 바꿉니다 (작업 스레드에서만 호출)"""
+        if not name: return None
+        if os.path.isabs(name): return name if os.path.exists(name) else None
+        for data_dir in DesktopEntryProvider.data_dirs():
+            for size in DESKTOP_ICON_SIZES:
+                path = os.path.join(data_dir, 'icons', 'hicolor', size, 'apps', name + '.png')
+                if os.path.exists(path): return path
+            path = os.path.join(data_dir, 'pixmaps', name + '.png')
+            if os.path.exists(path): return path
+        return None
+
+    def parse(self, path):
+        fields, in_entry = {}, False
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith('#'): continue
+                if line.startswith('['):
+                    if in_entry: break # [Desktop Action ...] 등 다른 그룹은 무시
+                    in_entry = line == '[Desktop Entry]'
+                    continue
+                if in_entry and '=' in line:
+                    key, value = line.split('=', 1)
+                    fields[key.strip()] = value.strip()
+        # Hidden/NoDisplay 항목도 빈 목록으로 색인해야 같은 ID의 시스템 항목을 가림
+        if fields.get('Type') != 'Application' or not fields.get('Exec'): return []
+        if fields.get('Hidden') == 'true' or fields.get('NoDisplay') == 'true': return []
+        name = self._localized(fields, 'Name')
+        if not name: return []
+        return [(name, self._exec_command(fields['Exec']), self._resolve_icon(fields.get('Icon')))]
+
+    def collect(self, index):
+        entries, seen = [], set()
+        for path in index:
+            did = self.desktop_id(path)
+            if did in seen: continue
+            seen.add(did)
+            entries.extend(index[path]['entries'])
+        return entries
+
+# --- 브라우저 북마크 ---
+class BookmarkProvider(CatalogProvider):
+    """Chromium 계열(Bookmarks JSON)과 Firefox(places.sqlite) 북마크"""
+    id = 'bookmarks'
+    label = '북마크'
+
+    @staticmethod
+    def chromium_roots():
+        if sys.platform == 'win32':
+            base = os.getenv('LOCALAPPDATA') or ''
+            names = [('Google', 'Chrome'), ('Microsoft', 'Edge'), ('BraveSoftware', 'Brave-Browser'), ('Chromium',)]
+            return [os.path.join(base, *n, 'User Data') for n in names]
+        config = os.environ.get('XDG_CONFIG_HOME') or os.path.join(os.path.expanduser('~'), '.config')
+        names = ['google-chrome', 'chromium', 'microsoft-edge', os.path.join('BraveSoftware', 'Brave-Browser')]
+        return [os.path.join(config, n) for n in names]
+
+    @staticmethod
+    def firefox_roots():
+        if sys.platform == 'win32':
+            return [os.path.join(os.getenv('APPDATA') or '', 'Mozilla', 'Firefox', 'Profiles')]
+        return [os.path.join(os.path.expanduser('~'), '.mozilla', 'firefox')]
+
+    def sources(self):
+        paths = []
+        for root in self.chromium_roots():
+            paths.extend(sorted(glob.glob(os.path.join(glob.escape(root), '*', 'Bookmarks'))))
+        for root in self.firefox_roots():
+            paths.extend(sorted(glob.glob(os.path.join(glob.escape(root), '*', 'places.sqlite'))))
+        return paths
+
+    def stamp(self, path):
+        # Firefox는 변경을 먼저 -wal 파일에 쓰므로 둘 중 최신 시각을 사용
+        stamp = os.stat(path).st_mtime_ns
+        try: stamp = max(stamp, os.stat(path + '-wal').st_mtime_ns)
+        except OSError: pass
+        return stamp
+
+    def parse(self, path):
+        if path.endswith('places.sqlite'): return self._parse_firefox(path)
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        entries = []
+        stack = list(data.get('roots', {}).values())
+        while stack:
+            node = stack.pop()
+            if not isinstance(node, dict): continue
+            if node.get('type') == 'url' and node.get('url', '').startswith(('http://', 'https://')):
+                entries.append((node.get('name') or node['url'], node['url'], None))
+            stack.extend(node.get('children', []))
+        return entries
+
+    @staticmethod
+    def _parse_firefox(path):
+        import sqlite3
+        # 브라우저가 실행 중이면 DB가 잠겨 있으므로 -wal과 함께 복사본에서 읽음
+        with tempfile.TemporaryDirectory() as tmp:
+            copy_path = os.path.join(tmp, 'places.sqlite')
+            shutil.copy2(path, copy_path)
+            if os.path.exists(path + '-wal'): shutil.copy2(path + '-wal', copy_path + '-wal')
+            conn = sqlite3.connect(copy_path)
+            try:
+                rows = conn.execute(
+                    "SELECT b.title, p.url FROM moz_bookmarks b JOIN moz_places p ON b.fk = p.id "
+                    "WHERE b.type = 1 AND (p.url LIKE 'http://%' OR p.url LIKE 'https://%')").fetchall()
+            finally:
+                conn.close()
+        return [(title or url, url, None) for title, url in rows]
+
+# 제공자 등록부: id -> 클래스 (새 제공자는 register_provider로 추가)
+CATALOG_PROVIDERS = {}
+
+def register_provider(cls):
+    CATALOG_PROVIDERS[cls.id] = cls
+    return cls
+
+register_provider(DesktopEntryProvider)
+register_provider(BookmarkProvider)
+
+class CatalogIndexer(QObject):
+    """
+    제공자별 색인을 작업 스레드에서 불러오고 갱신합니다.
+    저장된 색인을 먼저 알리고, 원본을 점검해 바뀐 것이 있으면 한 번 더 알립니다.
+    """
+    updated = Signal(str, list) # provider id, [(name, action, icon)] 이름순
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._indexes = {} # provider id -> {path: {"stamp": int, "entries": [...]}}
+        self._lock = threading.Lock()
+        self._running = False
+        self._requested = None
+
+    def refresh(self, provider_ids):
+        """진행 중이면 끝난 뒤 마지막 요청으로 한 번 더 실행합니다."""
+        with self._lock:
+            if self._running:
+                self._requested = list(provider_ids)
+                return
+            self._running = True
+        Scheduler.submit_worker(self._run, list(provider_ids), priority=PRIORITY_IDLE, name="catalog_index")
+
+    @staticmethod
+    def _index_path(provider_id):
+        return os.path.join(CATALOG_DIR, f"{provider_id}.json")
+
+    def _load(self, provider_id):
+        try:
+            with open(self._index_path(provider_id), 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('format') != CATALOG_INDEX_FORMAT: return {}
+            return {path: {'stamp': src['stamp'], 'entries': [tuple(e) for e in src['entries']]}
+                    for path, src in data['sources'].items()}
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            log_error(f"Catalog index ignored ({provider_id}): {e}", "catalog")
+            return {}
+
+    def _save(self, provider_id, index):
+        try:
+            os.makedirs(CATALOG_DIR, exist_ok=True)
+            data = json.dumps({'format': CATALOG_INDEX_FORMAT, 'sources': index}, ensure_ascii=False)
+            _write_file_atomic(self._index_path(provider_id), data.encode('utf-8'))
+        except Exception as e:
+            log_error(f"Catalog index save failed ({provider_id}): {e}", "catalog")
+
+    def _emit(self, provider, index):
+        entries = sorted(provider.collect(index), key=lambda e: e[0].casefold())
+        Metrics.set_gauge(f"catalog.entries[{provider.id}]", len(entries))
+        self.updated.emit(provider.id, entries)
+
+    def _refresh_provider(self, provider):
+        index = self._indexes.get(provider.id)
+        if index is None:
+            index = self._indexes[provider.id] = self._load(provider.id)
+            if index: self._emit(provider, index) # 저장된 색인으로 먼저 표시
+
+        with Metrics.timed("catalog.index_ms"):
+            fresh, parsed = {}, 0
+            for path in provider.sources():
+                try:
+                    stamp = provider.stamp(path)
+                    known = index.get(path)
+                    if known is not None and known['stamp'] == stamp:
+                        fresh[path] = known
+                        continue
+                    fresh[path] = {'stamp': stamp, 'entries': provider.parse(path)}
+                    parsed += 1
+                except Exception as e:
+                    get_logger("catalog").warning("Catalog source skipped (%s): %s", path, e)
+        Metrics.incr("catalog.parsed_sources", parsed)
+        # 다시 읽은 원본이 없고 원본 목록(순서 포함)도 같으면 변경 없음
+        if not parsed and list(fresh) == list(index): return
+        self._indexes[provider.id] = fresh
+        self._save(provider.id, fresh)
+        self._emit(provider, fresh)
+
+    def _run(self, provider_ids):
+        while True:
+            for provider_id in provider_ids:
+                cls = CATALOG_PROVIDERS.get(provider_id)
+                if cls is None: continue
+                try:
+                    self._refresh_provider(cls())
+                except Exception as e:
+                    log_error(f"Catalog indexing failed ({provider_id}): {e}", "catalog")
+            with self._lock:
+                provider_ids, self._requested = self._requested, None
+                if provider_ids is None:
+                    self._running = False
+                    return
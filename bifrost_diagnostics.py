@@ -0,0 +1,101 @@
+# --- [진단 정보] ---
+# 메인 컨텍스트 메뉴 > 진단 정보에서 처음 열 때 불러옵니다.
+import sys
+import os
+import json
+import time
+
+from PySide6.QtWidgets import (QApplication, QDialog, QVBoxLayout, QHBoxLayout, QPushButton,
+                               QPlainTextEdit, QFileDialog, QMessageBox)
+from PySide6.QtCore import Qt, QTimer
+from PySide6.QtGui import QFontDatabase
+
+from Bifrost import VERSION, APPDATA_DIR, Metrics, IconManager, ConfigManager, log_error
+
+class DiagnosticsDialog(QDialog):
+    """실시간 성능 지표 보기 + JSON 스냅샷 내보내기 (메인 컨텍스트 메뉴 > 진단 정보)"""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("진단 정보")
+        self.resize(520, 560)
+        self.setAttribute(Qt.WA_DeleteOnClose)
+
+        layout = QVBoxLayout(self)
+        self.view = QPlainTextEdit()
+        self.view.setReadOnly(True)
+        self.view.setLineWrapMode(QPlainTextEdit.NoWrap)
+        self.view.setFont(QFontDatabase.systemFont(QFontDatabase.FixedFont))
+        layout.addWidget(self.view)
+
+        btn_layout = QHBoxLayout()
+        btn_reset = QPushButton("초기화")
+        btn_reset.clicked.connect(self.reset_metrics)
+        btn_export = QPushButton("JSON 내보내기")
+        btn_export.setObjectName("PrimaryButton")
+        btn_export.clicked.connect(self.export_json)
+        btn_close = QPushButton("닫기")
+        btn_close.clicked.connect(self.close)
+        btn_layout.addWidget(btn_reset)
+        btn_layout.addStretch()
+        btn_layout.addWidget(btn_export)
+        btn_layout.addWidget(btn_close)
+        layout.addLayout(btn_layout)
+
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.refresh)
+        self.timer.start(1000)
+        self.refresh()
+
+    @staticmethod
+    def collect():
+        """지표 스냅샷 + GUI 스레드에서만 셀 수 있는 위젯/픽스맵 수"""
+        pixmap_count, pixmap_bytes = IconManager.cache_stats()
+        Metrics.set_gauge("ui.widgets", len(QApplication.allWidgets()))
+        Metrics.set_gauge("icons.cached_pixmaps", pixmap_count)
+        Metrics.set_gauge("icons.cached_bytes", pixmap_bytes)
+        Metrics.set_gauge("icons.pending_jobs", len(IconManager._pending))
+        snapshot = Metrics.snapshot()
+        snapshot["meta"] = {
+            "version": VERSION,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "platform": sys.platform,
+            "python": sys.version.split()[0],
+            "apps": len(ConfigManager().get_apps()),
+        }
+        return snapshot
+
+    def refresh(self):
+        snapshot = self.collect()
+        lines = ["[Counters]"]
+        for name, value in sorted(snapshot["counters"].items()):
+            lines.append(f"  {name:<36} {value:>12,}")
+        lines.append("")
+        lines.append("[Gauges]")
+        for name, value in sorted(snapshot["gauges"].items()):
+            lines.append(f"  {name:<36} {value:>12}")
+        lines.append("")
+        lines.append("[Latency (ms)]               count     avg     p50     p95     max")
+        for name, h in sorted(snapshot["histograms"].items()):
+            lines.append(f"  {name:<24} {h['count']:>8} {h['avg_ms'] or 0:>7.1f} {h['p50_ms'] or 0:>7} "
+                         f"{h['p95_ms'] or 0:>7} {h['max_ms'] or 0:>7.1f}")
+            peak = max(h["buckets"].values()) or 1
+            for label, count in h["buckets"].items():
+                if count: lines.append(f"      {label:>7} {'#' * max(1, count * 30 // peak)} {count}")
+        scroll_pos = self.view.verticalScrollBar().value()
+        self.view.setPlainText("\n".join(lines))
+        self.view.verticalScrollBar().setValue(scroll_pos)
+
+    def reset_metrics(self):
+        Metrics.reset()
+        self.refresh()
+
+    def export_json(self):
+        default_path = os.path.join(APPDATA_DIR, f"bifrost_metrics_{time.strftime('%Y%m%d_%H%M%S')}.json")
+        path, _ = QFileDialog.getSaveFileName(self, "지표 내보내기", default_path, "JSON (*.json)")
+        if not path: return
+        try:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(self.collect(), f, ensure_ascii=False, indent=2)
+        except Exception as e:
+            log_error(f"Metrics export failed: {e}", "diagnostics")
+            QMessageBox.warning(self, "내보내기 실패", f"파일을 저장하지 못했습니다:\n{e}")
@@ -0,0 +1,272 @@
+# --- [대화상자] ---
+# 앱 편집/단축키 대화상자입니다. 창을 처음 열 때 불러옵니다. (첫 화면 표시에 불필요)
+import os
+import urllib.parse
+
+from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QFileDialog, QDialogButtonBox,
+                               QFormLayout, QPushButton, QMessageBox, QSizePolicy, QCheckBox)
+from PySide6.QtCore import Qt, QKeyCombination
+from PySide6.QtGui import QKeySequence
+
+from Bifrost import IconManager
+
+class ShortcutInputButton(QPushButton):
+    def __init__(self, text="없음", parent=None):
+        super().__init__(text, parent)
+        self.setObjectName("ShortcutButton")
+        self.setCheckable(True)
+        self.current_key = None
+        self.toggled.connect(self.update_text)
+
+    def update_text(self, checked):
+        if checked:
+            self.setText("키 입력 중...")
+        else:
+            self.setText(self.current_key if self.current_key else "없음")
+
+    def keyPressEvent(self, event):
+        if not self.isChecked():
+            super().keyPressEvent(event)
+            return
+
+        key = event.key()
+        modifiers = event.modifiers()
+
+        # 무시할 키 (Modifiers 키 자체만 눌렸을 때)
+        if key in (Qt.Key_Control, Qt.Key_Shift, Qt.Key_Alt, Qt.Key_Meta):
+            return
+
+        # 차단할 키 조합 (Win키, Alt+F4 등)
+        if modifiers & Qt.MetaModifier:
+            self.setText("사용 불가")
+            self.setChecked(False)
+            return
+        if key == Qt.Key_F4 and (modifiers & Qt.AltModifier):
+            self.setText("사용 불가")
+            self.setChecked(False)
+            return
+
+        # 키 조합 문자열 생성
+        combo = QKeyCombination(modifiers, Qt.Key(key))
+        sequence = QKeySequence(combo).toString(QKeySequence.NativeText)
+        self.current_key = sequence
+        self.setText(sequence)
+        self.setChecked(False) # 입력 완료 후 해제
+
+    def focusOutEvent(self, event):
+        if self.isChecked():
+            self.setChecked(False)
+            if not self.current_key: self.setText("없음")
+        super().focusOutEvent(event)
+
+class AppEditDialog(QDialog):
+    def __init__(self, parent=None, app_data=None, current_group="", occupied_shortcuts=None):
+        super().__init__(parent)
+        self.setWindowTitle("앱 설정")
+        self.setFixedWidth(400)
+        self.occupied_shortcuts = occupied_shortcuts or {}
+        self.app_data = app_data
+        self._favicon_requested = None # 파비콘을 요청한 주소
+        
+        layout = QFormLayout(self)
+        layout.setVerticalSpacing(15)
+        layout.setContentsMargins(20, 20, 20, 20)
+        
+        self.name_input = QLineEdit()
+        self.name_input.setPlaceholderText("예: Chrome")
+        if app_data: self.name_input.setText(app_data.get('name', ''))
+        layout.addRow("이름", self.name_input)
+
+        self.group_input = QLineEdit()
+        self.group_input.setPlaceholderText("예: 업무")
+        initial_group = app_data.get('group', '') if app_data else current_group
+        if not initial_group: initial_group = "홈"
+        self.group_input.setText(initial_group)
+        layout.addRow("그룹", self.group_input)
+
+        path_layout = QHBoxLayout()
+        self.action_input = QLineEdit()
+        self.action_input.setPlaceholderText("파일 경로 또는 URL")
+        if app_data: self.action_input.setText(app_data.get('action', ''))
+        self.action_input.editingFinished.connect(self.try_auto_fetch_favicon) # URL 입력 시 파비콘 자동 가져오기
+        btn_file = QPushButton("파일")
+        btn_file.clicked.connect(self.find_file)
+        btn_folder = QPushButton("폴더")
+        btn_folder.clicked.connect(self.find_folder)
+        path_layout.addWidget(self.action_input)
+        path_layout.addWidget(btn_file)
+        path_layout.addWidget(btn_folder)
+        layout.addRow("경로", path_layout)
+
+        icon_layout = QHBoxLayout()
+        self.icon_display = QLineEdit()
+        self.icon_display.setPlaceholderText("아이콘 경로")
+        self.icon_display.setReadOnly(True)
+        if app_data: self.icon_display.setText(app_data.get('icon', ''))
+        btn_icon = QPushButton("찾기")
+        btn_icon.clicked.connect(self.find_icon)
+        btn_reset = QPushButton("삭제")
+        btn_reset.setFixedWidth(50)
+        btn_reset.clicked.connect(self.reset_icon)
+        icon_layout.addWidget(self.icon_display)
+        icon_layout.addWidget(btn_icon)
+        icon_layout.addWidget(btn_reset)
+        layout.addRow("아이콘", icon_layout)
+
+        # 단축키 설정
+        shortcut_layout = QHBoxLayout()
+        self.shortcut_btn = ShortcutInputButton()
+        self.shortcut_btn.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+        
+        current_shortcut = app_data.get('shortcut', '') if app_data else ''
+        if current_shortcut:
+            self.shortcut_btn.setText(current_shortcut)
+            self.shortcut_btn.current_key = current_shortcut
+            
+        btn_del_shortcut = QPushButton("삭제")
+        btn_del_shortcut.setFixedWidth(50)
+        btn_del_shortcut.clicked.connect(self.clear_shortcut)
+        
+        shortcut_layout.addWidget(self.shortcut_btn)
+        shortcut_layout.addWidget(btn_del_shortcut)
+        
+        layout.addRow("단축키", shortcut_layout)
+
+        self.autostart_check = QCheckBox("Bifrost 시작 시 실행")
+        self.autostart_check.setChecked(bool(app_data.get('autostart')) if app_data else False)
+        layout.addRow("", self.autostart_check)
+        self.single_instance_check = QCheckBox("실행 중이면 새로 실행하지 않고 기존 창 표시")
+        self.single_instance_check.setChecked(bool(app_data.get('single_instance')) if app_data else False)
+        layout.addRow("", self.single_instance_check)
+
+        btn_box = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        btn_box.button(QDialogButtonBox.Ok).setObjectName("PrimaryButton")
+        btn_box.accepted.connect(self.validate_and_accept)
+        btn_box.rejected.connect(self.reject)
+        layout.addRow(btn_box)
+
+    def clear_shortcut(self):
+        self.shortcut_btn.current_key = ""
+        self.shortcut_btn.setText("없음")
+        self.shortcut_btn.setChecked(False)
+
+    def validate_and_accept(self):
+        new_shortcut = self.shortcut_btn.current_key
+        # 단축키 충돌 검사
+        if new_shortcut:
+             # 내 자신(수정 중인 앱)의 기존 키는 제외하고 검사
+            my_id = id(self.app_data) if self.app_data else None
+            
+            # 다른 앱이 사용 중인지 확인
+            for shortcut, owner_name in self.occupied_shortcuts.items():
+                if shortcut == new_shortcut:
+                    # 충돌! owner가 나 자신이 아니면 경고
+                    # (여기서 owner 식별을 위해 owner_name만 썼지만, 실제로는 좀 더 정교해야 함.
+                    #  다만 occupied_shortcuts를 만들 때 나 자신을 제외하고 넘겨주면 됨.)
+                    reply = QMessageBox.question(
+                        self, "단축키 중복", 
+                        f"단축키 '{new_shortcut}'은(는) 이미 '{owner_name}'에서 사용 중입니다.\n해당 앱의 단축키를 해제하고 현재 앱에 적용하시겠습니까?",
+                        QMessageBox.Yes | QMessageBox.No
+                    )
+                    if reply == QMessageBox.No:
+                        return
+                    # Yes 선택 시: 호출자(MainWindow)에서 처리하도록 플래그 설정 가능하지만,
+                    # 여기서는 그냥 진행하고 MainWindow에서 최종 저장 시에 덮어쓰기 로직 수행
+                    break
+        self.accept()
+
+    def find_file(self):
+        f, _ = QFileDialog.getOpenFileName(self, "파일 선택", "", "All Files (*)")
+        if f:
+            self.action_input.setText(f)
+            extracted = IconManager.extract_and_save_icon(f)
+            if extracted: self.icon_display.setText(extracted)
+            if not self.name_input.text(): self.name_input.setText(os.path.splitext(os.path.basename(f))[0])
+            
+    def try_auto_fetch_favicon(self):
+        """사용자가 URL을 직접 입력했을 때 파비콘을 가져옵니다."""
+        url = self.action_input.text()
+        if (url.startswith("http://") or url.startswith("https://")) and not self.icon_display.text():
+            # 이름이 비어있으면 도메인으로 채움
+            if not self.name_input.text():
+                self.name_input.setText(urllib.parse.urlparse(url).netloc)
+            # 파비콘은 작업자 스레드에서 받아, 끝났을 때 이 칸이 아직 비어 있으면 채움 (같은 주소는 한 번만 요청)
+            if url != self._favicon_requested:
+                self._favicon_requested = url
+                self.parent().fetch_favicon_async(url, self)
+    def find_folder(self):
+        path = QFileDialog.getExistingDirectory(self, "폴더 선택")
+        if path: self.action_input.setText(path)
+    def find_icon(self):
+        path, _ = QFileDialog.getOpenFileName(self, "아이콘 선택", "", "Images (*.png *.jpg *.jpeg *.ico *.bmp)")
+        if path:
+            # 외부 아이콘을 AppData/icons로 임포트
+            imported_name = IconManager.import_icon(path)
+            if imported_name:
+                self.icon_display.setText(imported_name)
+            else:
+                # 실패 시 그냥 경로라도 넣음 (거의 발생 안 함)
+                self.icon_display.setText(path)
+    def reset_icon(self): self.icon_display.clear()
+    def clear_shortcut(self):
+        self.shortcut_btn.current_key = ""
+        self.shortcut_btn.setText("없음")
+        self.shortcut_btn.setChecked(False)
+
+    def get_data(self):
+        data = {
+            "name": self.name_input.text(),
+            "group": self.group_input.text().strip() or "홈",
+            "type": "auto",
+            "action": self.action_input.text(),
+            "icon": self.icon_display.text(),
+            "shortcut": self.shortcut_btn.current_key if self.shortcut_btn.current_key else ""
+        }
+        # 이 대화상자에 없는 옵션(AppRecord.extra)은 그대로 유지
+        if self.app_data:
+            data.update({k: v for k, v in self.app_data.items() if k not in data})
+        for key, check in (("autostart", self.autostart_check), ("single_instance", self.single_instance_check)):
+            data.pop(key, None)
+            if check.isChecked(): data[key] = True
+        return data
+
+class ShortcutDialog(QDialog):
+    def __init__(self, group_name, current_shortcut="", occupied_shortcuts=None, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("그룹 단축키 설정")
+        self.occupied_shortcuts = occupied_shortcuts or {}
+        layout = QVBoxLayout(self)
+        layout.addWidget(QLabel(f"'{group_name}' 탭으로 이동할 단축키:"))
+        
+        self.btn = ShortcutInputButton(current_shortcut or "없음")
+        self.btn.current_key = current_shortcut
+        
+        shortcut_layout = QHBoxLayout()
+        shortcut_layout.addWidget(self.btn)
+        
+        btn_del = QPushButton("삭제")
+        btn_del.setFixedWidth(50)
+        btn_del.clicked.connect(self.clear_shortcut)
+        shortcut_layout.addWidget(btn_del)
+        
+        layout.addLayout(shortcut_layout)
+        
+        box = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        box.accepted.connect(self.validate)
+        box.rejected.connect(self.reject)
+        layout.addWidget(box)
+    
+    def clear_shortcut(self):
+        self.btn.current_key = ""
+        self.btn.setText("없음")
+        self.btn.setChecked(False)
+    
+    def validate(self):
+        new_key = self.btn.current_key
+        if new_key:
+            for s, owner in self.occupied_shortcuts.items():
+                if s == new_key:
+                    reply = QMessageBox.question(self, "중복", f"'{new_key}'는 '{owner}'가 사용 중입니다. 가져오시겠습니까?", QMessageBox.Yes|QMessageBox.No)
+                    if reply == QMessageBox.No: return
+        self.accept()
+    def get_shortcut(self): return self.btn.current_key
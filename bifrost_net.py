@@ -0,0 +1,214 @@
+# --- [파비콘 네트워크] ---
+# 사이트 HTML/매니페스트에서 파비콘을 찾아 내려받는 부분입니다.
+# urllib/ssl/html.parser는 무거우므로 파비콘을 가져오거나 재검증할 때 처음 불러옵니다.
+import os
+import json
+import time
+import threading
+import ssl
+import urllib.request
+import urllib.parse
+import urllib.error
+from html.parser import HTMLParser
+
+from Bifrost import APPDATA_DIR, log_error, get_logger
+
+FAVICON_META_FILE = os.path.join(APPDATA_DIR, 'favicons.json')
+FAVICON_TARGET_SIZE = 128                         # 선호 아이콘 크기 (px)
+FAVICON_SIZE_GUESS = 32                           # sizes 속성이 없는 <link rel=icon>의 추정 크기
+FAVICON_FALLBACK_URL = "https://www.google.com/s2/favicons?domain={domain}&sz=64"
+FAVICON_MAX_AGE = 7 * 24 * 3600                   # 이보다 오래된 파비콘은 재검증
+FAVICON_REQUEST_GAP = 2.0                         # 재검증 요청 사이 간격 (초, 낮은 우선순위 유지)
+HTTP_USER_AGENT = 'Bifrost-Launcher'
+
+def _insecure_ssl_context():
+    # 인증서 검증 무시 (일부 환경 호환성)
+    ctx = ssl.create_default_context()
+    ctx.check_hostname = False
+    ctx.verify_mode = ssl.CERT_NONE
+    return ctx
+
+def _sniff_image_ext(data):
+    """내용으로 이미지 형식을 판별합니다. HTML 오류 페이지 등은 None."""
+    if data.startswith(b'\x89PNG\r\n\x1a\n'): return '.png'
+    if data[:4] == b'\x00\x00\x01\x00': return '.ico'
+    if data[:3] == b'\xff\xd8\xff': return '.jpg'
+    if data[:6] in (b'GIF87a', b'GIF89a'): return '.gif'
+    if data[:2] == b'BM': return '.bmp'
+    if data[:4] == b'RIFF' and data[8:12] == b'WEBP': return '.webp'
+    return None
+
+def _parse_icon_sizes(sizes):
+    best = 0
+    for token in (sizes or '').lower().split():
+        w, _, h = token.partition('x')
+        if w.isdigit() and h.isdigit(): best = max(best, int(w), int(h))
+    return best
+
+class _IconLinkParser(HTMLParser):
+    """<link rel=icon|apple-touch-icon|manifest>와 <base href>만 수집합니다."""
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.icons = []    # (href, size)
+        self.manifest = None
+        self.base = None
+
+    def handle_starttag(self, tag, attrs):
+        a = dict(attrs)
+        if tag == 'base' and a.get('href') and self.base is None:
+            self.base = a['href']
+        if tag != 'link' or not a.get('href'): return
+        rel = (a.get('rel') or '').lower().split()
+        href = a['href'].strip()
+        if 'manifest' in rel:
+            self.manifest = href
+            return
+        # Qt 빌드에 SVG 모듈이 없으므로 SVG 아이콘은 제외
+        if (a.get('type') or '').lower() == 'image/svg+xml' or href.lower().split('?')[0].endswith('.svg'): return
+        size = _parse_icon_sizes(a.get('sizes'))
+        if 'apple-touch-icon' in rel or 'apple-touch-icon-precomposed' in rel:
+            self.icons.append((href, size or 180))
+        elif 'icon' in rel:
+            self.icons.append((href, size or FAVICON_SIZE_GUESS))
+
+class FaviconResolver:
+    """
+    사이트 HTML의 <link rel=icon>/apple-touch-icon/manifest 항목에서 가장 알맞은 크기의 아이콘을 고르고,
+    ETag/Last-Modified로 조건부 재검증합니다. http:// 주소도 그대로 지원하므로 로컬 HTTP 서버로 검증할 수 있습니다.
+    """
+    HTML_READ_LIMIT = 256 * 1024
+
+    def __init__(self, target_size=FAVICON_TARGET_SIZE, timeout=4, fallback_url=FAVICON_FALLBACK_URL):
+        self.target_size = target_size
+        self.timeout = timeout
+        self.fallback_url = fallback_url
+
+    def _open(self, url, headers=None):
+        req = urllib.request.Request(url, headers={'User-Agent': HTTP_USER_AGENT, **(headers or {})})
+        ctx = _insecure_ssl_context() if url.lower().startswith('https://') else None
+        return urllib.request.urlopen(req, context=ctx, timeout=self.timeout)
+
+    def candidates(self, page_url):
+        """[(아이콘 URL, 크기)]를 선호 순서대로 반환합니다. 마지막 후보는 항상 /favicon.ico"""
+        found = []
+        try:
+            with self._open(page_url) as res:
+                final_url = res.geturl()
+                if res.headers.get_content_type() in ('text/html', 'application/xhtml+xml'):
+                    charset = res.headers.get_content_charset() or 'utf-8'
+                    parser = _IconLinkParser()
+                    parser.feed(res.read(self.HTML_READ_LIMIT).decode(charset, 'replace'))
+                    base = urllib.parse.urljoin(final_url, parser.base) if parser.base else final_url
+                    found += [(urllib.parse.urljoin(base, href), size) for href, size in parser.icons]
+                    if parser.manifest:
+                        found += self._manifest_icons(urllib.parse.urljoin(base, parser.manifest))
+        except Exception as e:
+            get_logger("net").info(f"Favicon page read failed ({page_url}): {e}")
+            final_url = page_url
+
+        # 목표 크기 이상 중 가장 작은 것 → 없으면 가장 큰 것
+        ranked = sorted(found, key=lambda c: (0, c[1]) if c[1] >= self.target_size else (1, -c[1]))
+        ranked.append((urllib.parse.urljoin(final_url, '/favicon.ico'), FAVICON_SIZE_GUESS))
+        seen = set()
+        return [c for c in ranked if not (c[0] in seen or seen.add(c[0]))]
+
+    def _manifest_icons(self, manifest_url):
+        try:
+            with self._open(manifest_url) as res:
+                manifest = json.loads(res.read(self.HTML_READ_LIMIT).decode('utf-8', 'replace'))
+        except Exception as e:
+            get_logger("net").info(f"Manifest read failed ({manifest_url}): {e}")
+            return []
+        icons = []
+        for icon in manifest.get('icons', []) if isinstance(manifest, dict) else []:
+            src = icon.get('src') if isinstance(icon, dict) else None
+            if not src or 'svg' in (icon.get('type') or '') or src.lower().endswith('.svg'): continue
+            if 'any' not in (icon.get('purpose') or 'any').split(): continue # maskable 전용 제외
+            icons.append((urllib.parse.urljoin(manifest_url, src), _parse_icon_sizes(icon.get('sizes')) or FAVICON_SIZE_GUESS))
+        return icons
+
+    def download(self, icon_url, meta=None):
+        """
+        아이콘을 받아 {'data', 'ext', 'icon_url', 'etag', 'last_modified'}를 반환합니다.
+        meta를 주면 조건부 요청을 보내고, 304면 'not_modified'를 반환합니다. 실패 시 None.
+        """
+        headers = {}
+        if meta:
+            if meta.get('etag'): headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'): headers['If-Modified-Since'] = meta['last_modified']
+        try:
+            with self._open(icon_url, headers) as res:
+                data = res.read()
+                etag, last_modified = res.headers.get('ETag'), res.headers.get('Last-Modified')
+        except urllib.error.HTTPError as e:
+            if e.code == 304: return 'not_modified'
+            get_logger("net").info(f"Favicon download failed ({icon_url}): HTTP {e.code}")
+            return None
+        except Exception as e:
+            get_logger("net").info(f"Favicon download failed ({icon_url}): {e}")
+            return None
+        ext = _sniff_image_ext(data)
+        if not ext: return None
+        return {'data': data, 'ext': ext, 'icon_url': icon_url, 'etag': etag, 'last_modified': last_modified}
+
+    def fetch(self, page_url):
+        for icon_url, _ in self.candidates(page_url):
+            result = self.download(icon_url)
+            if result: return result
+        domain = urllib.parse.urlparse(page_url).netloc
+        if self.fallback_url and domain:
+            return self.download(self.fallback_url.format(domain=domain))
+        return None
+
+    def revalidate(self, page_url, meta):
+        """저장된 아이콘 URL을 조건부 요청으로 재검증하고, 사라졌으면 처음부터 다시 찾습니다."""
+        if meta and meta.get('icon_url'):
+            result = self.download(meta['icon_url'], meta)
+            if result: return result
+        return self.fetch(page_url)
+
+class FaviconCache:
+    """파비콘 메타데이터(원본 페이지, 아이콘 URL, ETag/Last-Modified, 확인 시각) 저장소 (스레드 안전)"""
+    _lock = threading.Lock()
+    _data = None
+
+    @staticmethod
+    def _load():
+        if FaviconCache._data is None:
+            try:
+                with open(FAVICON_META_FILE, 'r', encoding='utf-8') as f:
+                    FaviconCache._data = json.load(f)
+            except FileNotFoundError:
+                FaviconCache._data = {}
+            except Exception as e:
+                log_error(f"Favicon meta load error: {e}", "net")
+                FaviconCache._data = {}
+        return FaviconCache._data
+
+    @staticmethod
+    def get(icon_name):
+        with FaviconCache._lock:
+            return dict(FaviconCache._load().get(icon_name) or {})
+
+    @staticmethod
+    def put(icon_name, meta):
+        with FaviconCache._lock:
+            data = FaviconCache._load()
+            data[icon_name] = meta
+            try:
+                tmp_path = FAVICON_META_FILE + '.tmp'
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, ensure_ascii=False, indent=1)
+                os.replace(tmp_path, FAVICON_META_FILE)
+            except Exception as e:
+                log_error(f"Favicon meta save error: {e}", "net")
+
+    @staticmethod
+    def record(icon_name, page_url, result):
+        FaviconCache.put(icon_name, {
+            'page_url': page_url,
+            'icon_url': result['icon_url'],
+            'etag': result.get('etag'),
+            'last_modified': result.get('last_modified'),
+            'checked_at': time.time(),
+        })
@@ -0,0 +1,147 @@
+# --- [공유 카탈로그] ---
+# 팀이 공유 폴더(네트워크 드라이브 등)에 두는 읽기 전용 앱 목록을 개인 설정 아래 계층으로 합칩니다. (설정되어 있을 때만 불러옴)
+# 파일 형식은 --export 결과와 같은 {"apps": [...]}이며, 아이콘의 상대 경로는 카탈로그 파일이 있는 폴더 기준입니다.
+# (아이콘은 카탈로그 파일이 바뀔 때 함께 복사하므로, 아이콘만 바꿨다면 카탈로그 파일도 다시 저장해야 반영됨)
+# 화면은 ConfigManager가 로컬 사본(SHARED_DIR)으로 그리고, 원본은 여기서 (수정 시각, 크기) -> 내용 해시 순으로 재검증합니다.
+# 끊긴 공유 폴더의 stat/read는 수십 초씩 멈출 수 있으므로 Scheduler 작업자 대신 전용 스레드를 씁니다.
+import os
+import json
+import time
+import shutil
+import hashlib
+import threading
+
+from PySide6.QtCore import QObject, Signal
+
+from Bifrost import SHARED_DIR, AppRecord, ConfigManager, Metrics, log_error, get_logger, _write_file_atomic
+
+SHARED_ICON_DIR = os.path.join(SHARED_DIR, 'icons')
+
+class SharedCatalogSync(QObject):
+    """
+    공유 카탈로그 원본을 재검증해 바뀐 것만 로컬 사본으로 옮깁니다.
+    원본에 접근할 수 없으면 마지막 사본을 그대로 쓰며, 진행 중에 다시 요청하면 끝난 뒤 한 번 더 실행합니다.
+    """
+    updated = Signal(list) # 내용이 바뀐 로컬 아이콘 경로 (계층이 바뀌었을 때만 알림)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._lock = threading.Lock()
+        self._running = False
+        self._requested = None
+
+    def refresh(self, sources):
+        with self._lock:
+            if self._running:
+                self._requested = list(sources)
+                return
+            self._running = True
+        threading.Thread(target=self._run, args=(list(sources),), daemon=True, name="SharedCatalogSync").start()
+
+    def _run(self, sources):
+        while True:
+            changed, icons = False, []
+            for source in sources:
+                try:
+                    result = self._revalidate(source)
+                except Exception as e:
+                    log_error(f"Shared catalog sync failed ({source}): {e}", "shared")
+                    continue
+                if result is not None:
+                    changed = True
+                    icons.extend(result)
+            if changed: self.updated.emit(icons)
+            with self._lock:
+                sources, self._requested = self._requested, None
+                if sources is None:
+                    self._running = False
+                    return
+
+    @staticmethod
+    def _revalidate(source):
+        """원본이 바뀌었으면 로컬 사본을 갱신하고 바뀐 아이콘 경로 목록을, 아니면 None을 반환합니다."""
+        config = ConfigManager()
+        try:
+            st = os.stat(source)
+        except OSError as e:
+            Metrics.incr("shared.unavailable")
+            get_logger("shared").warning("Shared catalog unavailable, using local copy (%s): %s", source, e)
+            return None
+        stamp = config.shared_stamp(source)
+        if stamp and stamp[0] == st.st_mtime_ns and stamp[1] == st.st_size:
+            Metrics.incr("shared.stat_hits")
+            return None
+
+        start = time.perf_counter()
+        with open(source, 'rb') as f: raw = f.read()
+        digest = hashlib.blake2b(raw, digest_size=16).hexdigest()
+        fresh_stamp = [st.st_mtime_ns, st.st_size, digest]
+        if source not in config.get_setting('shared_catalogs', []): return None # 그 사이 목록에서 뺌
+        if stamp and stamp[2] == digest:
+            # 복사/touch로 수정 시각만 바뀜 -> 다음부터 stat만으로 끝나도록 stamp만 갱신
+            config.set_shared_layer(source, fresh_stamp)
+            Metrics.incr("shared.digest_hits")
+            return None
+
+        data = json.loads(raw.decode('utf-8'))
+        items = data.get('apps') if isinstance(data, dict) else None
+        if not isinstance(items, list): raise ValueError('shared catalog must be {"apps": [...]}')
+        records, _ = AppRecord.load_list(items) # 잘못된 항목은 여기서 한 번만 기록하고 사본에 넣지 않음
+        records, icons = SharedCatalogSync._sync_icons(source, records)
+        config.set_shared_layer(source, fresh_stamp, records)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        Metrics.observe("shared.sync_ms", elapsed_ms)
+        Metrics.incr("shared.updates")
+        get_logger("shared").info("Shared catalog %s: %d apps, %d icons copied in %.1f ms",
+                                  source, len(records), len(icons), elapsed_ms)
+        return icons
+
+    @staticmethod
+    def _sync_icons(source, records):
+        """
+        상대 경로 아이콘을 로컬 사본 폴더로 복사하고 icon을 그 절대 경로로 바꿉니다. ((레코드 목록, 복사한 경로 목록))
+        크기와 수정 시각이 사본과 같으면 복사하지 않습니다. 절대 경로 아이콘은 그대로 둠
+        """
+        base = os.path.dirname(source)
+        icon_dir = os.path.join(SHARED_ICON_DIR, ConfigManager.shared_layer_key(source))
+        result, copied, used = [], [], set()
+        for app in records:
+            icon = app.icon
+            if not icon or os.path.isabs(icon):
+                result.append(app)
+                continue
+            rel = os.path.normpath(icon)
+            if rel == os.pardir or rel.startswith(os.pardir + os.sep):
+                get_logger("shared").warning("Shared icon outside catalog folder ignored: %s", icon)
+                result.append(app.copy(icon=None))
+                continue
+            local = os.path.join(icon_dir, rel.replace(os.sep, '_'))
+            used.add(os.path.basename(local))
+            try:
+                st = os.stat(os.path.join(base, rel))
+                try: cached = os.stat(local)
+                except FileNotFoundError: cached = None
+                if cached is None or cached.st_size != st.st_size or cached.st_mtime_ns != st.st_mtime_ns:
+                    os.makedirs(icon_dir, exist_ok=True)
+                    with open(os.path.join(base, rel), 'rb') as f: _write_file_atomic(local, f.read())
+                    os.utime(local, ns=(st.st_atime_ns, st.st_mtime_ns))
+                    copied.append(local)
+            except OSError as e:
+                get_logger("shared").warning("Shared icon skipped (%s): %s", icon, e)
+                if not os.path.exists(local):
+                    result.append(app.copy(icon=None))
+                    continue
+            result.append(app.copy(icon=local))
+        # 카탈로그에서 빠진 아이콘 사본 정리
+        try: stale = [n for n in os.listdir(icon_dir) if n not in used]
+        except OSError: stale = []
+        for name in stale:
+            try: os.remove(os.path.join(icon_dir, name))
+            except OSError: pass
+        return result, copied
+
+    @staticmethod
+    def forget(source):
+        """목록에서 뺀 카탈로그의 로컬 사본과 아이콘을 지웁니다."""
+        ConfigManager().forget_shared_layer(source)
+        shutil.rmtree(os.path.join(SHARED_ICON_DIR, ConfigManager.shared_layer_key(source)), ignore_errors=True)
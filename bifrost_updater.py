@@ -0,0 +1,104 @@
+# --- [자동 업데이트 로직] ---
+# urllib/ssl은 업데이트 확인 시점에만 필요하므로 Bifrost.py가 처음 쓸 때 불러옵니다. (시작 시간 단축)
+import sys
+import os
+import json
+import shutil
+import subprocess
+import ssl
+import urllib.request
+
+from PySide6.QtWidgets import QApplication, QMessageBox
+
+from Bifrost import EXE_DIR, log_error
+
+def check_version_parse(version_str):
+    try:
+        return [int(x) for x in version_str.replace("v", "").split(".")]
+    except:
+        return [0, 0, 0]
+
+class AutoUpdater:
+    def __init__(self, current_version):
+        self.current_version = current_version
+        self.api_url = "https://api.github.com/repos/HoneyMocchi/Bifrost/releases/latest"
+
+    def check_for_updates(self):
+        try:
+            req = urllib.request.Request(self.api_url, headers={'User-Agent': 'Bifrost-Launcher'})
+            
+            # 인증서 검증 무시 (일부 환경 호환성)
+            ctx = ssl.create_default_context()
+            ctx.check_hostname = False
+            ctx.verify_mode = ssl.CERT_NONE
+            
+            with urllib.request.urlopen(req, context=ctx, timeout=5) as res:
+                data = json.loads(res.read().decode())
+                latest_tag = data.get('tag_name', '').strip()
+                if not latest_tag: return None, None
+                
+                curr_parts = check_version_parse(self.current_version)
+                latest_parts = check_version_parse(latest_tag)
+                
+                # 단순 비교 (Major.Minor.Patch)
+                is_newer = False
+                for i in range(len(latest_parts)):
+                    if i >= len(curr_parts):
+                        is_newer = True; break
+                    if latest_parts[i] > curr_parts[i]:
+                        is_newer = True; break
+                    elif latest_parts[i] < curr_parts[i]:
+                        break
+                        
+                if is_newer:
+                    assets = data.get('assets', [])
+                    for asset in assets:
+                         if asset['name'].endswith('.exe'):
+                             return latest_tag, asset['browser_download_url']
+            return None, None
+        except Exception as e:
+            log_error(f"Update check failed: {e}", "update")
+            return None, None
+
+    def perform_update(self, download_url, parent_widget=None):
+        try:
+            # 1. 다운로드
+            new_exe_name = "Bifrost.new.exe"
+            new_exe_path = os.path.join(EXE_DIR, new_exe_name)
+            
+            ctx = ssl.create_default_context()
+            ctx.check_hostname = False
+            ctx.verify_mode = ssl.CERT_NONE
+            
+            with urllib.request.urlopen(download_url, context=ctx) as response, open(new_exe_path, 'wb') as out_file:
+                shutil.copyfileobj(response, out_file)
+            
+            # 2. 배치 파일 생성
+            bat_path = os.path.join(EXE_DIR, "update_bifrost.bat")
+            current_exe = sys.executable
+            
+            # 배치 스크립트: 
+            # 1초 대기 -> 기존 파일 삭제 -> 새 파일 이름 변경 -> 실행 -> 배치 삭제
+            bat_content = f"""
+@echo off
+timeout /t 2 /nobreak >nul
+del "{current_exe}"
+move "{new_exe_path}" "{current_exe}"
+explorer "{current_exe}"
+del "%~f0"
+"""
+            with open(bat_path, 'w') as f:
+                f.write(bat_content)
+                
+            # 3. 실행 및 종료
+            # PyInstaller 환경 변수(_MEIPASS2) 제거 후 Explorer를 통해 배치 실행 (확실한 분리)
+            env = os.environ.copy()
+            if '_MEIPASS2' in env:
+                del env['_MEIPASS2']
+                
+            subprocess.Popen(bat_path, shell=True, env=env)
+            QApplication.quit()
+        except Exception as e:
+            if parent_widget:
+                QMessageBox.critical(parent_widget, "업데이트 실패", f"업데이트 중 오류가 발생했습니다:\n{e}")
+            log_error(f"Update execution failed: {e}", "update")
@@ -0,0 +1,101 @@
+import os
+import sys
+import json
+import tempfile
+import threading
+from functools import partial
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+
+# bifrost_net.FaviconResolver를 로컬 HTTP 서버(http.server)의 고정 페이지로 점검합니다. (네트워크 불필요)
+# link rel 아이콘 크기 선택, <base href>/상대 경로, 매니페스트, /favicon.ico 대체, 외부 대체 주소, 조건부 재검증(304)
+
+PNG = b'\x89PNG\r\n\x1a\n'
+
+FIXTURES = {
+    # link rel 아이콘 여러 개: 목표(128) 이상 중 가장 작은 것, 상대 경로
+    'links/index.html': '<html><head>'
+                        '<link rel="icon" href="small.png" sizes="16x16">'
+                        '<link rel="icon" href="/links/big.png" sizes="512x512">'
+                        '<link rel="apple-touch-icon" href="touch.png">'
+                        '<link rel="icon" type="image/svg+xml" href="vector.svg">'
+                        '</head></html>',
+    'links/small.png': PNG + b'small',
+    'links/big.png': PNG + b'big',
+    'links/touch.png': PNG + b'touch',
+    # <base href>를 기준으로 한 상대 경로
+    'based/index.html': '<html><head><base href="/assets/"><link rel="icon" href="icon-32.png" sizes="32x32"></head></html>',
+    'assets/icon-32.png': PNG + b'based',
+    # 매니페스트: 매니페스트 위치 기준 상대 경로, maskable 전용/SVG 제외
+    'app/index.html': '<html><head><link rel="manifest" href="meta/site.webmanifest"></head></html>',
+    'app/meta/site.webmanifest': json.dumps({'icons': [
+        {'src': 'icons/mask-512.png', 'sizes': '512x512', 'purpose': 'maskable'},
+        {'src': 'icons/logo.svg', 'sizes': '512x512', 'type': 'image/svg+xml'},
+        {'src': 'icons/any-192.png', 'sizes': '192x192'},
+        {'src': 'icons/any-96.png', 'sizes': '96x96', 'purpose': 'any maskable'},
+    ]}),
+    'app/meta/icons/mask-512.png': PNG + b'maskable',
+    'app/meta/icons/any-192.png': PNG + b'manifest',
+    'app/meta/icons/any-96.png': PNG + b'manifest-small',
+    # 아이콘 링크가 없으면 /favicon.ico
+    'plain/index.html': '<html><head><title>no icons</title></head></html>',
+    'favicon.ico': b'\x00\x00\x01\x00' + b'root-ico',
+    # 모든 후보가 이미지가 아니면 외부 대체 주소
+    'broken/index.html': '<html><head><link rel="icon" href="missing.png"></head></html>',
+    'fallback/icon.png': PNG + b'fallback',
+}
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, *args): pass
+
+def write_fixtures(root):
+    for rel, content in FIXTURES.items():
+        path = os.path.join(root, *rel.split('/'))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as f: f.write(content.encode('utf-8') if isinstance(content, str) else content)
+
+def run_checks(root, base):
+    from bifrost_net import FaviconResolver
+    failures = []
+    def check(label, actual, expected):
+        ok = actual == expected
+        print(f"  {'통과' if ok else '실패'}  {label}: {actual!r}" + ('' if ok else f" (기대: {expected!r})"))
+        if not ok: failures.append(label)
+
+    resolver = FaviconResolver(timeout=2, fallback_url=base + '/fallback/icon.png?domain={domain}')
+
+    candidates = resolver.candidates(base + '/links/index.html')
+    check("link rel 후보 순서 (목표 크기 이상 우선, SVG 제외, /favicon.ico 마지막)", [c[0] for c in candidates], [
+        base + '/links/touch.png', base + '/links/big.png', base + '/links/small.png', base + '/favicon.ico'])
+    check("link rel 아이콘", resolver.fetch(base + '/links/index.html')['data'], PNG + b'touch')
+    check("<base href> 상대 경로", resolver.fetch(base + '/based/index.html')['icon_url'], base + '/assets/icon-32.png')
+    check("매니페스트 아이콘 (maskable 전용/SVG 제외)", resolver.fetch(base + '/app/index.html')['data'], PNG + b'manifest')
+    result = resolver.fetch(base + '/plain/index.html')
+    check("/favicon.ico 대체", (result['icon_url'], result['ext']), (base + '/favicon.ico', '.ico'))
+
+    # 링크도 /favicon.ico도 없으면 외부 대체 주소
+    os.rename(os.path.join(root, 'favicon.ico'), os.path.join(root, 'favicon.ico.off'))
+    try:
+        check("외부 대체 주소", resolver.fetch(base + '/broken/index.html')['data'], PNG + b'fallback')
+    finally:
+        os.rename(os.path.join(root, 'favicon.ico.off'), os.path.join(root, 'favicon.ico'))
+
+    # 조건부 재검증: Last-Modified가 같으면 304 -> not_modified
+    first = resolver.fetch(base + '/links/index.html')
+    check("재검증 (변경 없음)", resolver.download(first['icon_url'], first), 'not_modified')
+    return failures
+
+if __name__ == '__main__':
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    if not os.environ.get('LOCALAPPDATA'): os.environ['LOCALAPPDATA'] = tempfile.mkdtemp(prefix='bifrost_favicon_')
+    with tempfile.TemporaryDirectory() as root:
+        write_fixtures(root)
+        server = ThreadingHTTPServer(('127.0.0.1', 0), partial(_QuietHandler, directory=root))
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        print("--- 파비콘 탐색 점검 (로컬 HTTP 서버) ---")
+        try:
+            failures = run_checks(root, f"http://127.0.0.1:{server.server_address[1]}")
+        finally:
+            server.shutdown()
+    print("통과" if not failures else f"실패: {', '.join(failures)}")
+    sys.exit(1 if failures else 0)
@@ -0,0 +1,67 @@
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+
+# `import Bifrost` 한 번에 걸리는 시간(누적, ms)의 상한. 측정 환경에 따라 --budget-ms로 조정
+IMPORT_BUDGET_MS = 450
+
+# 첫 화면 표시 전에는 불러오면 안 되는 모듈 (지연 로딩 대상)
+DEFERRED_MODULES = [
+    'bifrost_net', 'bifrost_updater', 'bifrost_dialogs', 'bifrost_diagnostics',
+    'bifrost_catalog', 'bifrost_backup', 'bifrost_shared',
+    'urllib.request', 'http.client', 'ssl', 'html.parser', 'email.parser', 'subprocess', 'sqlite3',
+]
+
+def measure_once():
+    """새 인터프리터에서 -X importtime으로 Bifrost를 불러와 {모듈: (self_us, cumulative_us)}를 반환합니다."""
+    here = os.path.dirname(os.path.abspath(__file__))
+    with tempfile.TemporaryDirectory() as appdata:
+        env = dict(os.environ)
+        env['LOCALAPPDATA'] = appdata # 실제 사용자 설정/아이콘을 건드리지 않도록
+        env.pop('BIFROST_PROFILE', None)
+        env.pop('BIFROST_TRACEMALLOC', None)
+        result = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import Bifrost'],
+                                cwd=here, env=env, capture_output=True, text=True)
+    if result.returncode != 0:
+        print(result.stderr)
+        raise SystemExit("Bifrost를 불러오지 못했습니다.")
+
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line: continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        modules[name.strip()] = (int(self_us), int(cumulative_us))
+    return modules
+
+def check(budget_ms, runs):
+    print("--- Bifrost 임포트 시간 점검 ---")
+    # 첫 실행은 .pyc 생성이 섞이므로 버리고, 나머지 중 가장 빠른 값을 사용 (잡음 최소화)
+    measure_once()
+    samples = [measure_once() for _ in range(runs)]
+    best = min(samples, key=lambda m: m['Bifrost'][1])
+    total_ms = best['Bifrost'][1] / 1000
+
+    print(f"import Bifrost: {total_ms:.1f} ms (예산 {budget_ms} ms, {runs}회 중 최소)")
+    print("누적 시간 상위 모듈:")
+    for name, (_, cumulative_us) in sorted(best.items(), key=lambda kv: -kv[1][1])[:10]:
+        print(f"  {cumulative_us / 1000:8.1f} ms  {name}")
+
+    failed = False
+    leaked = [name for name in DEFERRED_MODULES if name in best]
+    if leaked:
+        failed = True
+        print(f"실패: 시작 시 불러오면 안 되는 모듈이 포함됨 -> {', '.join(leaked)}")
+    if total_ms > budget_ms:
+        failed = True
+        print(f"실패: 임포트 시간이 예산을 넘었습니다 ({total_ms:.1f} ms > {budget_ms} ms)")
+    if not failed: print("통과")
+    return 0 if not failed else 1
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Bifrost 임포트 시간 회귀 점검 (-X importtime)")
+    parser.add_argument('--budget-ms', type=float, default=IMPORT_BUDGET_MS)
+    parser.add_argument('--runs', type=int, default=3)
+    args = parser.parse_args()
+    sys.exit(check(args.budget_ms, args.runs))
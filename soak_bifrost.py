@@ -0,0 +1,217 @@
+import argparse
+import gc
+import os
+import random
+import sys
+import tempfile
+import time
+
+# 화면 없이 실행하고, 실제 사용자 설정/아이콘을 건드리지 않도록 Bifrost를 불러오기 전에 설정
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+os.environ['LOCALAPPDATA'] = tempfile.mkdtemp(prefix='bifrost_soak_')
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from PySide6.QtWidgets import QApplication, QMessageBox, QInputDialog, QDialog
+from PySide6.QtCore import QObject, QEvent
+
+import Bifrost
+from Bifrost import BifrostWindow, AppButton, IconManager, Scheduler
+
+# 기본 임계값: 같은 설정으로 되돌린 뒤 측정한 값이 시작 기준보다 이만큼 넘게 늘면 실패
+MAX_OBJECT_GROWTH = 50       # 살아 있는 QObject 수
+MAX_WIDGET_GROWTH = 20       # 창 밖(부모 없는 대화상자/메뉴 등)까지 포함한 전체 위젯 수
+MAX_PIXMAP_GROWTH_KB = 512   # IconManager 픽스맵 캐시
+MAX_RSS_GROWTH_MB = 40       # 프로세스 RSS
+SAMPLE_EVERY = 100           # 진행 중 기록 주기 (사이클)
+WARMUP_CYCLES = 200          # 기준을 재기 전에 돌리는 사이클
+
+def rss_bytes():
+    """현재 프로세스 RSS. 알 수 없으면 None"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import ctypes
+        from ctypes import wintypes
+        class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+            _fields_ = [('cb', wintypes.DWORD), ('PageFaultCount', wintypes.DWORD)] + \
+                       [(name, ctypes.c_size_t) for name in ('PeakWorkingSetSize', 'WorkingSetSize',
+                        'QuotaPeakPagedPoolUsage', 'QuotaPagedPoolUsage', 'QuotaPeakNonPagedPoolUsage',
+                        'QuotaNonPagedPoolUsage', 'PagefileUsage', 'PeakPagefileUsage')]
+        counters = PROCESS_MEMORY_COUNTERS()
+        counters.cb = ctypes.sizeof(counters)
+        ctypes.windll.psapi.GetProcessMemoryInfo(ctypes.windll.kernel32.GetCurrentProcess(),
+                                                 ctypes.byref(counters), counters.cb)
+        return counters.WorkingSetSize
+    except Exception:
+        return None
+
+def pixmap_cache_bytes():
+    total = 0
+    for cache in IconManager._caches.values():
+        for pixmap in cache.values():
+            total += pixmap.width() * pixmap.height() * pixmap.depth() // 8
+    for pixmap in Bifrost._shadow_pixmaps.values():
+        total += pixmap.width() * pixmap.height() * pixmap.depth() // 8
+    return total
+
+class Soak:
+    def __init__(self, app, seed, n_apps, n_groups):
+        self.app = app
+        self.rng = random.Random(seed)
+        self.n_apps = n_apps
+        self.groups = [f"그룹{i}" for i in range(n_groups)]
+        self._patch_dialogs()
+        self.window = BifrostWindow()
+        self.window.show()
+        self.reset_config()
+
+    def _patch_dialogs(self):
+        # 모달 대화상자는 띄우지 않고 바로 응답 (이 스크립트 안에서만)
+        rng = random.Random(0)
+        QMessageBox.question = staticmethod(lambda *a, **k: QMessageBox.Yes)
+        QInputDialog.getText = staticmethod(lambda *a, **k: (f"그룹{rng.randrange(10 ** 6)}", True))
+        BifrostWindow.run_update_check = lambda self: None # 네트워크 접근 없음
+        from bifrost_dialogs import AppEditDialog
+        def accept_with_new_name(dialog):
+            dialog.name_input.setText(f"앱{rng.randrange(10 ** 6)}")
+            return QDialog.Accepted
+        AppEditDialog.exec = accept_with_new_name
+
+    def synthetic_apps(self):
+        rng = random.Random(1)
+        return [{"name": f"앱{i}", "group": rng.choice(self.groups), "action": f"C:\\Tools\\app{i}.exe"}
+                for i in range(self.n_apps)]
+
+    def reset_config(self):
+        config = self.window.config
+        with config.batch():
+            for i in range(len(config.get_apps()) - 1, -1, -1): config.remove_app(i)
+            for app in self.synthetic_apps(): config.add_app(app)
+            config.set_setting('group_order', list(self.groups))
+            config.set_setting('group_shortcuts', {})
+        self.window.reload_ui()
+        self.settle()
+
+    def settle(self):
+        """유휴 작업(다른 탭 채우기 등), 지연 삭제(deleteLater)와 대기 중인 이벤트를 모두 처리"""
+        Scheduler.drain_ui()
+        for _ in range(3):
+            self.app.processEvents()
+            self.app.sendPostedEvents(None, QEvent.DeferredDelete)
+        gc.collect()
+
+    def measure(self):
+        self.settle()
+        return {
+            # 창 아래 객체와, 창 밖에 따로 떠 있는 최상위 위젯 아래 객체까지 셈
+            'objects': sum(len(top.findChildren(QObject)) + 1 for top in QApplication.topLevelWidgets()),
+            'widgets': len(QApplication.allWidgets()),
+            'pixmap_bytes': pixmap_cache_bytes(),
+            'rss': rss_bytes(),
+        }
+
+    def _random_app(self):
+        apps = self.window.config.get_apps()
+        return self.rng.choice(apps) if apps else None
+
+    def _random_button(self):
+        buttons = [b for b in self.window.stacked_widget.findChildren(AppButton) if b.data.type not in ("folder", "catalog", "shared")]
+        return self.rng.choice(buttons) if buttons else None
+
+    def step(self):
+        w = self.window
+        op = self.rng.choice(('edit', 'copy', 'delete', 'swap', 'move', 'rename_group', 'reload'))
+        n = len(w.config.get_apps())
+        # 앱 수가 처음 크기 근처에 머물도록 복사/삭제를 조정
+        if op == 'copy' and n > self.n_apps * 1.2: op = 'delete'
+        elif op == 'delete' and n < self.n_apps * 0.8: op = 'copy'
+
+        if op == 'edit':
+            app = self._random_app()
+            if app: w.edit_app(app)
+        elif op == 'copy':
+            app = self._random_app()
+            if app: w.copy_app(app)
+        elif op == 'delete':
+            app = self._random_app()
+            if app: w.delete_app(app)
+        elif op == 'swap':
+            target, source = self._random_app(), self._random_button()
+            if target and source: w.swap_apps(target, source)
+        elif op == 'move':
+            source = self._random_button()
+            if source and w.tab_bar.count() > 1: w.on_app_moved_to_tab(source, self.rng.randrange(w.tab_bar.count()))
+        elif op == 'rename_group':
+            if w.tab_bar.count(): w.rename_group(self.rng.randrange(w.tab_bar.count()))
+        else:
+            w.reload_ui()
+        self.app.processEvents()
+        return op
+
+def report(label, m):
+    rss = f"{m['rss'] / 2 ** 20:.1f} MB" if m['rss'] is not None else "n/a"
+    print(f"{label:>8}  QObject {m['objects']:6d}  위젯 {m['widgets']:6d}  "
+          f"픽스맵 {m['pixmap_bytes'] / 1024:9.1f} KB  RSS {rss}")
+
+def run(args):
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    soak = Soak(app, args.seed, args.apps, args.groups)
+
+    print(f"--- Bifrost 소크 테스트 ({args.cycles} 사이클 + 워밍업 {args.warmup}, 앱 {args.apps}개, 그룹 {args.groups}개, seed {args.seed}) ---")
+    # 워밍업: 글꼴/스타일/대화상자 클래스, 할당자 풀처럼 한 번만 늘어나는 것은 기준에 포함
+    for _ in range(args.warmup): soak.step()
+    soak.reset_config()
+    baseline = soak.measure()
+    report("기준", baseline)
+
+    ops = {}
+    start = time.perf_counter()
+    for i in range(1, args.cycles + 1):
+        op = soak.step()
+        ops[op] = ops.get(op, 0) + 1
+        if i % SAMPLE_EVERY == 0:
+            soak.settle()
+            report(str(i), soak.measure())
+    elapsed = time.perf_counter() - start
+
+    # 같은 설정으로 되돌린 뒤 비교 (앱 수/이름 차이로 인한 정상적인 증감 제외)
+    soak.reset_config()
+    final = soak.measure()
+    report("최종", final)
+    print("작업 횟수: " + ", ".join(f"{k} {v}" for k, v in sorted(ops.items())) + f" ({elapsed:.1f}초)")
+
+    failures = []
+    growth = final['objects'] - baseline['objects']
+    if growth > args.max_object_growth:
+        failures.append(f"QObject가 {growth}개 늘었습니다 (허용 {args.max_object_growth})")
+    growth = final['widgets'] - baseline['widgets']
+    if growth > args.max_widget_growth:
+        failures.append(f"위젯이 {growth}개 늘었습니다 (허용 {args.max_widget_growth})")
+    growth_kb = (final['pixmap_bytes'] - baseline['pixmap_bytes']) / 1024
+    if growth_kb > args.max_pixmap_growth_kb:
+        failures.append(f"픽스맵 캐시가 {growth_kb:.1f} KB 늘었습니다 (허용 {args.max_pixmap_growth_kb} KB)")
+    if final['rss'] is not None and baseline['rss'] is not None:
+        growth_mb = (final['rss'] - baseline['rss']) / 2 ** 20
+        if growth_mb > args.max_rss_growth_mb:
+            failures.append(f"RSS가 {growth_mb:.1f} MB 늘었습니다 (허용 {args.max_rss_growth_mb} MB)")
+
+    for failure in failures: print(f"실패: {failure}")
+    if not failures: print("통과")
+    return 1 if failures else 0
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Bifrost 위젯/픽스맵 누수 소크 테스트 (Qt offscreen)")
+    parser.add_argument('--cycles', type=int, default=2000)
+    parser.add_argument('--apps', type=int, default=120)
+    parser.add_argument('--groups', type=int, default=6)
+    parser.add_argument('--seed', type=int, default=1234)
+    parser.add_argument('--warmup', type=int, default=WARMUP_CYCLES)
+    parser.add_argument('--max-object-growth', type=int, default=MAX_OBJECT_GROWTH)
+    parser.add_argument('--max-widget-growth', type=int, default=MAX_WIDGET_GROWTH)
+    parser.add_argument('--max-pixmap-growth-kb', type=float, default=MAX_PIXMAP_GROWTH_KB)
+    parser.add_argument('--max-rss-growth-mb', type=float, default=MAX_RSS_GROWTH_MB)
+    args = parser.parse_args()
+    sys.exit(run(args))